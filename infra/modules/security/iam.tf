@@ -745,6 +745,17 @@ resource "aws_iam_role_policy" "ec2_renderer" {
         ]
         Resource = "arn:aws:secretsmanager:${local.region}:${local.account_id}:secret:${var.youtube_credentials_secret_name}*"
       },
+      # Secrets Manager batch reads at uploader startup; BatchGetSecretValue only
+      # supports Resource "*", and each secret it returns still needs the
+      # GetSecretValue grant above
+      {
+        Sid    = "SecretsManagerBatchGetAccess"
+        Effect = "Allow"
+        Action = [
+          "secretsmanager:BatchGetSecretValue"
+        ]
+        Resource = "*"
+      },
       # Step Functions callback for task completion
       {
         Sid    = "StatesTaskCallbackAccess"
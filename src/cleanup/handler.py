@@ -1,6 +1,5 @@
 """Lambda handler for cleaning up temporary job artifacts from S3."""
 
-from datetime import UTC, datetime
 from typing import Any
 
 from src.common.config import get_settings
@@ -67,51 +66,25 @@ def handler(event: dict, context: Any) -> dict:
         },
     )
 
-    # Step 4: Update job record with cleanup_at field and mark manga as processed
-    try:
-        # Get current job to update it
-        job = db_client.get_job(job_id)
-        if job:
-            # Update the job record with cleanup timestamp
-            cleanup_at = datetime.now(UTC)
-
-            # Update using the DynamoDB client directly
-            db_client._client.update_item(
-                TableName=db_client._table_name,
-                Key={"job_id": {"S": job_id}},
-                UpdateExpression="SET cleanup_at = :cleanup_at, updated_at = :updated_at",
-                ExpressionAttributeValues={
-                    ":cleanup_at": {"S": cleanup_at.isoformat()},
-                    ":updated_at": {"S": cleanup_at.isoformat()},
-                },
+    # Step 4: Update job record with cleanup_at field and mark manga as processed.
+    # Throttling and other transient errors are retried by botocore; anything
+    # else fails the invocation so the state machine can retry it (the S3
+    # deletion above is idempotent).
+    job = db_client.get_job(job_id)
+    if job:
+        db_client.mark_job_cleaned_up(job_id)
+
+        # Step 4b: Mark manga as processed (only after successful pipeline completion)
+        # This prevents re-processing the same manga, but only if the entire pipeline succeeded
+        if job.manga_id and job.manga_title:
+            db_client.mark_manga_processed(
+                manga_id=job.manga_id,
+                title=job.manga_title,
             )
-
-            logger.info(
-                "Job record updated with cleanup timestamp",
-                extra={"job_id": job_id, "cleanup_at": cleanup_at.isoformat()},
-            )
-
-            # Step 4b: Mark manga as processed (only after successful pipeline completion)
-            # This prevents re-processing the same manga, but only if the entire pipeline succeeded
-            if job.manga_id and job.manga_title:
-                db_client.mark_manga_processed(
-                    manga_id=job.manga_id,
-                    title=job.manga_title,
-                )
-                logger.info(
-                    "Manga marked as processed",
-                    extra={"manga_id": job.manga_id, "title": job.manga_title},
-                )
-        else:
-            logger.warning(
-                "Job not found in database, skipping record update",
-                extra={"job_id": job_id},
-            )
-    except Exception as e:
-        # Log error but don't fail the cleanup - cleanup already succeeded
+    else:
         logger.warning(
-            "Failed to update job record or mark manga as processed",
-            extra={"job_id": job_id, "error": str(e)},
+            "Job not found in database, skipping record update",
+            extra={"job_id": job_id},
         )
 
     # Step 5: Return success response
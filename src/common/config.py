@@ -1,9 +1,17 @@
 """Configuration module for manga-video-pipeline."""
 
-from functools import lru_cache
-
+from botocore.config import Config
 from pydantic_settings import BaseSettings
 
+# Shared botocore config: keep pooled connections alive so warm clients
+# skip the TCP/TLS handshake on every call. Adaptive retries back off and
+# rate-limit the client on throttling errors, so callers only see errors
+# that retrying cannot fix.
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -27,7 +35,13 @@ class Settings(BaseSettings):
     model_config = {"env_prefix": "", "case_sensitive": False}
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Get cached application settings."""
-    return Settings()
+    global _settings
+    settings = _settings
+    if settings is None:
+        _settings = settings = Settings()
+    return settings
@@ -6,7 +6,7 @@ import boto3
 from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 
-from src.common.config import Settings
+from src.common.config import BOTO_CONFIG, Settings
 from src.common.logging_config import setup_logger
 from src.common.models import JobRecord, JobStatus, PipelineSettings, utcnow
 
@@ -27,7 +27,9 @@ class DynamoDBClient:
             settings: Application settings containing table names and region.
         """
         self._settings = settings
-        self._dynamodb = boto3.resource("dynamodb", region_name=settings.aws_region)
+        self._dynamodb = boto3.resource(
+            "dynamodb", region_name=settings.aws_region, config=BOTO_CONFIG
+        )
         self._jobs_table = self._dynamodb.Table(settings.dynamodb_jobs_table)
         self._manga_table = self._dynamodb.Table(settings.dynamodb_manga_table)
         self._settings_table = self._dynamodb.Table(settings.dynamodb_settings_table)
@@ -150,6 +152,43 @@ class DynamoDBClient:
             },
         )
 
+    def mark_job_cleaned_up(self, job_id: str) -> bool:
+        """
+        Record that a job's temporary artifacts have been cleaned up.
+
+        Uses a conditional write so a job deleted in the meantime is not
+        recreated as a bare record.
+
+        Args:
+            job_id: The unique job identifier.
+
+        Returns:
+            True if the job was updated, False if it no longer exists.
+        """
+        now = utcnow().isoformat()
+
+        try:
+            self._jobs_table.update_item(
+                Key={"job_id": job_id},
+                UpdateExpression="SET cleanup_at = :cleanup_at, updated_at = :updated_at",
+                ConditionExpression=Attr("job_id").exists(),
+                ExpressionAttributeValues={":cleanup_at": now, ":updated_at": now},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(
+                    "Job no longer exists, skipping cleanup timestamp",
+                    extra={"job_id": job_id},
+                )
+                return False
+            raise
+
+        logger.info(
+            "Job record updated with cleanup timestamp",
+            extra={"job_id": job_id, "cleanup_at": now},
+        )
+        return True
+
     def list_jobs(
         self, status: JobStatus | None = None, limit: int = 20
     ) -> list[JobRecord]:
@@ -1,5 +1,6 @@
 """Structured JSON logging configuration."""
 
+import functools
 import logging
 import re
 import sys
@@ -75,6 +76,14 @@ class CustomJsonFormatter(JsonFormatter):
                 log_record[key] = REDACTED_VALUE
 
 
+@functools.cache
+def _shared_handler_components() -> tuple[
+    CustomJsonFormatter, SensitiveFieldFilter, CorrelationIdFilter
+]:
+    """Build the (stateless) formatter and filters once for every handler."""
+    return CustomJsonFormatter(), SensitiveFieldFilter(), CorrelationIdFilter()
+
+
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
     Set up a logger with JSON formatting.
@@ -98,13 +107,13 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(logging.DEBUG)
 
-    # Set up JSON formatter
-    formatter = CustomJsonFormatter()
+    # JSON formatter and filters are shared across all loggers
+    formatter, sensitive_filter, correlation_filter = _shared_handler_components()
     handler.setFormatter(formatter)
 
     # Add filters
-    handler.addFilter(SensitiveFieldFilter())
-    handler.addFilter(CorrelationIdFilter())
+    handler.addFilter(sensitive_filter)
+    handler.addFilter(correlation_filter)
 
     logger.addHandler(handler)
 
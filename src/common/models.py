@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 def utcnow() -> datetime:
@@ -30,6 +30,15 @@ class MangaInfo(BaseModel):
     genres: list[str]
     cover_url: str | None
     chapters: list[ChapterInfo]
+    # Defaults to len(chapters); set explicitly when chapters aren't materialized
+    chapter_count: int | None = None
+
+    @model_validator(mode="after")
+    def _default_chapter_count(self) -> "MangaInfo":
+        """Derive chapter_count from chapters when not given."""
+        if self.chapter_count is None:
+            self.chapter_count = len(self.chapters)
+        return self
 
 
 class JobType(StrEnum):
@@ -1,10 +1,10 @@
 """Secrets Manager helper for loading API keys and credentials."""
 
-import json
 import time
 from typing import Any
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError
 
 from src.common.logging_config import setup_logger
@@ -14,6 +14,9 @@ logger = setup_logger(__name__)
 # Default cache TTL in seconds (5 minutes)
 DEFAULT_CACHE_TTL = 300
 
+# BatchGetSecretValue accepts at most 20 secret IDs per request
+BATCH_GET_MAX_SECRETS = 20
+
 
 class SecretNotFoundError(Exception):
     """Raised when a secret is not found."""
@@ -74,10 +77,12 @@ class SecretsClient:
         Clear the secret cache.
 
         Args:
-            secret_name: Specific secret to clear, or None to clear all.
+            secret_name: Specific secret to clear (raw and parsed JSON
+                entries), or None to clear all.
         """
         if secret_name:
             self._cache.pop(secret_name, None)
+            self._cache.pop(f"{secret_name}:json", None)
             logger.debug("Cache cleared for secret", extra={"secret_name": secret_name})
         else:
             self._cache.clear()
@@ -143,7 +148,8 @@ class SecretsClient:
 
         Raises:
             SecretNotFoundError: If the secret doesn't exist.
-            json.JSONDecodeError: If the secret is not valid JSON.
+            orjson.JSONDecodeError: If the secret is not valid JSON (a json.JSONDecodeError
+                subclass).
         """
         # Check cache for parsed JSON
         cache_key = f"{secret_name}:json"
@@ -152,7 +158,7 @@ class SecretsClient:
             return cached
 
         secret_string = self.get_secret_string(secret_name)
-        parsed = json.loads(secret_string)
+        parsed = orjson.loads(secret_string)
 
         # Cache the parsed JSON separately
         self._set_cache(cache_key, parsed)
@@ -163,6 +169,80 @@ class SecretsClient:
         )
         return parsed
 
+    def batch_get_secret_json(self, secret_names: list[str]) -> dict[str, dict]:
+        """
+        Retrieve several secrets with BatchGetSecretValue and parse them as JSON.
+
+        Cached secrets are served from the cache. The rest are fetched in
+        batches of up to BATCH_GET_MAX_SECRETS and cached individually, so
+        later get_secret_json calls for them hit the cache. Secrets the batch
+        call reports errors for are retried one by one with get_secret_json,
+        which raises the usual errors.
+
+        Args:
+            secret_names: Names or ARNs of the secrets.
+
+        Returns:
+            Mapping of each requested name to its parsed secret.
+
+        Raises:
+            SecretNotFoundError: If a secret doesn't exist.
+            orjson.JSONDecodeError: If a secret is not valid JSON.
+        """
+        results: dict[str, dict] = {}
+        to_fetch: list[str] = []
+        for secret_name in dict.fromkeys(secret_names):
+            cached = self._get_from_cache(f"{secret_name}:json")
+            if cached is not None:
+                results[secret_name] = cached
+            else:
+                to_fetch.append(secret_name)
+
+        for start in range(0, len(to_fetch), BATCH_GET_MAX_SECRETS):
+            batch = to_fetch[start : start + BATCH_GET_MAX_SECRETS]
+
+            logger.info(
+                "Retrieving secrets from Secrets Manager in batch",
+                extra={"secret_names": batch},
+            )
+
+            try:
+                response = self._client.batch_get_secret_value(SecretIdList=batch)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                logger.error(
+                    "Error retrieving secrets in batch",
+                    extra={"secret_names": batch, "error_code": error_code},
+                )
+                raise
+
+            for secret_value in response.get("SecretValues", []):
+                # Map the response back to the ID the caller asked for
+                secret_name = (
+                    secret_value["Name"] if secret_value["Name"] in batch else secret_value["ARN"]
+                )
+                secret_string = secret_value.get("SecretString", "")
+                parsed = orjson.loads(secret_string)
+
+                self._set_cache(secret_name, secret_string)
+                self._set_cache(f"{secret_name}:json", parsed)
+                results[secret_name] = parsed
+
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Secret not returned by batch request, retrying individually",
+                    extra={
+                        "secret_name": error.get("SecretId"),
+                        "error_code": error.get("ErrorCode"),
+                    },
+                )
+
+        for secret_name in to_fetch:
+            if secret_name not in results:
+                results[secret_name] = self.get_secret_json(secret_name)
+
+        return results
+
     def get_deepinfra_api_key(self, secret_name: str) -> str:
         """
         Retrieve the DeepInfra API key.
@@ -201,7 +281,8 @@ class SecretsClient:
             secret_name: Name of the secret containing OAuth tokens.
 
         Returns:
-            Dictionary with client_id, client_secret, refresh_token, access_token.
+            Dictionary with client_id, client_secret, refresh_token, access_token,
+            and token_expiry (ISO timestamp of the stored access token, if known).
         """
         logger.info(
             "Retrieving YouTube OAuth tokens",
@@ -215,6 +296,7 @@ class SecretsClient:
             "client_secret": secret_data.get("client_secret", ""),
             "refresh_token": secret_data.get("refresh_token", ""),
             "access_token": secret_data.get("access_token", ""),
+            "token_expiry": secret_data.get("token_expiry", ""),
         }
 
     def update_secret_json(self, secret_name: str, data: dict) -> None:
@@ -230,7 +312,7 @@ class SecretsClient:
             extra={"secret_name": secret_name},
         )
 
-        secret_string = json.dumps(data)
+        secret_string = orjson.dumps(data).decode()
 
         try:
             self._client.put_secret_value(
@@ -247,7 +329,6 @@ class SecretsClient:
 
         # Clear cache for this secret
         self.clear_cache(secret_name)
-        self.clear_cache(f"{secret_name}:json")
 
         logger.info(
             "Secret updated successfully",
@@ -1,15 +1,23 @@
 """S3 client wrapper for file operations."""
 
 import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
 
-from src.common.config import Settings
+from src.common.config import BOTO_CONFIG, Settings
 from src.common.logging_config import setup_logger
 
 logger = setup_logger(__name__)
 
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Concurrent DeleteObjects calls while a prefix is still being listed
+DELETE_PREFIX_WORKERS = 4
+
 
 class S3Client:
     """Client wrapper for S3 file operations."""
@@ -23,7 +31,7 @@ class S3Client:
         """
         self._settings = settings
         self._bucket = settings.s3_bucket
-        self._client = boto3.client("s3", region_name=settings.aws_region)
+        self._client = boto3.client("s3", region_name=settings.aws_region, config=BOTO_CONFIG)
 
         logger.info(
             "S3 client initialized",
@@ -185,32 +193,91 @@ class S3Client:
         )
         return parsed
 
-    def delete_prefix(self, prefix: str) -> int:
+    def _delete_keys(self, keys: list[str]) -> set[str]:
         """
-        Delete all objects under a prefix.
+        Delete keys with the DeleteObjects batch API.
+
+        Keys are sent in batches of up to DELETE_OBJECTS_MAX_KEYS in quiet
+        mode, so responses only list the keys that failed.
 
         Args:
-            prefix: S3 key prefix to delete.
+            keys: S3 keys to delete.
 
         Returns:
-            Number of objects deleted.
+            Keys that S3 failed to delete.
         """
-        deleted_count = 0
+        failed_keys: set[str] = set()
+        for start in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS):
+            batch = keys[start : start + DELETE_OBJECTS_MAX_KEYS]
+            response = self._client.delete_objects(
+                Bucket=self._bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Failed to delete S3 object",
+                    extra={
+                        "s3_key": error.get("Key"),
+                        "error_code": error.get("Code"),
+                        "operation": "delete_objects",
+                    },
+                )
+                failed_keys.add(error.get("Key"))
+        return failed_keys
+
+    def _iter_prefix_pages(self, prefix: str) -> Iterator[list[dict]]:
+        """Yield non-empty list_objects_v2 Contents pages under a prefix."""
         paginator = self._client.get_paginator("list_objects_v2")
-
-        for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+        for page in paginator.paginate(
+            Bucket=self._bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": DELETE_OBJECTS_MAX_KEYS},
+        ):
             contents = page.get("Contents", [])
-            if not contents:
-                continue
+            if contents:
+                yield contents
 
-            # Delete in batches of up to 1000 (S3 limit)
-            objects_to_delete = [{"Key": obj["Key"]} for obj in contents]
+    def _delete_prefix_pages(self, prefix: str, max_workers: int) -> tuple[int, int]:
+        """
+        Delete every object under a prefix, overlapping listing and deletion.
 
-            self._client.delete_objects(
-                Bucket=self._bucket,
-                Delete={"Objects": objects_to_delete},
-            )
-            deleted_count += len(objects_to_delete)
+        Each listing page is handed to a worker pool as soon as it arrives,
+        so DeleteObjects calls run while the paginator fetches the next page.
+
+        Args:
+            prefix: S3 key prefix to delete.
+            max_workers: Maximum number of concurrent DeleteObjects calls.
+
+        Returns:
+            Tuple of (objects_deleted, bytes_freed).
+        """
+
+        def delete_page(contents: list[dict]) -> tuple[int, int]:
+            failed_keys = self._delete_keys([obj["Key"] for obj in contents])
+            deleted = [obj for obj in contents if obj["Key"] not in failed_keys]
+            return len(deleted), sum(obj.get("Size", 0) for obj in deleted)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(delete_page, contents)
+                for contents in self._iter_prefix_pages(prefix)
+            ]
+            results = [future.result() for future in futures]
+
+        return sum(count for count, _ in results), sum(size for _, size in results)
+
+    def delete_prefix(self, prefix: str, max_workers: int = DELETE_PREFIX_WORKERS) -> int:
+        """
+        Delete all objects under a prefix.
+
+        Args:
+            prefix: S3 key prefix to delete.
+            max_workers: Maximum number of concurrent DeleteObjects calls.
+
+        Returns:
+            Number of objects deleted.
+        """
+        deleted_count, _ = self._delete_prefix_pages(prefix, max_workers)
 
         logger.info(
             "Objects deleted from S3",
@@ -218,37 +285,22 @@ class S3Client:
         )
         return deleted_count
 
-    def delete_prefix_with_metrics(self, prefix: str) -> tuple[int, int]:
+    def delete_prefix_with_metrics(
+        self, prefix: str, max_workers: int = DELETE_PREFIX_WORKERS
+    ) -> tuple[int, int]:
         """
         Delete all objects under a prefix and return metrics.
 
+        Sizes come from the listing itself, so no HEAD requests are needed.
+
         Args:
             prefix: S3 key prefix to delete.
+            max_workers: Maximum number of concurrent DeleteObjects calls.
 
         Returns:
             Tuple of (objects_deleted, bytes_freed).
         """
-        deleted_count = 0
-        bytes_freed = 0
-        paginator = self._client.get_paginator("list_objects_v2")
-
-        for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
-            contents = page.get("Contents", [])
-            if not contents:
-                continue
-
-            # Track sizes before deletion
-            for obj in contents:
-                bytes_freed += obj.get("Size", 0)
-
-            # Delete in batches of up to 1000 (S3 limit)
-            objects_to_delete = [{"Key": obj["Key"]} for obj in contents]
-
-            self._client.delete_objects(
-                Bucket=self._bucket,
-                Delete={"Objects": objects_to_delete},
-            )
-            deleted_count += len(objects_to_delete)
+        deleted_count, bytes_freed = self._delete_prefix_pages(prefix, max_workers)
 
         logger.info(
             "Objects deleted from S3 with metrics",
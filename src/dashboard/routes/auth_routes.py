@@ -3,11 +3,11 @@
 import os
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 from src.common.logging_config import setup_logger
-from src.common.secrets import SecretsClient, SecretNotFoundError
+from src.common.secrets import SecretNotFoundError, SecretsClient
 from src.dashboard.auth import (
     clear_auth_cookie,
     create_access_token,
@@ -1,7 +1,5 @@
 """Processed manga routes for admin dashboard."""
 
-from typing import Any
-
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
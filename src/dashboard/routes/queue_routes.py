@@ -1,7 +1,6 @@
 """Queue management routes for admin dashboard."""
 
 import json
-from typing import Literal
 
 import boto3
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, status
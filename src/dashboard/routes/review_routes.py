@@ -18,7 +18,6 @@ from src.dashboard.auth import get_current_user
 from src.review_fetcher.scraper_factory import (
     detect_source_from_url,
     get_all_scrapers,
-    get_scraper_for_url,
     is_supported_url,
 )
 
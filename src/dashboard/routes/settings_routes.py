@@ -1,11 +1,10 @@
 """Settings routes for admin dashboard."""
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
-from src.common.config import get_settings
 from src.common.db import DynamoDBClient
 from src.common.logging_config import setup_logger
 from src.common.models import PipelineSettings
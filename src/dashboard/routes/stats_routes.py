@@ -1,8 +1,7 @@
 """Statistics and dashboard home routes."""
 
 import uuid
-from datetime import datetime, timedelta
-from typing import Any
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import boto3
@@ -1,8 +1,11 @@
 """Audio merger for concatenating TTS segments."""
 
+import logging
 import os
+import shutil
 import subprocess
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from pydub import AudioSegment
 
@@ -12,6 +15,10 @@ from src.common.storage import S3Client
 
 logger = setup_logger(__name__)
 
+# Formats pydub exports; anything else is written as MP3
+PYDUB_EXPORT_FORMATS = ("mp3", "wav")
+MP3_EXPORT_BITRATE = "192k"
+
 
 class AudioMerger:
     """Merger for concatenating audio segments into a single file."""
@@ -24,16 +31,30 @@ class AudioMerger:
         self,
         audio_paths: list[str],
         output_path: str,
-        use_ffmpeg: bool = False,
+        force_pydub: bool = False,
+        expected_duration: float | None = None,
+        verify: bool = False,
     ) -> float:
         """
         Merge multiple audio files into a single file.
 
+        Inputs in the same format as the output are joined with FFmpeg's
+        concat demuxer, which copies the streams without decoding them.
+        Otherwise (e.g. MP3 segments merged into a WAV file) the audio is
+        re-encoded with pydub. A single input has nothing to join and is
+        copied or converted directly.
+
         Args:
-            audio_paths: List of paths to audio files (in order).
+            audio_paths: List of paths to audio files (in order). Files
+                merged with FFmpeg may also be http(s) URLs.
             output_path: Path where merged audio will be saved.
-            use_ffmpeg: If True, use FFmpeg for memory-efficient concatenation.
-                       Recommended for long audio files (> 1 hour).
+            force_pydub: If True, merge with pydub even when the inputs
+                could be stream-copied.
+            expected_duration: Known total duration of the inputs in seconds.
+                A stream copy keeps the duration unchanged, so FFmpeg merges
+                return this instead of probing the output.
+            verify: If True, probe the FFmpeg output with ffprobe even when
+                expected_duration is given.
 
         Returns:
             Total duration of merged audio in seconds.
@@ -41,6 +62,19 @@ class AudioMerger:
         if not audio_paths:
             raise ValueError("No audio files provided for merging")
 
+        if (
+            len(audio_paths) == 1
+            and not force_pydub
+            and Path(output_path).suffix[1:].lower() in PYDUB_EXPORT_FORMATS
+        ):
+            return self._convert_single_file(
+                audio_paths[0],
+                output_path,
+                expected_duration=None if verify else expected_duration,
+            )
+
+        use_ffmpeg = not force_pydub and self._can_stream_copy(audio_paths, output_path)
+
         logger.info(
             "Starting audio merge",
             extra={
@@ -51,10 +85,88 @@ class AudioMerger:
         )
 
         if use_ffmpeg:
-            return self._merge_with_ffmpeg(audio_paths, output_path)
+            return self._merge_with_ffmpeg(
+                audio_paths,
+                output_path,
+                expected_duration=None if verify else expected_duration,
+            )
         else:
             return self._merge_with_pydub(audio_paths, output_path)
 
+    @staticmethod
+    def _can_stream_copy(audio_paths: list[str], output_path: str) -> bool:
+        """
+        Check whether every input shares the output's container format.
+
+        Args:
+            audio_paths: List of paths or URLs of audio files.
+            output_path: Path where merged audio will be saved.
+
+        Returns:
+            True if FFmpeg can concatenate the inputs without re-encoding.
+        """
+        output_suffix = Path(output_path).suffix.lower()
+        # urlsplit drops the query string of presigned URLs (and is a no-op
+        # for plain paths)
+        return bool(output_suffix) and all(
+            Path(urlsplit(audio_path).path).suffix.lower() == output_suffix
+            for audio_path in audio_paths
+        )
+
+    def _convert_single_file(
+        self,
+        audio_path: str,
+        output_path: str,
+        expected_duration: float | None = None,
+    ) -> float:
+        """
+        Write a single audio file to the output path without pydub.
+
+        A local file already in the output format is copied byte for byte.
+        Anything else goes through one FFmpeg call: a stream copy for a URL in
+        the output format, or a conversion by the output's muxer (e.g. MP3 to
+        WAV).
+
+        Args:
+            audio_path: Path or http(s) URL of the audio file.
+            output_path: Path where the audio will be saved.
+            expected_duration: Duration to return instead of running ffprobe
+                on the output.
+
+        Returns:
+            Duration in seconds.
+        """
+        is_url = urlsplit(audio_path).scheme in ("http", "https")
+        same_format = self._can_stream_copy([audio_path], output_path)
+
+        if same_format and not is_url:
+            logger.info("Copying single audio file")
+            shutil.copyfile(audio_path, output_path)
+        else:
+            logger.info("Converting single audio file with FFmpeg")
+            command = ["ffmpeg", "-y", "-i", audio_path]
+            if same_format:
+                command += ["-c", "copy"]
+            command.append(output_path)
+            subprocess.run(command, check=True, capture_output=True)
+
+        if expected_duration is not None:
+            duration_seconds = expected_duration
+        else:
+            duration_seconds = self._probe_duration(output_path)
+
+        logger.info(
+            "Audio merge complete (single file)",
+            extra={
+                "num_segments": 1,
+                "duration_seconds": round(duration_seconds, 2),
+                "file_size_mb": self._file_size_mb(output_path),
+                "output_path": output_path,
+            },
+        )
+
+        return duration_seconds
+
     def _merge_with_pydub(
         self,
         audio_paths: list[str],
@@ -72,13 +184,33 @@ class AudioMerger:
         """
         logger.info("Merging audio with pydub")
 
-        # Load first audio file
-        combined = AudioSegment.from_mp3(audio_paths[0])
+        # Append raw samples to one buffer and build the combined segment once
+        # at the end; `combined += audio` would copy the growing buffer for
+        # every segment, and joining a list of parts would hold every sample
+        # twice. pydub keeps the buffer as is, without copying it again.
+        # The format is taken from the file extension, so mixed inputs work.
+        first = AudioSegment.from_file(audio_paths[0])
+        sample_width = first.sample_width
+        frame_rate = first.frame_rate
+        channels = first.channels
+        raw_data = bytearray(first.raw_data)
+        del first
 
-        # Concatenate remaining files
         for i, audio_path in enumerate(audio_paths[1:], start=1):
-            audio = AudioSegment.from_mp3(audio_path)
-            combined += audio
+            audio = AudioSegment.from_file(audio_path)
+
+            # Convert to the first segment's sample format so the raw data lines up
+            if (audio.sample_width, audio.frame_rate, audio.channels) != (
+                sample_width,
+                frame_rate,
+                channels,
+            ):
+                audio = (
+                    audio.set_sample_width(sample_width)
+                    .set_frame_rate(frame_rate)
+                    .set_channels(channels)
+                )
+            raw_data += audio.raw_data
 
             if (i + 1) % 10 == 0:
                 logger.info(
@@ -86,6 +218,13 @@ class AudioMerger:
                     extra={"progress_pct": int((i + 1) / len(audio_paths) * 100)},
                 )
 
+        combined = AudioSegment(
+            data=raw_data,
+            sample_width=sample_width,
+            frame_rate=frame_rate,
+            channels=channels,
+        )
+
         # Calculate duration in seconds
         duration_seconds = len(combined) / 1000.0
 
@@ -94,23 +233,21 @@ class AudioMerger:
 
         # Determine format from output path
         output_format = Path(output_path).suffix[1:]  # Remove leading dot
-        if output_format not in ["mp3", "wav"]:
+        if output_format not in PYDUB_EXPORT_FORMATS:
             output_format = "mp3"
 
         combined.export(
             output_path,
             format=output_format,
-            bitrate="192k" if output_format == "mp3" else None,
+            bitrate=MP3_EXPORT_BITRATE if output_format == "mp3" else None,
         )
 
-        file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
-
         logger.info(
             "Audio merge complete",
             extra={
                 "num_segments": len(audio_paths),
                 "duration_seconds": round(duration_seconds, 2),
-                "file_size_mb": round(file_size_mb, 2),
+                "file_size_mb": self._file_size_mb(output_path),
                 "output_path": output_path,
             },
         )
@@ -121,6 +258,7 @@ class AudioMerger:
         self,
         audio_paths: list[str],
         output_path: str,
+        expected_duration: float | None = None,
     ) -> float:
         """
         Merge audio files using FFmpeg (streaming, memory-efficient).
@@ -128,6 +266,8 @@ class AudioMerger:
         Args:
             audio_paths: List of paths to audio files.
             output_path: Path where merged audio will be saved.
+            expected_duration: Duration to return instead of running ffprobe
+                on the output.
 
         Returns:
             Total duration in seconds.
@@ -138,14 +278,22 @@ class AudioMerger:
         concat_file = output_path + ".concat.txt"
         with open(concat_file, "w") as f:
             for audio_path in audio_paths:
-                # FFmpeg concat format
-                f.write(f"file '{audio_path}'\n")
+                # FFmpeg concat format; a quote inside the quoted path is
+                # written as '\''
+                escaped_path = audio_path.replace("'", "'\\''")
+                f.write(f"file '{escaped_path}'\n")
 
         try:
             # Concatenate using FFmpeg
             subprocess.run(
                 [
                     "ffmpeg",
+                    # Overwrite a merged file left by an interrupted run
+                    # instead of waiting on the overwrite prompt
+                    "-y",
+                    # Allow concat entries that are presigned S3 URLs
+                    "-protocol_whitelist",
+                    "file,http,https,tcp,tls,crypto",
                     "-f",
                     "concat",
                     "-safe",
@@ -160,32 +308,17 @@ class AudioMerger:
                 capture_output=True,
             )
 
-            # Get duration using ffprobe
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-show_entries",
-                    "format=duration",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    output_path,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            duration_seconds = float(result.stdout.strip())
-
-            file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+            if expected_duration is not None:
+                duration_seconds = expected_duration
+            else:
+                duration_seconds = self._probe_duration(output_path)
 
             logger.info(
                 "Audio merge complete (FFmpeg)",
                 extra={
                     "num_segments": len(audio_paths),
                     "duration_seconds": round(duration_seconds, 2),
-                    "file_size_mb": round(file_size_mb, 2),
+                    "file_size_mb": self._file_size_mb(output_path),
                     "output_path": output_path,
                 },
             )
@@ -199,6 +332,56 @@ class AudioMerger:
             except Exception:
                 pass
 
+    @staticmethod
+    def _file_size_mb(path: str) -> float | None:
+        """
+        Size of a file in MB for log output.
+
+        The file is only stat'ed when INFO logging is enabled, since the size
+        is purely informational.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            Size in MB rounded to 2 places, or None if not logged or the
+            file does not exist.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return None
+        try:
+            return round(os.path.getsize(path) / (1024 * 1024), 2)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _probe_duration(audio_path: str) -> float:
+        """
+        Read the duration of an audio file with ffprobe.
+
+        Args:
+            audio_path: Path to the audio file.
+
+        Returns:
+            Duration in seconds.
+        """
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                audio_path,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return float(result.stdout.strip())
+
     def merge_from_s3(
         self,
         audio_manifest: AudioManifest,
@@ -207,13 +390,17 @@ class AudioMerger:
         local_dir: str,
     ) -> tuple[str, float]:
         """
-        Download audio segments from S3 and merge them.
+        Merge audio segments straight from S3.
+
+        FFmpeg reads each segment over HTTPS from a presigned URL, so the
+        segments are never written to local disk; only the merged file is.
+        A merged file already in local_dir from an earlier attempt is reused.
 
         Args:
             audio_manifest: Audio manifest with segment information.
-            s3_client: S3 client for downloading files.
+            s3_client: S3 client for presigning segment URLs.
             job_id: Job ID for naming output file.
-            local_dir: Local directory for downloading and storing files.
+            local_dir: Local directory for storing the merged file.
 
         Returns:
             Tuple of (merged_file_path, total_duration_seconds).
@@ -230,57 +417,31 @@ class AudioMerger:
         # Create local directory if it doesn't exist
         os.makedirs(local_dir, exist_ok=True)
 
-        # Download all audio segments
-        audio_paths = []
-        for idx, segment in enumerate(audio_manifest.segments):
-            local_path = os.path.join(
-                local_dir, f"segment_{segment.index:04d}.mp3"
-            )
+        output_path = os.path.join(local_dir, f"{job_id}_merged.mp3")
 
-            logger.debug(
-                f"Downloading segment {idx + 1}/{len(audio_manifest.segments)}",
-                extra={
-                    "segment_index": segment.index,
-                    "s3_key": segment.s3_key,
-                },
+        # The merged file is only moved into place once complete, so one left
+        # by an earlier attempt (e.g. a retried render) can be reused as is
+        if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+            logger.info(
+                "Reusing merged audio from a previous attempt",
+                extra={"job_id": job_id, "output_path": output_path},
             )
+            return output_path, audio_manifest.total_duration_seconds
 
-            s3_client.download_file(segment.s3_key, local_path)
-            audio_paths.append(local_path)
-
-            if (idx + 1) % 10 == 0:
-                logger.info(
-                    f"Downloaded {idx + 1}/{len(audio_manifest.segments)} segments",
-                    extra={"progress_pct": int((idx + 1) / len(audio_manifest.segments) * 100)},
-                )
-
-        logger.info("All segments downloaded, starting merge")
-
-        # Merge audio files
-        output_path = os.path.join(local_dir, f"{job_id}_merged.mp3")
-
-        # Use FFmpeg for large files (> 1 hour or > 100 segments)
-        use_ffmpeg = (
-            audio_manifest.total_duration_seconds > 3600
-            or len(audio_manifest.segments) > 100
-        )
+        # Presigning is a local signature computation, not a request to S3
+        segment_urls = [
+            s3_client.get_presigned_url(segment.s3_key) for segment in audio_manifest.segments
+        ]
 
+        # Segments and output are all MP3, so this is a stream copy and the
+        # merged duration is the manifest total (no ffprobe needed)
+        partial_path = os.path.join(local_dir, f"{job_id}_merged.part.mp3")
         duration = self.merge_audio_files(
-            audio_paths=audio_paths,
-            output_path=output_path,
-            use_ffmpeg=use_ffmpeg,
+            audio_paths=segment_urls,
+            output_path=partial_path,
+            expected_duration=audio_manifest.total_duration_seconds,
         )
-
-        # Clean up individual segment files
-        logger.info("Cleaning up downloaded segments")
-        for audio_path in audio_paths:
-            try:
-                os.unlink(audio_path)
-            except Exception as e:
-                logger.warning(
-                    "Failed to delete segment file",
-                    extra={"file": audio_path, "error": str(e)},
-                )
+        os.replace(partial_path, output_path)
 
         logger.info(
             "Audio merge from S3 complete",
@@ -1,23 +1,116 @@
-"""Video compositor for rendering final videos using MoviePy."""
+"""Video compositor for rendering final videos using MoviePy and FFmpeg."""
 
+import contextlib
+import math
 import os
 import subprocess
 import tempfile
-from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO
 
+import numpy as np
 from moviepy import (
-    AudioFileClip,
     CompositeVideoClip,
     ImageClip,
-    concatenate_videoclips,
 )
-from PIL import Image
+from PIL import Image, ImageOps
 
 from src.common.logging_config import setup_logger
 from src.renderer.scene_builder import Scene
 
 logger = setup_logger(__name__)
 
+# Panel decode/resize runs in Pillow's C code and releases the GIL
+PANEL_CLIP_WORKERS = 8
+
+# H.264 encoders in order of preference, with the preset passed to each.
+# Hardware encoders (NVIDIA NVENC, Intel Quick Sync) are used when the host
+# has one; libx264 is the software fallback.
+H264_ENCODER_PRESETS = {
+    "h264_nvenc": "p4",
+    "h264_qsv": "medium",
+    "libx264": "medium",
+}
+
+# Audio formats MP4 can carry as they are; anything else is encoded to AAC
+MP4_COPY_AUDIO_SUFFIXES = (".mp3", ".m4a", ".aac")
+
+# Panels shrunk by more than twice this ratio are first reduced by an integer
+# factor, leaving LANCZOS only the last 2x of the downscale
+PANEL_REDUCING_GAP = 2.0
+
+
+@lru_cache(maxsize=1)
+def detect_h264_encoder() -> str:
+    """
+    Pick the fastest H.264 encoder that works on this host.
+
+    An encoder being compiled into FFmpeg does not mean the hardware is
+    present, so each hardware encoder is tried on a short synthetic clip.
+
+    Returns:
+        Name of the FFmpeg encoder to use.
+    """
+    for encoder in H264_ENCODER_PRESETS:
+        if encoder == "libx264":
+            break
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=size=256x256:duration=0.1",
+                    "-c:v",
+                    encoder,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                check=True,
+                capture_output=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+
+        logger.info("Using hardware H.264 encoder", extra={"encoder": encoder})
+        return encoder
+
+    return "libx264"
+
+
+def _iter_panel_runs(scenes: Iterable[Scene]) -> Iterator[tuple[str, float]]:
+    """
+    Merge consecutive scenes that show the same panel.
+
+    A panel repeated across adjacent scenes only needs to be decoded and
+    encoded once, shown for the scenes' combined duration.
+
+    Args:
+        scenes: Scenes in playback order.
+
+    Yields:
+        (panel_s3_key, duration) tuples in playback order.
+    """
+    current_key: str | None = None
+    current_duration = 0.0
+    for scene in scenes:
+        duration = scene.end_time - scene.start_time
+        if scene.panel_s3_key == current_key:
+            current_duration += duration
+            continue
+        if current_key is not None:
+            yield current_key, current_duration
+        current_key, current_duration = scene.panel_s3_key, duration
+    if current_key is not None:
+        yield current_key, current_duration
+
 
 class VideoCompositor:
     """Compositor for rendering videos from manga panels and audio."""
@@ -26,6 +119,7 @@ class VideoCompositor:
         self,
         resolution: tuple[int, int] = (1920, 1080),
         fps: int = 24,
+        video_codec: str | None = None,
     ) -> None:
         """
         Initialize the video compositor.
@@ -33,92 +127,117 @@ class VideoCompositor:
         Args:
             resolution: Video resolution as (width, height). Default: 1080p.
             fps: Frames per second. Default: 24.
+            video_codec: FFmpeg H.264 encoder. Default: detected from the host.
         """
         self.resolution = resolution
         self.fps = fps
+        self.video_codec = video_codec or detect_h264_encoder()
+        self.video_preset = H264_ENCODER_PRESETS.get(self.video_codec, "medium")
 
         logger.info(
             "VideoCompositor initialized",
             extra={
                 "resolution": f"{resolution[0]}x{resolution[1]}",
                 "fps": fps,
+                "video_codec": self.video_codec,
             },
         )
 
-    def create_panel_clip(
-        self,
-        image_path: str,
-        duration: float,
-    ) -> ImageClip:
+    def _reduce_for_resolution(self, img: Image.Image) -> Image.Image:
         """
-        Create a video clip from a panel image.
+        Shrink an image larger than the frame before resampling.
 
-        Loads the image, resizes to fit resolution (maintaining aspect ratio),
-        and pads with black bars if necessary.
+        JPEGs are decoded at the smallest DCT scale (1/2, 1/4 or 1/8) that
+        still covers the size the image will be fitted to; the DCT scaling
+        filters as it decodes. Images still more than 2 * PANEL_REDUCING_GAP
+        times that size are then box reduced by an integer factor, so the
+        final LANCZOS pass only covers the last step.
 
         Args:
-            image_path: Path to the panel image.
-            duration: Duration of the clip in seconds.
+            img: Opened image, not yet loaded.
 
         Returns:
-            MoviePy ImageClip with the specified duration.
+            The reduced image, or img itself if no reduction applies.
         """
-        # Load image with Pillow
-        img = Image.open(image_path)
-        original_width, original_height = img.size
-
         target_width, target_height = self.resolution
 
-        # Calculate scaling to fit within resolution while maintaining aspect ratio
-        width_ratio = target_width / original_width
-        height_ratio = target_height / original_height
-        scale_ratio = min(width_ratio, height_ratio)
+        def shrink() -> float:
+            return max(img.width / target_width, img.height / target_height)
 
-        new_width = int(original_width * scale_ratio)
-        new_height = int(original_height * scale_ratio)
+        if shrink() > 1:
+            # No-op for formats other than JPEG
+            fitted_size = (
+                math.ceil(img.width / shrink()),
+                math.ceil(img.height / shrink()),
+            )
+            img.draft("RGB", fitted_size)
 
-        # Resize image
-        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        factor = int(shrink() / PANEL_REDUCING_GAP)
+        if factor > 1:
+            img = img.reduce(factor)
 
-        # Create black background
-        background = Image.new("RGB", (target_width, target_height), (0, 0, 0))
+        return img
 
-        # Paste resized image centered on background
-        x_offset = (target_width - new_width) // 2
-        y_offset = (target_height - new_height) // 2
-        background.paste(img_resized, (x_offset, y_offset))
+    def load_panel_frame(self, image_path: str) -> np.ndarray:
+        """
+        Load a panel image as a video frame.
 
-        # Save to temporary file for MoviePy
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=".jpg",
-            delete=False,
-        )
-        temp_path = temp_file.name
-        temp_file.close()
+        Loads the image, resizes to fit resolution (maintaining aspect ratio),
+        and pads with black bars if necessary.
 
-        background.save(temp_path, quality=95)
+        Args:
+            image_path: Path to the panel image.
 
-        # Create MoviePy ImageClip
-        clip = ImageClip(temp_path, duration=duration)
+        Returns:
+            RGB frame as a (height, width, 3) uint8 array.
+        """
+        # Load image with Pillow
+        with Image.open(image_path) as img:
+            original_width, original_height = img.size
+
+            # Cheap integer downscale of large pages before the LANCZOS pass
+            img = self._reduce_for_resolution(img)
+
+            # convert() copies even when the mode already matches
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+
+            # Resize to fit within resolution while maintaining aspect ratio
+            # and center on black bars, in a single Pillow call
+            background = ImageOps.pad(
+                img,
+                self.resolution,
+                method=Image.Resampling.LANCZOS,
+                color=(0, 0, 0),
+            )
 
         logger.debug(
-            "Panel clip created",
+            "Panel frame loaded",
             extra={
                 "image_path": image_path,
                 "original_size": f"{original_width}x{original_height}",
-                "resized_size": f"{new_width}x{new_height}",
-                "duration": duration,
+                "padded_size": f"{self.resolution[0]}x{self.resolution[1]}",
             },
         )
 
-        # Clean up temp file after clip is created
-        # Note: MoviePy loads the image, so we can delete the temp file
-        try:
-            os.unlink(temp_path)
-        except Exception:
-            pass
+        return np.asarray(background)
 
-        return clip
+    def create_panel_clip(
+        self,
+        image_path: str,
+        duration: float,
+    ) -> ImageClip:
+        """
+        Create a video clip from a panel image.
+
+        Args:
+            image_path: Path to the panel image.
+            duration: Duration of the clip in seconds.
+
+        Returns:
+            MoviePy ImageClip with the specified duration.
+        """
+        return ImageClip(self.load_panel_frame(image_path), duration=duration)
 
     def add_transition(
         self,
@@ -129,6 +248,9 @@ class VideoCompositor:
         """
         Add a cross-dissolve transition between two clips.
 
+        Not used by the compose methods: the composite is re-rendered in
+        Python for every frame, which is too slow for full-length videos.
+
         Args:
             clip1: First clip (will fade out).
             clip2: Second clip (will fade in).
@@ -156,6 +278,40 @@ class VideoCompositor:
 
         return composite
 
+    @staticmethod
+    def _audio_codec_args(audio_path: str) -> list[str]:
+        """
+        Build the FFmpeg audio codec arguments for muxing into MP4.
+
+        MP3 and AAC audio is copied into the container as it is, skipping a
+        decode and re-encode pass.
+
+        Args:
+            audio_path: Path to the audio file.
+
+        Returns:
+            FFmpeg arguments selecting the audio codec.
+        """
+        if os.path.splitext(audio_path)[1].lower() in MP4_COPY_AUDIO_SUFFIXES:
+            return ["-c:a", "copy"]
+        return ["-c:a", "aac", "-b:a", "192k"]
+
+    def _scale_pad_filter(self) -> str:
+        """
+        Build the FFmpeg filter that fits frames to the output resolution.
+
+        Frames are scaled down to fit (keeping their aspect ratio) and padded
+        with centered black bars, like create_panel_clip does with Pillow.
+
+        Returns:
+            FFmpeg filter chain string.
+        """
+        width, height = self.resolution
+        return (
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+        )
+
     def compose_video(
         self,
         scenes: list[Scene],
@@ -166,6 +322,10 @@ class VideoCompositor:
         """
         Compose the final video from scenes and audio.
 
+        The panels are fed to a single FFmpeg process through the concat
+        demuxer, each shown for its scene's duration, and encoded together
+        with the audio in one pass. No frames pass through Python.
+
         Args:
             scenes: List of Scene objects with timing information.
             panel_dir: Directory where panel images are stored (for local testing).
@@ -188,61 +348,61 @@ class VideoCompositor:
         if not scenes:
             raise ValueError("No scenes provided for video composition")
 
-        # Create clips for each scene
-        clips = []
-        for idx, scene in enumerate(scenes):
-            # Calculate duration from scene timing
-            duration = scene.end_time - scene.start_time
-
-            # For local testing, use panel_dir; in production, download from S3
-            panel_filename = os.path.basename(scene.panel_s3_key)
-            panel_path = os.path.join(panel_dir, panel_filename)
-
-            # Create clip
-            clip = self.create_panel_clip(panel_path, duration)
-            clips.append(clip)
-
-            if (idx + 1) % 10 == 0:
-                logger.info(
-                    f"Created {idx + 1}/{len(scenes)} clips",
-                    extra={
-                        "progress_pct": int((idx + 1) / len(scenes) * 100),
-                    },
-                )
-
-        logger.info("All clips created, concatenating")
-
-        # Concatenate all clips
-        # Note: crossfadein/out applied during concatenation would add transitions
-        # For now, we concatenate without transitions to simplify
-        final_video = concatenate_videoclips(clips, method="compose")
-
-        # Set audio
-        logger.info("Adding audio to video")
-        audio_clip = AudioFileClip(audio_path)
-        final_video = final_video.set_audio(audio_clip)
-
-        # Write output video
-        logger.info(
-            "Writing output video",
-            extra={"output_path": output_path},
-        )
+        # Create concat file listing each panel with its display duration
+        concat_file = output_path + ".concat.txt"
+        with open(concat_file, "w") as f:
+            for panel_s3_key, duration in _iter_panel_runs(scenes):
+                panel_filename = os.path.basename(panel_s3_key)
+                panel_path = os.path.join(panel_dir, panel_filename)
+                # FFmpeg concat format; a quote inside the quoted path is
+                # written as '\''
+                escaped_path = panel_path.replace("'", "'\\''")
+                entry = f"file '{escaped_path}'\n"
+                f.write(entry)
+                f.write(f"duration {duration}\n")
+            # The concat demuxer ignores the last entry's duration unless the
+            # file is listed once more
+            f.write(entry)
 
-        final_video.write_videofile(
-            output_path,
-            codec="libx264",
-            audio_codec="aac",
-            preset="medium",
-            fps=self.fps,
-            bitrate="2000k",
-            logger=None,  # Disable MoviePy's verbose logging
-        )
+        try:
+            logger.info(
+                "Encoding video with FFmpeg",
+                extra={"output_path": output_path},
+            )
 
-        # Clean up clips
-        for clip in clips:
-            clip.close()
-        audio_clip.close()
-        final_video.close()
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
+                    "-i",
+                    concat_file,
+                    "-i",
+                    audio_path,
+                    "-vf",
+                    f"{self._scale_pad_filter()},fps={self.fps},format=yuv420p",
+                    "-c:v",
+                    self.video_codec,
+                    "-preset",
+                    self.video_preset,
+                    "-b:v",
+                    "2000k",
+                    *self._audio_codec_args(audio_path),
+                    "-shortest",
+                    output_path,
+                ],
+                check=True,
+                capture_output=True,
+            )
+        finally:
+            # Clean up concat file
+            try:
+                os.unlink(concat_file)
+            except Exception:
+                pass
 
         logger.info(
             "Video composition complete",
@@ -254,6 +414,76 @@ class VideoCompositor:
 
         return output_path
 
+    def _stream_panel_frames(
+        self,
+        stream: IO[bytes],
+        scenes: list[Scene],
+        panel_dir: str,
+        chunk_size: int,
+        max_workers: int,
+    ) -> int:
+        """
+        Write every scene's panel to a stream as raw RGB frames.
+
+        Panels are loaded by a thread pool, at most chunk_size ahead of the
+        writer, and each one is written for as many frames as its scene
+        lasts.
+
+        Args:
+            stream: Binary stream to write frames to.
+            scenes: List of Scene objects with timing information.
+            panel_dir: Directory where panel images are stored.
+            chunk_size: Number of panels loaded ahead of the writer.
+            max_workers: Number of panels loaded concurrently.
+
+        Returns:
+            Number of frames written.
+        """
+        # A panel repeated in adjacent scenes is loaded once
+        panel_runs = _iter_panel_runs(scenes)
+        pending: deque[tuple[float, Future[np.ndarray]]] = deque()
+
+        frames_written = 0
+        panels_written = 0
+        elapsed = 0.0
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, chunk_size)) as executor:
+
+            def load_next_panel() -> None:
+                run = next(panel_runs, None)
+                if run is not None:
+                    panel_s3_key, duration = run
+                    panel_path = os.path.join(panel_dir, os.path.basename(panel_s3_key))
+                    pending.append((duration, executor.submit(self.load_panel_frame, panel_path)))
+
+            # Keep chunk_size panels loading ahead of the writer, topping the
+            # window up as each one is written so loading never stalls
+            for _ in range(chunk_size):
+                load_next_panel()
+
+            while pending:
+                duration, future = pending.popleft()
+                frame = future.result()
+                load_next_panel()
+
+                # Count frames against the running timestamp so rounding
+                # never accumulates into audio drift
+                elapsed += duration
+                frame_count = round(elapsed * self.fps) - frames_written
+                frame_bytes = frame.tobytes()
+                for _ in range(frame_count):
+                    stream.write(frame_bytes)
+                frames_written += frame_count
+                panels_written += 1
+
+                if panels_written % chunk_size == 0:
+                    logger.info(
+                        f"Streamed {panels_written} panels",
+                        extra={"frames_written": frames_written},
+                    )
+
+        return frames_written
+
     def compose_video_chunked(
         self,
         scenes: list[Scene],
@@ -261,22 +491,29 @@ class VideoCompositor:
         audio_path: str,
         output_path: str,
         chunk_size: int = 100,
+        max_workers: int = PANEL_CLIP_WORKERS,
     ) -> str:
         """
         Compose video in chunks for memory efficiency.
 
-        For very long videos (2-5 hours), rendering in chunks prevents
-        MoviePy from holding the entire video in memory.
+        Panel frames are piped as raw RGB into a single FFmpeg process that
+        encodes the video and audio in one pass while the next panels are
+        prepared. Only one chunk of panels is held in memory at a time and
+        no intermediate files are written.
 
         Args:
             scenes: List of Scene objects with timing information.
             panel_dir: Directory where panel images are stored.
             audio_path: Path to the audio file.
             output_path: Path where the output video will be saved.
-            chunk_size: Number of scenes per chunk (default: 100).
+            chunk_size: Number of panels loaded ahead of the encoder (default: 100).
+            max_workers: Number of panels prepared concurrently.
 
         Returns:
             Path to the rendered video file.
+
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg fails.
         """
         logger.info(
             "Starting chunked video composition",
@@ -290,151 +527,86 @@ class VideoCompositor:
         if not scenes:
             raise ValueError("No scenes provided for video composition")
 
-        # Create temporary directory for chunks
-        temp_dir = tempfile.mkdtemp(prefix="video_chunks_")
-        chunk_files = []
+        if len(scenes) <= chunk_size:
+            # A single chunk gains nothing from streaming frames through
+            # Python; FFmpeg can read the panels directly
+            logger.info("Scenes fit in one chunk, composing directly")
+            return self.compose_video(scenes, panel_dir, audio_path, output_path)
+
+        width, height = self.resolution
+        command = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(self.fps),
+            "-i",
+            "-",
+            "-i",
+            audio_path,
+            "-c:v",
+            self.video_codec,
+            "-preset",
+            self.video_preset,
+            "-b:v",
+            "2000k",
+            "-pix_fmt",
+            "yuv420p",
+            *self._audio_codec_args(audio_path),
+            "-shortest",
+            # Put the moov atom up front so the upload can be streamed
+            "-movflags",
+            "+faststart",
+            output_path,
+        ]
+
+        # FFmpeg's log goes to a file so a full stderr pipe cannot stall it
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file,
+            )
+            stdin = process.stdin
+            assert stdin is not None  # Popen was given stdin=PIPE
 
-        try:
-            # Render each chunk
-            num_chunks = (len(scenes) + chunk_size - 1) // chunk_size
-
-            for chunk_idx in range(num_chunks):
-                start_idx = chunk_idx * chunk_size
-                end_idx = min(start_idx + chunk_size, len(scenes))
-                chunk_scenes = scenes[start_idx:end_idx]
-
-                logger.info(
-                    f"Rendering chunk {chunk_idx + 1}/{num_chunks}",
-                    extra={
-                        "start_scene": start_idx,
-                        "end_scene": end_idx,
-                        "scenes_in_chunk": len(chunk_scenes),
-                    },
+            try:
+                frames_written = self._stream_panel_frames(
+                    stdin, scenes, panel_dir, chunk_size, max_workers
                 )
-
-                # Create clips for this chunk
-                clips = []
-                for scene in chunk_scenes:
-                    duration = scene.end_time - scene.start_time
-                    panel_filename = os.path.basename(scene.panel_s3_key)
-                    panel_path = os.path.join(panel_dir, panel_filename)
-
-                    clip = self.create_panel_clip(panel_path, duration)
-                    clips.append(clip)
-
-                # Concatenate clips in this chunk
-                chunk_video = concatenate_videoclips(clips, method="compose")
-
-                # Write chunk to temp file (no audio yet)
-                chunk_file = os.path.join(temp_dir, f"chunk_{chunk_idx:04d}.mp4")
-                chunk_video.write_videofile(
-                    chunk_file,
-                    codec="libx264",
-                    preset="medium",
-                    fps=self.fps,
-                    bitrate="2000k",
-                    audio=False,  # No audio in chunks
-                    logger=None,
+                stdin.close()
+            except BrokenPipeError:
+                # FFmpeg stopped reading; its exit code tells whether that was
+                # -shortest ending the video or a failure. Closing flushes any
+                # buffered frame bytes, which hits the same broken pipe.
+                with contextlib.suppress(BrokenPipeError):
+                    stdin.close()
+                frames_written = None
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+
+            returncode = process.wait()
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode, command, stderr=stderr_file.read()
                 )
 
-                chunk_files.append(chunk_file)
-
-                # Clean up clips
-                for clip in clips:
-                    clip.close()
-                chunk_video.close()
-
-                logger.info(
-                    f"Chunk {chunk_idx + 1}/{num_chunks} complete",
-                    extra={
-                        "chunk_file": chunk_file,
-                        "file_size_mb": round(
-                            os.path.getsize(chunk_file) / (1024 * 1024), 2
-                        ),
-                    },
-                )
-
-            # Concatenate chunks using FFmpeg
-            logger.info("Concatenating chunks with FFmpeg")
-
-            # Create concat file for FFmpeg
-            concat_file = os.path.join(temp_dir, "concat_list.txt")
-            with open(concat_file, "w") as f:
-                for chunk_file in chunk_files:
-                    f.write(f"file '{chunk_file}'\n")
-
-            # Concatenate without re-encoding (fast)
-            temp_output = os.path.join(temp_dir, "concatenated.mp4")
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    concat_file,
-                    "-c",
-                    "copy",
-                    temp_output,
-                ],
-                check=True,
-                capture_output=True,
-            )
-
-            logger.info("Chunks concatenated, adding audio")
-
-            # Add audio using FFmpeg
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-i",
-                    temp_output,
-                    "-i",
-                    audio_path,
-                    "-c:v",
-                    "copy",
-                    "-c:a",
-                    "aac",
-                    "-b:a",
-                    "192k",
-                    "-shortest",
-                    output_path,
-                ],
-                check=True,
-                capture_output=True,
-            )
-
-            logger.info(
-                "Chunked video composition complete",
-                extra={
-                    "output_path": output_path,
-                    "file_size_mb": round(
-                        os.path.getsize(output_path) / (1024 * 1024), 2
-                    ),
-                },
-            )
-
-            return output_path
+        logger.info(
+            "Chunked video composition complete",
+            extra={
+                "output_path": output_path,
+                "frames_written": frames_written,
+                "file_size_mb": round(os.path.getsize(output_path) / (1024 * 1024), 2),
+            },
+        )
 
-        finally:
-            # Clean up temporary files
-            logger.info("Cleaning up temporary chunk files")
-            try:
-                for chunk_file in chunk_files:
-                    if os.path.exists(chunk_file):
-                        os.unlink(chunk_file)
-
-                # Clean up other temp files
-                for file in ["concat_list.txt", "concatenated.mp4"]:
-                    filepath = os.path.join(temp_dir, file)
-                    if os.path.exists(filepath):
-                        os.unlink(filepath)
-
-                # Remove temp directory
-                os.rmdir(temp_dir)
-            except Exception as e:
-                logger.warning(
-                    "Failed to clean up some temporary files",
-                    extra={"error": str(e)},
-                )
+        return output_path
@@ -3,7 +3,7 @@
 import json
 import os
 import shutil
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import boto3
@@ -20,11 +20,13 @@ from src.renderer.spot_handler import (
     delete_checkpoint,
     load_checkpoint,
     register_spot_interruption_handler,
-    save_checkpoint,
 )
 
 logger = setup_logger(__name__)
 
+# Concurrent S3 downloads when fetching panel images
+PANEL_DOWNLOAD_WORKERS = 8
+
 # Global state for checkpoint callback
 _current_state: dict[str, Any] = {}
 
@@ -34,6 +36,62 @@ def get_checkpoint_callback() -> dict[str, Any]:
     return _current_state.copy()
 
 
+def download_panels(
+    s3_client: S3Client,
+    panel_manifest: dict[str, Any],
+    panels_dir: str,
+    max_workers: int = PANEL_DOWNLOAD_WORKERS,
+) -> int:
+    """
+    Download every panel image in the manifest into panels_dir.
+
+    Downloads run concurrently on a thread pool since each one is a separate
+    S3 round trip. The first failed download is re-raised.
+
+    Args:
+        s3_client: S3 client to download with.
+        panel_manifest: Panel manifest with a "chapters" list.
+        panels_dir: Local directory to download panels into.
+        max_workers: Maximum number of concurrent downloads.
+
+    Returns:
+        Number of panels downloaded.
+    """
+    downloads: list[tuple[str, str]] = []
+    for chapter in panel_manifest.get("chapters", []):
+        # Handle both formats: panel_keys (list of strings) and panels (list of objects)
+        panel_keys = chapter.get("panel_keys", [])
+        if not panel_keys:
+            # Fallback to panels format with s3_key
+            panel_keys = [p.get("s3_key") for p in chapter.get("panels", []) if p.get("s3_key")]
+
+        for panel_s3_key in panel_keys:
+            if not panel_s3_key:
+                continue
+            local_panel_path = os.path.join(panels_dir, os.path.basename(panel_s3_key))
+            downloads.append((panel_s3_key, local_panel_path))
+
+    total_panels = panel_manifest.get("total_panels", len(downloads))
+    panel_count = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(s3_client.download_file, s3_key, local_path)
+            for s3_key, local_path in downloads
+        ]
+        for future in as_completed(futures):
+            future.result()
+            panel_count += 1
+
+            if panel_count % 50 == 0:
+                logger.info(
+                    f"Downloaded {panel_count} panels",
+                    extra={"progress": f"{panel_count}/{total_panels}"},
+                )
+
+    return panel_count
+
+
 def main() -> None:
     """
     Main entry point for the video renderer.
@@ -97,6 +155,8 @@ def main() -> None:
         panel_manifest = s3_client.download_json(panel_manifest_key)
         if not panel_manifest:
             raise ValueError(f"Panel manifest not found at {panel_manifest_key}")
+        if not isinstance(panel_manifest, dict):
+            raise ValueError(f"Panel manifest at {panel_manifest_key} is not a JSON object")
 
         # Step 6: Load audio manifest from S3
         audio_manifest_key = f"jobs/{job_id}/audio_manifest.json"
@@ -146,58 +206,40 @@ def main() -> None:
         os.makedirs(panels_dir, exist_ok=True)
         os.makedirs(audio_dir, exist_ok=True)
 
-        # Step 10: Download all panel images from S3
+        # Step 10: Download all panel images from S3 in the background while
+        # the audio is merged, since both steps are network-bound
         logger.info("Downloading panel images from S3")
-        panel_count = 0
-
-        for chapter in panel_manifest.get("chapters", []):
-            # Handle both formats: panel_keys (list of strings) and panels (list of objects)
-            panel_keys = chapter.get("panel_keys", [])
-            if not panel_keys:
-                # Fallback to panels format with s3_key
-                panel_keys = [p.get("s3_key") for p in chapter.get("panels", []) if p.get("s3_key")]
+        with ThreadPoolExecutor(max_workers=1) as prefetch_executor:
+            panels_future = prefetch_executor.submit(
+                download_panels, s3_client, panel_manifest, panels_dir
+            )
 
-            for panel_s3_key in panel_keys:
-                if not panel_s3_key:
-                    continue
+            # Step 11: Merge all audio segments straight from S3
+            logger.info("Merging audio segments from S3")
+            audio_merger = AudioMerger()
 
-                # Download panel to local directory
-                panel_filename = os.path.basename(panel_s3_key)
-                local_panel_path = os.path.join(panels_dir, panel_filename)
+            merged_audio_path, audio_duration = audio_merger.merge_from_s3(
+                audio_manifest=audio_manifest,
+                s3_client=s3_client,
+                job_id=job_id,
+                local_dir=audio_dir,
+            )
 
-                s3_client.download_file(panel_s3_key, local_panel_path)
-                panel_count += 1
+            logger.info(
+                "Audio merged successfully",
+                extra={
+                    "path": merged_audio_path,
+                    "duration_seconds": audio_duration,
+                },
+            )
 
-                if panel_count % 50 == 0:
-                    logger.info(
-                        f"Downloaded {panel_count} panels",
-                        extra={"progress": f"{panel_count}/{panel_manifest.get('total_panels', 0)}"},
-                    )
+            panel_count = panels_future.result()
 
         logger.info(
             "All panels downloaded",
             extra={"total_panels": panel_count},
         )
 
-        # Step 11: Download and merge all audio segments
-        logger.info("Downloading and merging audio segments")
-        audio_merger = AudioMerger()
-
-        merged_audio_path, audio_duration = audio_merger.merge_from_s3(
-            audio_manifest=audio_manifest,
-            s3_client=s3_client,
-            job_id=job_id,
-            local_dir=audio_dir,
-        )
-
-        logger.info(
-            "Audio merged successfully",
-            extra={
-                "path": merged_audio_path,
-                "duration_seconds": audio_duration,
-            },
-        )
-
         # Step 12: Build scenes using SceneBuilder
         logger.info("Building scenes from panels and audio")
         scene_builder = SceneBuilder()
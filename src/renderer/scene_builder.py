@@ -8,7 +8,9 @@ from src.common.models import AudioManifest
 logger = setup_logger(__name__)
 
 
-@dataclass
+# Slotted: a long video builds thousands of scenes and the renderer reads
+# their fields in per-scene loops
+@dataclass(slots=True)
 class Scene:
     """Represents a single scene with panel and timing information."""
 
@@ -177,6 +179,7 @@ class SceneBuilder:
         avg_panel_duration = (
             total_scene_duration / len(scenes) if scenes else 0.0
         )
+        duration_diff = abs(total_scene_duration - audio_manifest.total_duration_seconds)
 
         logger.info(
             "Scenes built",
@@ -185,14 +188,11 @@ class SceneBuilder:
                 "total_duration": round(total_scene_duration, 2),
                 "avg_panel_duration": round(avg_panel_duration, 2),
                 "audio_duration": audio_manifest.total_duration_seconds,
-                "duration_diff": round(
-                    abs(total_scene_duration - audio_manifest.total_duration_seconds), 2
-                ),
+                "duration_diff": round(duration_diff, 2),
             },
         )
 
         # Verify total duration matches audio (±1 second)
-        duration_diff = abs(total_scene_duration - audio_manifest.total_duration_seconds)
         if duration_diff > 1.0:
             logger.warning(
                 "Scene duration differs from audio duration by more than 1 second",
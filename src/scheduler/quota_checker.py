@@ -1,6 +1,6 @@
 """Lambda handler for checking daily video quota."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -4,7 +4,6 @@ import asyncio
 import os
 import tempfile
 import time
-from typing import BinaryIO
 
 import edge_tts
 from mutagen.mp3 import MP3
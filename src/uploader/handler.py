@@ -7,7 +7,7 @@ from typing import Any
 from src.common.config import get_settings
 from src.common.db import DynamoDBClient
 from src.common.logging_config import set_correlation_id, setup_logger
-from src.common.models import ChapterInfo, JobStatus, MangaInfo
+from src.common.models import JobStatus, MangaInfo
 from src.common.secrets import SecretsClient
 from src.common.storage import S3Client
 from src.uploader.metadata_generator import MetadataGenerator
@@ -51,9 +51,11 @@ def handler(event: dict, context: Any) -> dict:
 
     local_video_path = None
 
+    # Resolve settings once (cached) so the error path below reuses them
+    settings = get_settings()
+
     try:
-        # Initialize configuration and clients
-        settings = get_settings()
+        # Initialize clients
         db_client = DynamoDBClient(settings)
         s3_client = S3Client(settings)
         secrets_client = SecretsClient(region=settings.aws_region)
@@ -203,7 +205,6 @@ def handler(event: dict, context: Any) -> dict:
 
         # Update job status to failed
         try:
-            settings = get_settings()
             db_client = DynamoDBClient(settings)
             db_client.update_job_status(
                 job_id=job_id,
@@ -241,16 +242,9 @@ def _reconstruct_manga_info(panel_manifest: dict) -> MangaInfo:
     Returns:
         MangaInfo object.
     """
-    # Reconstruct chapters
-    chapters = []
-    for chapter_data in panel_manifest.get("chapters", []):
-        chapter_info = ChapterInfo(
-            chapter_id=chapter_data.get("chapter_id", ""),
-            title=chapter_data.get("title", ""),
-            chapter_number=chapter_data.get("chapter_number"),
-            page_urls=[],
-        )
-        chapters.append(chapter_info)
+    # Only the chapter count is used for metadata, so skip validating a
+    # ChapterInfo per chapter
+    chapter_count = len(panel_manifest.get("chapters", []))
 
     # Create MangaInfo
     manga_info = MangaInfo(
@@ -259,7 +253,8 @@ def _reconstruct_manga_info(panel_manifest: dict) -> MangaInfo:
         description=panel_manifest.get("description", ""),
         genres=panel_manifest.get("genres", []),
         cover_url=panel_manifest.get("cover_url"),
-        chapters=chapters,
+        chapters=[],
+        chapter_count=chapter_count,
     )
 
     return manga_info
@@ -1,18 +1,24 @@
 """Main entry point for the YouTube uploader running on EC2 Spot instances."""
 
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 
 from src.common.config import get_settings
 from src.common.db import DynamoDBClient
 from src.common.logging_config import setup_logger
-from src.common.models import JobRecord, JobStatus, MangaInfo
+from src.common.models import JobStatus, MangaInfo
 from src.common.secrets import SecretsClient
 from src.common.storage import S3Client
 from src.uploader.metadata_generator import MetadataGenerator
 from src.uploader.upload_client import YouTubeQuotaError, YouTubeUploadClient, YouTubeUploadError
-from src.uploader.youtube_auth import YouTubeAuthManager, YouTubeAuthError
+from src.uploader.youtube_auth import (
+    YouTubeAuthError,
+    YouTubeAuthManager,
+    wait_for_pending_persists,
+)
 
 logger = setup_logger(__name__)
 
@@ -30,7 +36,10 @@ def main() -> None:
     6. Trigger cleanup
     """
     job_id = None
-    local_video_path = None
+    local_video_dir = None
+
+    # Resolve settings once (cached) so the error path below reuses them
+    config = get_settings()
 
     try:
         # Step 1: Read job_id from environment
@@ -43,24 +52,44 @@ def main() -> None:
             extra={"job_id": job_id},
         )
 
-        # Step 2: Initialize config, logger, DB, S3, Secrets
+        # Step 2: Initialize DB, S3, Secrets
         logger.info("Initializing components")
-        config = get_settings()
-        db_client = DynamoDBClient(
-            table_name=config.dynamodb_jobs_table,
-            region=config.aws_region,
-        )
-        s3_client = S3Client(
-            bucket_name=config.s3_bucket,
-            region=config.aws_region,
-        )
+        db_client = DynamoDBClient(settings=config)
+        s3_client = S3Client(settings=config)
         secrets_client = SecretsClient(
             region=config.aws_region,
         )
 
-        # Step 3: Load job record from DynamoDB
-        logger.info("Loading job record", extra={"job_id": job_id})
-        job_record = db_client.get_job(job_id)
+        # Step 3: Load job record and panel manifest, and prefetch the secrets
+        # the uploader reads, concurrently; the three round-trips have no data
+        # dependency on each other. Secrets are batch-loaded in one
+        # BatchGetSecretValue call and then served from the client's cache.
+        panel_manifest_key = f"jobs/{job_id}/panel_manifest.json"
+        logger.info(
+            "Loading job record and panel manifest",
+            extra={"job_id": job_id, "s3_key": panel_manifest_key},
+        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            job_future = executor.submit(db_client.get_job, job_id)
+            manifest_future = executor.submit(s3_client.download_json, panel_manifest_key)
+            secrets_future = executor.submit(
+                secrets_client.batch_get_secret_json, [config.youtube_secret_name]
+            )
+            job_record = job_future.result()
+            panel_manifest = manifest_future.result()
+
+        # A failed prefetch is not fatal: YouTubeAuthManager loads the secret
+        # again and reports the failure on the job itself.
+        youtube_tokens = None
+        secrets_error = secrets_future.exception()
+        if secrets_error is not None:
+            logger.warning(
+                "Failed to prefetch YouTube OAuth secret",
+                extra={"error": str(secrets_error)},
+            )
+        else:
+            youtube_tokens = secrets_client.get_youtube_oauth_tokens(config.youtube_secret_name)
+
         if not job_record:
             raise ValueError(f"Job {job_id} not found in database")
 
@@ -74,12 +103,6 @@ def main() -> None:
         )
 
         # Step 4: Load manga info for metadata generation
-        panel_manifest_key = f"jobs/{job_id}/panel_manifest.json"
-        logger.info(
-            "Loading panel manifest for manga info",
-            extra={"s3_key": panel_manifest_key},
-        )
-        panel_manifest = s3_client.download_json(panel_manifest_key)
         if not panel_manifest:
             raise ValueError(f"Panel manifest not found at {panel_manifest_key}")
 
@@ -91,7 +114,7 @@ def main() -> None:
             extra={
                 "manga_id": manga_info.manga_id,
                 "manga_title": manga_info.title,
-                "chapter_count": len(manga_info.chapters),
+                "chapter_count": manga_info.chapter_count,
             },
         )
 
@@ -126,6 +149,7 @@ def main() -> None:
         youtube_auth = YouTubeAuthManager(
             secrets_client=secrets_client,
             secret_name=config.youtube_secret_name,
+            preloaded_tokens=youtube_tokens,
         )
 
         try:
@@ -156,13 +180,10 @@ def main() -> None:
             },
         )
 
-        # Step 8: Upload video using YouTubeUploadClient
+        # Step 8: Upload video using YouTubeUploadClient. No intermediate
+        # "uploading" status write: the terminal completed/failed update below
+        # is the single source of truth, saving a DynamoDB round-trip per job.
         logger.info("Starting YouTube video upload")
-        db_client.update_job_status(
-            job_id=job_id,
-            status=JobStatus.uploading,
-            progress_pct=90,
-        )
 
         upload_client = YouTubeUploadClient(youtube_service)
 
@@ -246,11 +267,7 @@ def main() -> None:
         # Update job status to failed (if not already updated)
         if job_id:
             try:
-                config = get_settings()
-                db_client = DynamoDBClient(
-                    table_name=config.dynamodb_jobs_table,
-                    region=config.aws_region,
-                )
+                db_client = DynamoDBClient(settings=config)
                 db_client.update_job_status(
                     job_id=job_id,
                     status=JobStatus.failed,
@@ -265,23 +282,15 @@ def main() -> None:
         raise
 
     finally:
-        # Clean up local video file if downloaded
-        if local_video_path and os.path.exists(local_video_path):
-            try:
-                logger.info("Cleaning up local video file")
-                os.unlink(local_video_path)
-
-                # Remove directory if empty
-                local_video_dir = os.path.dirname(local_video_path)
-                if os.path.exists(local_video_dir) and not os.listdir(local_video_dir):
-                    os.rmdir(local_video_dir)
-
-                logger.info("Local video file cleaned up")
-            except Exception as cleanup_error:
-                logger.warning(
-                    "Failed to clean up local video file",
-                    extra={"error": str(cleanup_error)},
-                )
+        # Land any refreshed OAuth token in Secrets Manager before Lambda
+        # freezes the container, so the next cold start does not read a stale one
+        wait_for_pending_persists()
+
+        # Remove the job's scratch directory; ignore_errors covers the
+        # missing-directory case without separate exists/listdir checks
+        if local_video_dir:
+            logger.info("Cleaning up local video directory", extra={"path": local_video_dir})
+            shutil.rmtree(local_video_dir, ignore_errors=True)
 
 
 def _reconstruct_manga_info(panel_manifest: dict) -> MangaInfo:
@@ -294,18 +303,9 @@ def _reconstruct_manga_info(panel_manifest: dict) -> MangaInfo:
     Returns:
         MangaInfo object.
     """
-    from src.common.models import ChapterInfo
-
-    # Reconstruct chapters
-    chapters = []
-    for chapter_data in panel_manifest.get("chapters", []):
-        chapter_info = ChapterInfo(
-            chapter_id=chapter_data.get("chapter_id", ""),
-            title=chapter_data.get("title", ""),
-            chapter_number=chapter_data.get("chapter_number"),
-            page_urls=[],  # Not needed for metadata generation
-        )
-        chapters.append(chapter_info)
+    # Only the chapter count is used for metadata, so skip validating a
+    # ChapterInfo per chapter
+    chapter_count = len(panel_manifest.get("chapters", []))
 
     # Create MangaInfo
     manga_info = MangaInfo(
@@ -314,7 +314,8 @@ def _reconstruct_manga_info(panel_manifest: dict) -> MangaInfo:
         description=panel_manifest.get("description", ""),
         genres=panel_manifest.get("genres", []),
         cover_url=panel_manifest.get("cover_url"),
-        chapters=chapters,
+        chapters=[],
+        chapter_count=chapter_count,
     )
 
     return manga_info
@@ -16,6 +16,11 @@ class MetadataGenerator:
     MAX_DESCRIPTION_LENGTH = 5000
     MAX_TAGS_TOTAL_LENGTH = 500
 
+    # Input caps applied before any strip/slice/regex work, so a malformed
+    # manifest with a huge title or description can't dominate runtime
+    MAX_INPUT_TITLE_LENGTH = 500
+    MAX_INPUT_DESCRIPTION_LENGTH = 10_000
+
     def __init__(self) -> None:
         """Initialize the metadata generator."""
         logger.info("MetadataGenerator initialized")
@@ -45,6 +50,8 @@ class MetadataGenerator:
             },
         )
 
+        manga = self._cap_input_lengths(manga)
+
         # Generate title
         title = self._generate_title(manga.title)
 
@@ -75,6 +82,34 @@ class MetadataGenerator:
 
         return metadata
 
+    def _cap_input_lengths(self, manga: MangaInfo) -> MangaInfo:
+        """
+        Cap oversized title and description before downstream processing.
+
+        Args:
+            manga: Manga information.
+
+        Returns:
+            The same manga, or a copy with title/description truncated.
+        """
+        update = {}
+        if len(manga.title) > self.MAX_INPUT_TITLE_LENGTH:
+            update["title"] = manga.title[:self.MAX_INPUT_TITLE_LENGTH]
+        if manga.description and len(manga.description) > self.MAX_INPUT_DESCRIPTION_LENGTH:
+            update["description"] = manga.description[:self.MAX_INPUT_DESCRIPTION_LENGTH]
+
+        if not update:
+            return manga
+
+        logger.warning(
+            "Oversized manga input capped before metadata generation",
+            extra={
+                "title_length": len(manga.title),
+                "description_length": len(manga.description or ""),
+            },
+        )
+        return manga.model_copy(update=update)
+
     def _generate_title(self, manga_title: str) -> str:
         """
         Generate YouTube video title.
@@ -135,43 +170,28 @@ class MetadataGenerator:
         Returns:
             Formatted description (max 5000 chars).
         """
-        lines = []
-
-        # Line 1: Introduction
-        lines.append(f"📖 Review và tóm tắt manga {manga.title}")
-
-        # Line 2: blank
-        lines.append("")
-
-        # Line 3: Description (truncated to 500 chars)
+        # Description body; only slice when it actually exceeds 500 chars
         description = manga.description.strip() if manga.description else ""
         if not description:
             description = "Manga hay và hấp dẫn"
-        if len(description) > 500:
+        elif len(description) > 500:
             description = description[:497] + "..."
-        lines.append(description)
 
-        # Line 4: blank
-        lines.append("")
-
-        # Line 5: Genres
         genres_str = ", ".join(manga.genres) if manga.genres else "Không rõ"
-        lines.append(f"Thể loại: {genres_str}")
-
-        # Line 6: Chapter count
-        chapter_count = len(manga.chapters)
-        lines.append(f"Số chương: {chapter_count}")
-
-        # Line 7: blank
-        lines.append("")
-
-        # Line 8: Hashtags
+        chapter_count = manga.chapter_count
         sanitized_title = self._sanitize_tag(manga.title)
-        hashtags = f"#manga #review #tomtat #{sanitized_title}"
-        lines.append(hashtags)
 
-        # Join lines
-        description_text = "\n".join(lines)
+        # Build the whole description in one pass instead of list append + join
+        description_text = (
+            f"📖 Review và tóm tắt manga {manga.title}\n"
+            "\n"
+            f"{description}\n"
+            "\n"
+            f"Thể loại: {genres_str}\n"
+            f"Số chương: {chapter_count}\n"
+            "\n"
+            f"#manga #review #tomtat #{sanitized_title}"
+        )
 
         # Ensure we don't exceed max length
         if len(description_text) > self.MAX_DESCRIPTION_LENGTH:
@@ -1,7 +1,11 @@
 """YouTube OAuth2 token manager for authenticated API access."""
 
-from datetime import datetime, timezone
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
 
+import requests
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -12,6 +16,97 @@ from src.common.secrets import SecretsClient
 
 logger = setup_logger(__name__)
 
+# Reuse the cached service until its access token is this close to expiry
+SERVICE_CACHE_MIN_TTL_SECONDS = 60
+
+# Start a background refresh of the cached token once it is this close to expiry;
+# above google-auth's own 225s refresh threshold, so the refresh lands before
+# google-auth would treat the token as invalid and refresh it inline
+PROACTIVE_REFRESH_WINDOW_SECONDS = 300
+
+# Most credentials (and services built on them) kept per process; each entry
+# is one OAuth client and refresh token, so a handful covers every caller
+CREDENTIALS_CACHE_SIZE = 8
+
+# Single background writer for refreshed tokens; the refreshed credentials are
+# usable immediately, so the Secrets Manager write stays off the caller's path
+_persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-persist")
+
+
+def _log_persist_result(future: Future) -> None:
+    """Log the outcome of a background token write."""
+    error = future.exception()
+    if error is None:
+        logger.info("Updated access token stored in Secrets Manager")
+        return
+
+    logger.error(
+        "Failed to update access token in Secrets Manager",
+        extra={"error": str(error)},
+        exc_info=error,
+    )
+    # The refreshed credentials are still valid for this session
+    logger.warning(
+        "Token refresh succeeded but failed to persist to Secrets Manager. "
+        "The refreshed token will be used for this session only."
+    )
+
+
+# Background worker for proactive refreshes of cached credentials
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-refresh")
+
+
+def _log_proactive_refresh_result(future: Future) -> None:
+    """Log a failed background token refresh."""
+    error = future.exception()
+    if error is not None:
+        # The next call past the cache TTL retries the refresh inline
+        logger.warning(
+            "Background token refresh failed",
+            extra={"error": str(error)},
+        )
+
+
+@functools.lru_cache(maxsize=CREDENTIALS_CACHE_SIZE)
+def _build_service(credentials: Credentials) -> Resource:
+    """
+    Build a YouTube v3 service, once per credentials object in the process.
+
+    Keyed on the credentials object itself (identity hash); the cache holds
+    a reference to it, so entries can never be confused with a new object.
+    Refreshes update credentials in place, so a cached service stays usable.
+
+    Args:
+        credentials: Credentials the service authorizes requests with.
+
+    Returns:
+        YouTube API service (googleapiclient Resource).
+    """
+    # Use the discovery document bundled with the client library (no
+    # discovery fetch, no file cache probing)
+    return build(
+        "youtube",
+        "v3",
+        credentials=credentials,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+def wait_for_pending_persists() -> None:
+    """
+    Block until every token write submitted so far has finished.
+
+    Background refreshes that are already running are waited for first,
+    since they submit a write when they finish. Call this before a Lambda
+    handler returns: the container is frozen afterwards, and a write still
+    queued could be lost, leaving the next cold start with a stale token.
+    """
+    # Each executor has one worker and runs jobs in order, so once its no-op
+    # completes every earlier job has completed too
+    _refresh_executor.submit(lambda: None).result()
+    _persist_executor.submit(lambda: None).result()
+
 
 class YouTubeAuthError(Exception):
     """Raised when YouTube authentication fails."""
@@ -22,16 +117,44 @@ class YouTubeAuthError(Exception):
 class YouTubeAuthManager:
     """Manager for YouTube OAuth2 authentication and token refresh."""
 
-    def __init__(self, secrets_client: SecretsClient, secret_name: str) -> None:
+    # One refresh lock per secret, shared by every manager in the process, so
+    # a single-use refresh token is never spent by two callers at once
+    _refresh_locks: dict[str, threading.Lock] = {}
+    _refresh_locks_guard = threading.Lock()
+
+    # Credentials keyed by (client_id, refresh_token), shared by every manager
+    # in the process and reused while the stored access token still matches;
+    # kept in least-recently-used order and bounded like _build_service
+    _credentials_cache: dict[tuple[str, str], Credentials] = {}
+
+    def __init__(
+        self,
+        secrets_client: SecretsClient,
+        secret_name: str,
+        preloaded_tokens: dict | None = None,
+    ) -> None:
         """
         Initialize the YouTube authentication manager.
 
         Args:
             secrets_client: Client for accessing Secrets Manager.
             secret_name: Name of the secret containing OAuth tokens.
+            preloaded_tokens: OAuth tokens already loaded by the caller (as
+                returned by get_youtube_oauth_tokens). Used for the first
+                authentication instead of reading the secret again.
         """
         self.secrets_client = secrets_client
         self.secret_name = secret_name
+        self._preloaded_tokens = preloaded_tokens
+
+        # Service built on the last successful call, reused while its token is fresh
+        self._cached_service: Resource | None = None
+        self._cached_credentials: Credentials | None = None
+        self._cached_tokens: dict | None = None
+        self._proactive_refresh: Future | None = None
+
+        # Token refreshes share one keep-alive session to oauth2.googleapis.com
+        self._auth_request = Request(session=requests.Session())
 
         logger.info(
             "YouTubeAuthManager initialized",
@@ -44,7 +167,11 @@ class YouTubeAuthManager:
 
         Loads OAuth tokens from Secrets Manager, refreshes the access token
         if expired, updates Secrets Manager with new tokens, and returns
-        an authenticated YouTube service.
+        an authenticated YouTube service. The service is cached on the
+        instance and returned directly while its token is not within
+        SERVICE_CACHE_MIN_TTL_SECONDS of expiry; once the token is within
+        PROACTIVE_REFRESH_WINDOW_SECONDS a background refresh is started so
+        later calls do not pay for it inline.
 
         Returns:
             Authenticated YouTube API service (googleapiclient Resource).
@@ -52,11 +179,21 @@ class YouTubeAuthManager:
         Raises:
             YouTubeAuthError: If authentication fails or tokens are invalid.
         """
-        logger.info("Getting authenticated YouTube service")
+        if self._cached_service is not None and self._is_token_fresh(
+            self._cached_credentials, SERVICE_CACHE_MIN_TTL_SECONDS
+        ):
+            logger.debug("Reusing cached YouTube service")
+            self._schedule_proactive_refresh()
+            return self._cached_service
 
-        # Load OAuth tokens from Secrets Manager
+        logger.debug("Getting authenticated YouTube service")
+
+        # Load OAuth tokens from Secrets Manager (unless preloaded by the caller)
         try:
-            tokens = self.secrets_client.get_youtube_oauth_tokens(self.secret_name)
+            tokens = self._preloaded_tokens or self.secrets_client.get_youtube_oauth_tokens(
+                self.secret_name
+            )
+            self._preloaded_tokens = None
         except Exception as e:
             logger.error(
                 "Failed to load OAuth tokens from Secrets Manager",
@@ -71,31 +208,23 @@ class YouTubeAuthManager:
         client_id = tokens.get("client_id")
         client_secret = tokens.get("client_secret")
         refresh_token = tokens.get("refresh_token")
-        access_token = tokens.get("access_token")
 
-        if not all([client_id, client_secret, refresh_token]):
+        if not client_id or not client_secret or not refresh_token:
             logger.error("Missing required OAuth tokens (client_id, client_secret, or refresh_token)")
             raise YouTubeAuthError(
                 "Missing required OAuth tokens. Ensure client_id, client_secret, "
                 "and refresh_token are set in Secrets Manager."
             )
 
-        # Build credentials from tokens
-        credentials = Credentials(
-            token=access_token,
-            refresh_token=refresh_token,
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=client_id,
-            client_secret=client_secret,
-            scopes=["https://www.googleapis.com/auth/youtube.upload"],
-        )
+        # Build credentials from tokens (or reuse the unchanged ones)
+        credentials = self._get_credentials(tokens)
 
         # Check if token needs refresh
         if not credentials.valid:
             if credentials.expired and credentials.refresh_token:
                 logger.info("Access token expired, refreshing")
                 try:
-                    credentials = self.refresh_token(credentials)
+                    credentials = self._refresh_serialized(credentials, tokens)
                 except YouTubeAuthError:
                     raise
                 except Exception as e:
@@ -112,12 +241,15 @@ class YouTubeAuthManager:
                     "and no refresh token is available."
                 )
         else:
-            logger.info("Token valid, no refresh needed")
+            logger.debug("Token valid, no refresh needed")
 
-        # Build YouTube service
+        # Build YouTube service (shared by every manager using these credentials)
         try:
-            youtube_service = build("youtube", "v3", credentials=credentials)
+            youtube_service = _build_service(credentials)
             logger.info("YouTube service authenticated successfully")
+            self._cached_service = youtube_service
+            self._cached_credentials = credentials
+            self._cached_tokens = tokens
             return youtube_service
         except Exception as e:
             logger.error(
@@ -127,12 +259,201 @@ class YouTubeAuthManager:
             )
             raise YouTubeAuthError("Failed to build YouTube service") from e
 
-    def refresh_token(self, credentials: Credentials) -> Credentials:
+    def _get_credentials(self, tokens: dict) -> Credentials:
+        """
+        Return credentials for tokens, reusing the cached object if unchanged.
+
+        Args:
+            tokens: Tokens loaded from Secrets Manager.
+
+        Returns:
+            Credentials for the YouTube upload scope.
+        """
+        cache = self._credentials_cache
+        key = (tokens["client_id"], tokens["refresh_token"])
+        cached = cache.pop(key, None)
+        if cached is not None and cached.token == tokens.get("access_token"):
+            cache[key] = cached
+            return cached
+
+        credentials = self._build_credentials(tokens)
+        cache[key] = credentials
+        while len(cache) > CREDENTIALS_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        return credentials
+
+    @staticmethod
+    def _build_credentials(tokens: dict) -> Credentials:
+        """
+        Build Google OAuth2 credentials from a tokens dict.
+
+        Args:
+            tokens: Tokens loaded from Secrets Manager.
+
+        Returns:
+            Credentials for the YouTube upload scope, with expiry set from the
+            stored token_expiry when known.
+        """
+        credentials = Credentials(
+            token=tokens.get("access_token"),
+            refresh_token=tokens.get("refresh_token"),
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id=tokens.get("client_id"),
+            client_secret=tokens.get("client_secret"),
+            scopes=["https://www.googleapis.com/auth/youtube.upload"],
+        )
+
+        token_expiry = tokens.get("token_expiry")
+        if token_expiry:
+            expiry = datetime.fromisoformat(token_expiry)
+            if expiry.tzinfo is not None:
+                # google-auth compares expiry as naive UTC
+                expiry = expiry.astimezone(UTC).replace(tzinfo=None)
+            credentials.expiry = expiry
+
+        return credentials
+
+    @classmethod
+    def _get_refresh_lock(cls, secret_name: str) -> threading.Lock:
+        """Return the process-wide refresh lock for a secret."""
+        with cls._refresh_locks_guard:
+            return cls._refresh_locks.setdefault(secret_name, threading.Lock())
+
+    def _refresh_serialized(self, credentials: Credentials, tokens: dict) -> Credentials:
+        """
+        Refresh credentials while holding the per-secret refresh lock.
+
+        An uncontended caller refreshes straight away. A caller that had to
+        wait for another refresh re-reads the secret first and reuses the
+        token the lock holder stored, so N concurrent callers cost one
+        OAuth round-trip instead of N (and never reuse a spent refresh token).
+
+        Args:
+            credentials: Expired credentials.
+            tokens: Tokens the credentials were built from.
+
+        Returns:
+            Valid credentials.
+
+        Raises:
+            YouTubeAuthError: If token refresh fails.
+        """
+        lock = self._get_refresh_lock(self.secret_name)
+
+        if lock.acquire(blocking=False):
+            try:
+                return self.refresh_token(credentials, tokens)
+            finally:
+                lock.release()
+
+        logger.info("Token refresh already in progress, waiting")
+        with lock:
+            refreshed = self._load_refreshed_credentials(tokens)
+            if refreshed is not None:
+                logger.info("Reusing access token refreshed by another caller")
+                return refreshed
+            return self.refresh_token(credentials, tokens)
+
+    def _load_refreshed_credentials(self, stale_tokens: dict) -> Credentials | None:
+        """
+        Re-read the secret and return its credentials if they were refreshed.
+
+        Args:
+            stale_tokens: Tokens that were found to be expired.
+
+        Returns:
+            Valid credentials if the stored token_expiry has moved on, else None.
+        """
+        # The lock holder persists in the background; let its write land first
+        wait_for_pending_persists()
+        self.secrets_client.clear_cache(self.secret_name)
+        latest = self.secrets_client.get_youtube_oauth_tokens(self.secret_name)
+
+        token_expiry = latest.get("token_expiry")
+        if not token_expiry or token_expiry == stale_tokens.get("token_expiry"):
+            return None
+
+        credentials = self._get_credentials(latest)
+        return credentials if credentials.valid else None
+
+    def _schedule_proactive_refresh(self) -> None:
+        """Refresh the cached credentials in the background once near expiry."""
+        credentials = self._cached_credentials
+        if credentials is None or not credentials.refresh_token:
+            return
+        if self._is_token_fresh(credentials, PROACTIVE_REFRESH_WINDOW_SECONDS):
+            return
+        if self._proactive_refresh is not None and not self._proactive_refresh.done():
+            return
+
+        logger.info("Access token nearing expiry, refreshing in background")
+        self._proactive_refresh = _refresh_executor.submit(
+            self._refresh_ahead, credentials, self._cached_tokens or {}
+        )
+        self._proactive_refresh.add_done_callback(_log_proactive_refresh_result)
+
+    def _refresh_ahead(self, credentials: Credentials, tokens: dict) -> None:
+        """
+        Refresh still-valid credentials in place under the refresh lock.
+
+        The cached service's authorized HTTP client holds this same
+        credentials object, so refreshing in place swaps its token without
+        rebuilding the service. Skipped if another caller is already
+        refreshing this secret.
+
+        Args:
+            credentials: Cached credentials to refresh.
+            tokens: Tokens the credentials were built from.
+        """
+        lock = self._get_refresh_lock(self.secret_name)
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            self.refresh_token(credentials, tokens)
+        finally:
+            lock.release()
+
+    @staticmethod
+    def _is_token_fresh(credentials: Credentials | None, min_ttl_seconds: float) -> bool:
+        """
+        Check whether credentials are valid for at least min_ttl_seconds more.
+
+        Uses the expiry timestamp rather than credentials.valid, which
+        google-auth already reports as False once the token is within its own
+        refresh threshold (several minutes) of expiry. Credentials without an
+        expiry are treated like google-auth does: valid until the API rejects
+        them (the authorized HTTP client then refreshes).
+
+        Args:
+            credentials: Credentials to check.
+            min_ttl_seconds: Minimum remaining lifetime required.
+
+        Returns:
+            True if the credentials can be used without refreshing.
+        """
+        if credentials is None or not credentials.token:
+            return False
+
+        expiry = credentials.expiry
+        if expiry is None:
+            return True
+
+        # google-auth stores expiry as naive UTC
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=UTC)
+        remaining: float = (expiry - datetime.now(UTC)).total_seconds()
+        return remaining > min_ttl_seconds
+
+    def refresh_token(self, credentials: Credentials, current_tokens: dict) -> Credentials:
         """
         Refresh the OAuth access token.
 
         Args:
             credentials: Google OAuth2 credentials to refresh.
+            current_tokens: Secret contents already loaded by the caller; updated
+                in place with the new access token and written back in the
+                background (see wait_for_pending_persists). Write failures are
+                logged, not raised.
 
         Returns:
             Updated credentials with new access token.
@@ -140,12 +461,12 @@ class YouTubeAuthManager:
         Raises:
             YouTubeAuthError: If token refresh fails.
         """
-        logger.info("Refreshing OAuth access token")
+        logger.debug("Refreshing OAuth access token")
 
         try:
             # Force refresh
-            credentials.refresh(Request())
-            logger.info("Token refreshed successfully")
+            credentials.refresh(self._auth_request)
+            logger.debug("Token refreshed successfully")
 
         except RefreshError as e:
             logger.error(
@@ -165,36 +486,17 @@ class YouTubeAuthManager:
             )
             raise YouTubeAuthError("Failed to refresh access token") from e
 
-        # Store updated tokens in Secrets Manager
-        try:
-            # Load current secret data to preserve all fields
-            current_tokens = self.secrets_client.get_youtube_oauth_tokens(
-                self.secret_name
-            )
-
-            # Update with new access token
-            current_tokens["access_token"] = credentials.token
-
-            # Update expiry if available
-            if credentials.expiry:
-                current_tokens["token_expiry"] = credentials.expiry.isoformat()
-
-            # Store back to Secrets Manager
-            self.secrets_client.update_secret_json(self.secret_name, current_tokens)
+        # Update with new access token and expiry, then store back to
+        # Secrets Manager in the background
+        current_tokens["access_token"] = credentials.token
+        if credentials.expiry:
+            current_tokens["token_expiry"] = credentials.expiry.isoformat()
 
-            logger.info("Updated access token stored in Secrets Manager")
-
-        except Exception as e:
-            logger.error(
-                "Failed to update access token in Secrets Manager",
-                extra={"error": str(e)},
-                exc_info=True,
-            )
-            # Don't raise - the token refresh succeeded, we just failed to persist it
-            # The refreshed credentials are still valid for this session
-            logger.warning(
-                "Token refresh succeeded but failed to persist to Secrets Manager. "
-                "The refreshed token will be used for this session only."
-            )
+        future = _persist_executor.submit(
+            self.secrets_client.update_secret_json,
+            self.secret_name,
+            dict(current_tokens),
+        )
+        future.add_done_callback(_log_persist_result)
 
         return credentials
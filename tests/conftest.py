@@ -1,19 +1,37 @@
 """Shared pytest fixtures and mock data for manga-video-pipeline tests."""
 
-import json
+import functools
+import importlib.util
 import os
+import sys
+from collections.abc import Generator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Generator
+from types import SimpleNamespace
+from typing import Any, NamedTuple
 from unittest.mock import MagicMock, patch
 
 import boto3
+import orjson
 import pytest
+from botocore.config import Config
 from moto import mock_aws
 
-# Fix for Python 3.13+ missing audioop module (required by pydub)
-import sys
-if "pydub" not in sys.modules:
+from src.common.models import (
+    AudioManifest,
+    AudioSegment,
+    ChapterInfo,
+    JobRecord,
+    JobStatus,
+    MangaInfo,
+    PipelineSettings,
+    ScriptDocument,
+    ScriptSegment,
+)
+
+# Fix for Python 3.13+ missing audioop module (required by pydub); only stub
+# it when it is genuinely unavailable so the real module is never shadowed
+if importlib.util.find_spec("audioop") is None:
     sys.modules["audioop"] = MagicMock()
 
 
@@ -28,25 +46,33 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 # Helper Functions
 # =============================================================================
 
+@functools.cache
 def load_fixture(filename: str) -> dict[str, Any]:
-    """Load a JSON fixture file."""
-    with open(FIXTURES_DIR / filename, encoding="utf-8") as f:
-        return json.load(f)
+    """Load a JSON fixture file (parsed once per session; treat as read-only)."""
+    return orjson.loads((FIXTURES_DIR / filename).read_bytes())
 
 
 # =============================================================================
 # Environment Fixtures
 # =============================================================================
 
-@pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Set required environment variables for all tests."""
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-southeast-1")
-    monkeypatch.setenv("S3_BUCKET", "test-manga-pipeline-bucket")
+TEST_ENV_VARS: dict[str, str] = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": "ap-southeast-1",
+    "S3_BUCKET": "test-manga-pipeline-bucket",
+}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Set required environment variables once for the whole session.
+
+    Values are forced (not setdefault) so real AWS credentials in the
+    developer's shell are never used by tests.
+    """
+    os.environ.update(TEST_ENV_VARS)
 
 
 # =============================================================================
@@ -54,182 +80,229 @@ def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
 # =============================================================================
 
 @pytest.fixture
-def mock_settings() -> MagicMock:
-    """Return a mock Settings object for testing."""
-    settings = MagicMock()
-    settings.aws_region = "ap-southeast-1"
-    settings.s3_bucket = "test-manga-pipeline-bucket"
-    settings.dynamodb_jobs_table = "manga_jobs"
-    settings.dynamodb_manga_table = "processed_manga"
-    settings.dynamodb_settings_table = "settings"
-    settings.deepinfra_secret_name = "manga-pipeline/deepinfra-api-key"
-    settings.youtube_secret_name = "manga-pipeline/youtube-oauth"
-    settings.admin_secret_name = "manga-pipeline/admin-credentials"
-    settings.mangadex_base_url = "https://api.mangadex.org"
-    settings.deepinfra_base_url = "https://api.deepinfra.com/v1/openai"
-    settings.default_voice_id = "vi-VN-HoaiMyNeural"
-    settings.default_tone = "engaging and informative"
-    settings.default_daily_quota = 1
-    settings.daily_quota = 10
-    return settings
+def mock_settings() -> SimpleNamespace:
+    """Return a stand-in Settings object for testing.
+
+    A plain namespace rather than a MagicMock, so a misspelled setting raises
+    AttributeError instead of silently returning a child mock.
+    """
+    return SimpleNamespace(
+        aws_region="ap-southeast-1",
+        s3_bucket="test-manga-pipeline-bucket",
+        dynamodb_jobs_table="manga_jobs",
+        dynamodb_manga_table="processed_manga",
+        dynamodb_settings_table="settings",
+        deepinfra_secret_name="manga-pipeline/deepinfra-api-key",
+        youtube_secret_name="manga-pipeline/youtube-oauth",
+        admin_secret_name="manga-pipeline/admin-credentials",
+        mangadex_base_url="https://api.mangadex.org",
+        deepinfra_base_url="https://api.deepinfra.com/v1/openai",
+        default_voice_id="vi-VN-HoaiMyNeural",
+        default_tone="engaging and informative",
+        default_daily_quota=1,
+        daily_quota=10,
+    )
 
 
 # =============================================================================
 # AWS Mock Fixtures
 # =============================================================================
 
-@pytest.fixture
-def mock_dynamodb() -> Generator[boto3.resource, None, None]:
-    """Create mocked DynamoDB with all required tables."""
-    with mock_aws():
-        dynamodb = boto3.resource("dynamodb", region_name="ap-southeast-1")
-
-        # Create manga_jobs table
-        dynamodb.create_table(
-            TableName="manga_jobs",
-            KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
-            AttributeDefinitions=[
-                {"AttributeName": "job_id", "AttributeType": "S"},
-                {"AttributeName": "status", "AttributeType": "S"},
-                {"AttributeName": "created_at", "AttributeType": "S"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "status-created-index",
-                    "KeySchema": [
-                        {"AttributeName": "status", "KeyType": "HASH"},
-                        {"AttributeName": "created_at", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                    "ProvisionedThroughput": {
-                        "ReadCapacityUnits": 5,
-                        "WriteCapacityUnits": 5,
-                    },
-                }
-            ],
-            BillingMode="PAY_PER_REQUEST",
-        )
-
-        # Create processed_manga table
-        dynamodb.create_table(
-            TableName="processed_manga",
-            KeySchema=[
-                {"AttributeName": "manga_id", "KeyType": "HASH"},
-                {"AttributeName": "chapter_id", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "manga_id", "AttributeType": "S"},
-                {"AttributeName": "chapter_id", "AttributeType": "S"},
-            ],
-            BillingMode="PAY_PER_REQUEST",
-        )
+# One moto mock and one set of boto3 clients are shared by the session; the
+# in-memory backend is wiped and re-seeded for every test.
+
+TEST_BUCKET = "test-manga-pipeline-bucket"
+
+# manga_jobs is created without its status-created-index GSI, which no test
+# queries; tests that need it use mock_aws_services_with_gsi.
+TEST_TABLES: list[dict[str, Any]] = [
+    {
+        "TableName": "manga_jobs",
+        "KeySchema": [{"AttributeName": "job_id", "KeyType": "HASH"}],
+        "AttributeDefinitions": [
+            {"AttributeName": "job_id", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+    {
+        "TableName": "processed_manga",
+        "KeySchema": [
+            {"AttributeName": "manga_id", "KeyType": "HASH"},
+            {"AttributeName": "chapter_id", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "manga_id", "AttributeType": "S"},
+            {"AttributeName": "chapter_id", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+    {
+        "TableName": "settings",
+        "KeySchema": [{"AttributeName": "setting_key", "KeyType": "HASH"}],
+        "AttributeDefinitions": [
+            {"AttributeName": "setting_key", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+]
+
+TEST_SECRETS: dict[str, dict[str, Any]] = {
+    # DeepInfra API key
+    "manga-pipeline/deepinfra-api-key": {"api_key": "test-deepinfra-api-key-12345"},
+    # YouTube OAuth credentials
+    "manga-pipeline/youtube-oauth": {
+        "client_id": "test-client-id.apps.googleusercontent.com",
+        "client_secret": "test-client-secret",
+        "access_token": "test-access-token",
+        "refresh_token": "test-refresh-token",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "expiry": "2025-12-31T23:59:59Z",
+    },
+    # Admin credentials
+    "manga-pipeline/admin-credentials": {
+        "username": "admin",
+        # bcrypt hash of "test-password"
+        "password_hash": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4.IAPkU1o3iiYfDa",
+    },
+    # JWT secret
+    "manga-pipeline/jwt-secret": {
+        "secret_key": "test-jwt-secret-key-for-testing-only",
+        "algorithm": "HS256",
+    },
+}
+
+# Serialized once; every test re-seeds the secrets from these strings
+TEST_SECRET_STRINGS: dict[str, str] = {
+    name: orjson.dumps(value).decode() for name, value in TEST_SECRETS.items()
+}
+
+TEST_SSM_PARAMETERS: list[dict[str, str]] = [
+    {
+        "Name": "/manga-video-pipeline/renderer/current-job-id",
+        "Value": "test-job-123",
+        "Type": "String",
+    },
+    {
+        "Name": "/manga-video-pipeline/renderer/task-token",
+        "Value": "test-task-token",
+        "Type": "SecureString",
+    },
+]
+
+
+# moto never fails transiently, so a failing call should fail the test at once
+# instead of being retried with backoff. The larger pool lets threads in a
+# test share one client without waiting for a connection.
+AWS_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 1, "mode": "standard"},
+    max_pool_connections=32,
+)
+
+
+class AWSBackend(NamedTuple):
+    """boto3 handles onto the shared moto backend."""
+
+    dynamodb: Any
+    dynamodb_client: Any
+    s3: Any
+    secretsmanager: Any
+    ssm: Any
+
+
+def _provision_aws(backend: AWSBackend) -> None:
+    """Create the test tables, bucket, secrets and parameters on an empty backend."""
+    for table in TEST_TABLES:
+        backend.dynamodb.meta.client.create_table(**table)
+
+    backend.s3.create_bucket(
+        Bucket=TEST_BUCKET,
+        CreateBucketConfiguration={"LocationConstraint": "ap-southeast-1"},
+    )
 
-        # Create settings table
-        dynamodb.create_table(
-            TableName="settings",
-            KeySchema=[{"AttributeName": "setting_key", "KeyType": "HASH"}],
-            AttributeDefinitions=[
-                {"AttributeName": "setting_key", "AttributeType": "S"},
-            ],
-            BillingMode="PAY_PER_REQUEST",
+    for name, secret_string in TEST_SECRET_STRINGS.items():
+        backend.secretsmanager.create_secret(Name=name, SecretString=secret_string)
+
+    for parameter in TEST_SSM_PARAMETERS:
+        backend.ssm.put_parameter(**parameter)
+
+
+@pytest.fixture(scope="session")
+def aws_backend() -> Generator[tuple[Any, AWSBackend], None, None]:
+    """Create one moto mock and one set of boto3 clients for the whole session.
+
+    The mock is only active while a test uses it (see aws_session), so tests
+    that open their own mock_aws() are unaffected.
+    """
+    aws_mock = mock_aws()
+    aws_mock.start()
+    try:
+        client_kwargs = {"region_name": "ap-southeast-1", "config": AWS_CLIENT_CONFIG}
+        backend = AWSBackend(
+            dynamodb=boto3.resource("dynamodb", **client_kwargs),
+            dynamodb_client=boto3.client("dynamodb", **client_kwargs),
+            s3=boto3.client("s3", **client_kwargs),
+            secretsmanager=boto3.client("secretsmanager", **client_kwargs),
+            ssm=boto3.client("ssm", **client_kwargs),
         )
+    finally:
+        aws_mock.stop(remove_data=False)
 
-        yield dynamodb
+    yield aws_mock, backend
 
 
 @pytest.fixture
-def mock_s3() -> Generator[boto3.client, None, None]:
-    """Create mocked S3 with test bucket."""
-    with mock_aws():
-        s3 = boto3.client("s3", region_name="ap-southeast-1")
-
-        # Create test bucket
-        s3.create_bucket(
-            Bucket="test-manga-pipeline-bucket",
-            CreateBucketConfiguration={"LocationConstraint": "ap-southeast-1"},
-        )
-
-        yield s3
+def aws_session(aws_backend: tuple[Any, AWSBackend]) -> Generator[AWSBackend, None, None]:
+    """Activate the shared moto mock for one test, wiped and freshly seeded.
+
+    Wiping the in-memory backends (what moto server's /moto-api/reset does)
+    and re-creating the fixtures takes a handful of calls, far fewer than
+    scanning and deleting every item, object, secret and parameter. The
+    data is kept on stop, because stop(remove_data=True) resets every moto
+    backend again.
+    """
+    aws_mock, backend = aws_backend
+    aws_mock.start(reset=False)
+    try:
+        aws_mock.reset()
+        _provision_aws(backend)
+        yield backend
+    finally:
+        aws_mock.stop(remove_data=False)
 
 
 @pytest.fixture
-def mock_secrets() -> Generator[boto3.client, None, None]:
-    """Create mocked Secrets Manager with test secrets."""
-    with mock_aws():
-        secrets = boto3.client("secretsmanager", region_name="ap-southeast-1")
-
-        # DeepInfra API key
-        secrets.create_secret(
-            Name="manga-pipeline/deepinfra-api-key",
-            SecretString=json.dumps({"api_key": "test-deepinfra-api-key-12345"}),
-        )
+def mock_dynamodb(aws_session: AWSBackend) -> boto3.resource:
+    """Return mocked DynamoDB with all required tables."""
+    return aws_session.dynamodb
 
-        # YouTube OAuth credentials
-        secrets.create_secret(
-            Name="manga-pipeline/youtube-oauth",
-            SecretString=json.dumps({
-                "client_id": "test-client-id.apps.googleusercontent.com",
-                "client_secret": "test-client-secret",
-                "access_token": "test-access-token",
-                "refresh_token": "test-refresh-token",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "expiry": "2025-12-31T23:59:59Z",
-            }),
-        )
 
-        # Admin credentials
-        secrets.create_secret(
-            Name="manga-pipeline/admin-credentials",
-            SecretString=json.dumps({
-                "username": "admin",
-                # bcrypt hash of "test-password"
-                "password_hash": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4.IAPkU1o3iiYfDa",
-            }),
-        )
-
-        # JWT secret
-        secrets.create_secret(
-            Name="manga-pipeline/jwt-secret",
-            SecretString=json.dumps({
-                "secret_key": "test-jwt-secret-key-for-testing-only",
-                "algorithm": "HS256",
-            }),
-        )
-
-        yield secrets
+@pytest.fixture
+def mock_s3(aws_session: AWSBackend) -> boto3.client:
+    """Return mocked S3 with test bucket."""
+    return aws_session.s3
 
 
 @pytest.fixture
-def mock_ssm() -> Generator[boto3.client, None, None]:
-    """Create mocked SSM Parameter Store."""
-    with mock_aws():
-        ssm = boto3.client("ssm", region_name="ap-southeast-1")
-
-        # Create test parameters
-        ssm.put_parameter(
-            Name="/manga-video-pipeline/renderer/current-job-id",
-            Value="test-job-123",
-            Type="String",
-        )
+def mock_secrets(aws_session: AWSBackend) -> boto3.client:
+    """Return mocked Secrets Manager with test secrets."""
+    return aws_session.secretsmanager
 
-        ssm.put_parameter(
-            Name="/manga-video-pipeline/renderer/task-token",
-            Value="test-task-token",
-            Type="SecureString",
-        )
 
-        yield ssm
+@pytest.fixture
+def mock_ssm(aws_session: AWSBackend) -> boto3.client:
+    """Return mocked SSM Parameter Store with test parameters."""
+    return aws_session.ssm
 
 
 # =============================================================================
 # Sample Data Fixtures
 # =============================================================================
 
-@pytest.fixture
+# Built once per session and shared between tests; copy before mutating.
+
+@pytest.fixture(scope="session")
 def sample_manga_info() -> dict[str, Any]:
     """Return sample MangaInfo with 3 chapters, 5 pages each."""
-    from src.common.models import ChapterInfo, MangaInfo
-
     chapters = []
     for i in range(1, 4):
         chapter = ChapterInfo(
@@ -255,11 +328,9 @@ def sample_manga_info() -> dict[str, Any]:
     return manga.model_dump()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_record() -> dict[str, Any]:
     """Return sample JobRecord in pending status."""
-    from src.common.models import JobRecord, JobStatus
-
     job = JobRecord(
         job_id="job-2024-01-15-abc123",
         manga_id="manga-uuid-12345",
@@ -275,11 +346,9 @@ def sample_job_record() -> dict[str, Any]:
     return job.model_dump()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_script_document() -> dict[str, Any]:
     """Return sample ScriptDocument with 3 segments."""
-    from src.common.models import ScriptDocument, ScriptSegment
-
     segments = [
         ScriptSegment(
             chapter="Chương 1",
@@ -315,11 +384,9 @@ def sample_script_document() -> dict[str, Any]:
     return script.model_dump()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_manifest() -> dict[str, Any]:
     """Return sample AudioManifest with 3 segments."""
-    from src.common.models import AudioManifest, AudioSegment
-
     segments = [
         AudioSegment(
             index=0,
@@ -356,11 +423,9 @@ def sample_audio_manifest() -> dict[str, Any]:
     return manifest.model_dump()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pipeline_settings() -> dict[str, Any]:
     """Return sample PipelineSettings."""
-    from src.common.models import PipelineSettings
-
     settings = PipelineSettings(
         daily_quota=5,
         voice_id="vi-VN-HoaiMyNeural",
@@ -375,25 +440,25 @@ def sample_pipeline_settings() -> dict[str, Any]:
 # API Response Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mangadex_trending_response() -> dict[str, Any]:
     """Load MangaDex trending API response fixture."""
     return load_fixture("mangadex_trending.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mangadex_chapters_response() -> dict[str, Any]:
     """Load MangaDex chapters API response fixture."""
     return load_fixture("mangadex_chapters.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mangadex_pages_response() -> dict[str, Any]:
     """Load MangaDex at-home/pages API response fixture."""
     return load_fixture("mangadex_pages.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def deepinfra_response() -> dict[str, Any]:
     """Load DeepInfra LLM response fixture."""
     return load_fixture("deepinfra_response.json")
@@ -403,18 +468,16 @@ def deepinfra_response() -> dict[str, Any]:
 # File Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_panel_path() -> Path:
     """Return path to sample panel image."""
     return FIXTURES_DIR / "sample_panel.jpg"
 
 
-@pytest.fixture
-def sample_panel_bytes() -> bytes:
-    """Return sample panel image as bytes."""
-    panel_path = FIXTURES_DIR / "sample_panel.jpg"
-    with open(panel_path, "rb") as f:
-        return f.read()
+@pytest.fixture(scope="session")
+def sample_panel_bytes(sample_panel_path: Path) -> bytes:
+    """Return sample panel image as bytes (read once; bytes are immutable)."""
+    return sample_panel_path.read_bytes()
 
 
 # =============================================================================
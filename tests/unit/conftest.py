@@ -0,0 +1,48 @@
+"""Shared fixtures for unit tests."""
+
+import importlib.util
+import sys
+from collections.abc import Generator
+from functools import lru_cache
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Stub pydub at collection time, before any test module imports the renderer,
+# but only when it is not installed so the real package is never shadowed
+# (on Python 3.13+ tests/conftest.py already stubs the audioop it needs)
+if importlib.util.find_spec("pydub") is None:
+    sys.modules["pydub"] = MagicMock()
+    sys.modules["pydub.AudioSegment"] = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def _audio_segment_patch() -> Generator[MagicMock, None, None]:
+    """Patch the audio merger's AudioSegment once per test module."""
+    with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment:
+        yield mock_audio_segment
+
+
+@pytest.fixture
+def mock_audio_segment(_audio_segment_patch: MagicMock) -> MagicMock:
+    """Provide the patched AudioSegment, reset for each test."""
+    _audio_segment_patch.reset_mock(return_value=True, side_effect=True)
+    return _audio_segment_patch
+
+
+@pytest.fixture(scope="module")
+def _cached_verify_token() -> Generator[None, None, None]:
+    """Memoize the auth middleware's JWT verification for one test module.
+
+    Keyed on (token, secret_key), so each distinct token is decoded once and
+    repeated authenticated requests reuse the username. Test tokens expire
+    hours after the module finishes, so a cached result never outlives them.
+    The patch is undone when the module ends, so only modules that request
+    this fixture see it. Tests that import verify_token directly still get
+    the uncached function.
+    """
+    from src.dashboard import auth
+
+    cached = lru_cache(maxsize=1024)(auth.verify_token)
+    with patch.object(auth, "verify_token", cached):
+        yield
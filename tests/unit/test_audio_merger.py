@@ -1,26 +1,64 @@
 """Tests for audio merger."""
 
 import os
-import sys
 import tempfile
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
+from urllib.parse import urlsplit
 
 import pytest
-
-# Mock pydub before importing AudioMerger to avoid audioop issues
-sys.modules["pydub"] = MagicMock()
-sys.modules["pydub.AudioSegment"] = MagicMock()
+from botocore.stub import Stubber
 
 from src.common.models import AudioManifest, AudioSegment
+from src.common.storage import S3Client
 from src.renderer.audio_merger import AudioMerger
 
 
+def _mock_pydub_segment(duration_ms: int, raw_data: bytes = b"") -> MagicMock:
+    """Build a pydub AudioSegment mock with a fixed duration and sample format."""
+    segment = MagicMock()
+    segment.__len__.return_value = duration_ms
+    segment.raw_data = raw_data
+    segment.sample_width = 2
+    segment.frame_rate = 24000
+    segment.channels = 1
+    return segment
+
+
+def _setup_pydub_mocks(
+    mock_audio_segment: MagicMock, segment_lengths: list[int]
+) -> tuple[list[MagicMock], MagicMock]:
+    """Make the patched AudioSegment load one segment per length and combine them.
+
+    Returns:
+        The loaded segment mocks and the combined segment that gets exported.
+    """
+    segments = [_mock_pydub_segment(length) for length in segment_lengths]
+    mock_combined = _mock_pydub_segment(sum(segment_lengths))
+    mock_audio_segment.from_file.side_effect = segments
+    mock_audio_segment.return_value = mock_combined
+    return segments, mock_combined
+
+
 @pytest.fixture
 def audio_merger():
     """Create an AudioMerger instance."""
     return AudioMerger()
 
 
+@pytest.fixture
+def stubbed_s3_client():
+    """Create a real S3Client whose API calls fail unless explicitly stubbed.
+
+    Presigning is computed locally, so merges that only presign URLs need no
+    stubbed responses; any S3 request (e.g. a segment download) fails fast.
+    """
+    settings = MagicMock(s3_bucket="test-bucket", aws_region="ap-southeast-1")
+    s3_client = S3Client(settings)
+    with Stubber(s3_client._client) as stubber:
+        yield s3_client
+        stubber.assert_no_pending_responses()
+
+
 @pytest.fixture
 def sample_audio_manifest():
     """Create a sample audio manifest."""
@@ -68,7 +106,7 @@ class TestAudioMergerInitialization:
 class TestMergeAudioFiles:
     """Tests for merge_audio_files method."""
 
-    def test_merges_files_with_pydub(self, audio_merger):
+    def test_merges_files_with_pydub(self, audio_merger, mock_audio_segment):
         """Test merging audio files with pydub."""
         audio_paths = [
             "/fake/audio1.mp3",
@@ -76,52 +114,45 @@ class TestMergeAudioFiles:
             "/fake/audio3.mp3",
         ]
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
-
-            # Mock audio segments
-            mock_segment1 = MagicMock()
-            mock_segment1.__len__.return_value = 3500  # 3.5 seconds in ms
-
-            mock_segment2 = MagicMock()
-            mock_segment2.__len__.return_value = 4200  # 4.2 seconds
+        # Mock audio segments
+        mock_segment1 = _mock_pydub_segment(3500, b"one")  # 3.5 seconds
+        mock_segment2 = _mock_pydub_segment(4200, b"two")  # 4.2 seconds
+        mock_segment3 = _mock_pydub_segment(3800, b"three")  # 3.8 seconds
 
-            mock_segment3 = MagicMock()
-            mock_segment3.__len__.return_value = 3800  # 3.8 seconds
+        # Mock combined segment built from the joined raw data
+        mock_combined = _mock_pydub_segment(11500)  # Total
+        mock_audio_segment.return_value = mock_combined
 
-            # Mock combined segment
-            mock_combined = MagicMock()
-            mock_combined.__len__.return_value = 11500  # Total
-            mock_combined.export = MagicMock()
-
-            # Set up addition behavior (both __add__ and __iadd__ for +=)
-            mock_segment1.__add__.return_value = mock_combined
-            mock_segment1.__iadd__ = lambda self, other: mock_combined
-            mock_combined.__add__.return_value = mock_combined
-            mock_combined.__iadd__ = lambda self, other: mock_combined
+        mock_audio_segment.from_file.side_effect = [
+            mock_segment1,
+            mock_segment2,
+            mock_segment3,
+        ]
 
-            mock_audio_segment.from_mp3.side_effect = [
-                mock_segment1,
-                mock_segment2,
-                mock_segment3,
-            ]
+        duration = audio_merger.merge_audio_files(
+            audio_paths=audio_paths,
+            output_path="/fake/output.mp3",
+            force_pydub=True,
+        )
 
-            duration = audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.mp3",
-                use_ffmpeg=False,
-            )
+        # Verify all files were loaded
+        assert mock_audio_segment.from_file.call_count == 3
 
-            # Verify all files were loaded
-            assert mock_audio_segment.from_mp3.call_count == 3
+        # Verify the combined segment was built once from the joined samples
+        mock_audio_segment.assert_called_once_with(
+            data=b"onetwothree",
+            sample_width=2,
+            frame_rate=24000,
+            channels=1,
+        )
 
-            # Verify export was called
-            mock_combined.export.assert_called_once()
+        # Verify export was called
+        mock_combined.export.assert_called_once()
 
-            # Verify duration (11500ms = 11.5s)
-            assert duration == 11.5
+        # Verify duration (11500ms = 11.5s)
+        assert duration == 11.5
 
-    def test_merges_files_in_correct_order(self, audio_merger):
+    def test_merges_files_in_correct_order(self, audio_merger, mock_audio_segment):
         """Test that files are merged in the correct order."""
         audio_paths = [
             "/fake/audio1.mp3",
@@ -129,92 +160,114 @@ class TestMergeAudioFiles:
             "/fake/audio3.mp3",
         ]
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
-
-            mock_segment1 = MagicMock()
-            mock_segment1.__len__ = MagicMock(return_value=1000)
-
-            mock_segment2 = MagicMock()
-            mock_segment2.__len__ = MagicMock(return_value=2000)
-
-            mock_segment3 = MagicMock()
-            mock_segment3.__len__ = MagicMock(return_value=3000)
+        mock_segment1 = _mock_pydub_segment(1000, b"1")
+        mock_segment2 = _mock_pydub_segment(2000, b"2")
+        mock_segment3 = _mock_pydub_segment(3000, b"3")
+        mock_audio_segment.return_value = _mock_pydub_segment(6000)
 
-            mock_combined = MagicMock()
-            mock_combined.__len__ = MagicMock(return_value=6000)
-            mock_combined.export = MagicMock()
-
-            mock_segment1.__add__ = MagicMock(return_value=mock_combined)
-            mock_combined.__add__ = MagicMock(return_value=mock_combined)
+        mock_audio_segment.from_file.side_effect = [
+            mock_segment1,
+            mock_segment2,
+            mock_segment3,
+        ]
 
-            mock_audio_segment.from_mp3.side_effect = [
-                mock_segment1,
-                mock_segment2,
-                mock_segment3,
-            ]
+        audio_merger.merge_audio_files(
+            audio_paths=audio_paths,
+            output_path="/fake/output.mp3",
+            force_pydub=True,
+        )
 
-            audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.mp3",
-                use_ffmpeg=False,
+        # Verify files loaded in order
+        calls = mock_audio_segment.from_file.call_args_list
+        assert calls[0][0][0] == "/fake/audio1.mp3"
+        assert calls[1][0][0] == "/fake/audio2.mp3"
+        assert calls[2][0][0] == "/fake/audio3.mp3"
+
+        # Verify samples were joined in the same order
+        assert mock_audio_segment.call_args[1]["data"] == b"123"
+
+    @pytest.mark.parametrize(
+        "audio_path,output_path,expected_args",
+        [
+            # Different container: converted by the WAV muxer
+            (
+                "/fake/audio1.mp3",
+                "/fake/output.wav",
+                ["-i", "/fake/audio1.mp3", "/fake/output.wav"],
+            ),
+            # Same container over HTTPS: stream copy
+            (
+                "https://s3/audio1.mp3?sig=1",
+                "/fake/output.mp3",
+                ["-i", "https://s3/audio1.mp3?sig=1", "-c", "copy", "/fake/output.mp3"],
+            ),
+        ],
+    )
+    def test_single_file_uses_one_ffmpeg_call(
+        self, audio_merger, mock_audio_segment, audio_path, output_path, expected_args
+    ):
+        """Test that a single input is converted by FFmpeg instead of pydub."""
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess:
+            duration = audio_merger.merge_audio_files(
+                audio_paths=[audio_path],
+                output_path=output_path,
+                expected_duration=3.5,
             )
 
-            # Verify files loaded in order
-            calls = mock_audio_segment.from_mp3.call_args_list
-            assert calls[0][0][0] == "/fake/audio1.mp3"
-            assert calls[1][0][0] == "/fake/audio2.mp3"
-            assert calls[2][0][0] == "/fake/audio3.mp3"
-
-    def test_exports_with_correct_format(self, audio_merger):
-        """Test that output is exported with correct format."""
-        audio_paths = ["/fake/audio1.mp3"]
+        mock_subprocess.assert_called_once()
+        ffmpeg_args = mock_subprocess.call_args[0][0]
+        assert ffmpeg_args[0] == "ffmpeg"
+        assert ffmpeg_args[-len(expected_args):] == expected_args
+        assert duration == 3.5
+        mock_audio_segment.from_file.assert_not_called()
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+    def test_single_local_file_in_output_format_is_copied(self, audio_merger, tmp_path):
+        """Test that a single local file already in the output format is copied."""
+        source = tmp_path / "audio1.mp3"
+        source.write_bytes(b"mp3 data")
+        output = tmp_path / "output.mp3"
 
-            mock_segment = MagicMock()
-            mock_segment.__len__ = MagicMock(return_value=1000)
-            mock_segment.export = MagicMock()
-
-            mock_audio_segment.from_mp3.return_value = mock_segment
-
-            # Test MP3 output
-            audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.mp3",
-                use_ffmpeg=False,
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess:
+            duration = audio_merger.merge_audio_files(
+                audio_paths=[str(source)],
+                output_path=str(output),
+                expected_duration=3.5,
             )
 
-            export_call = mock_segment.export.call_args
-            assert export_call[0][0] == "/fake/output.mp3"
-            assert export_call[1]["format"] == "mp3"
-            assert export_call[1]["bitrate"] == "192k"
+        mock_subprocess.assert_not_called()
+        assert output.read_bytes() == b"mp3 data"
+        assert duration == 3.5
 
-    def test_exports_wav_format(self, audio_merger):
-        """Test exporting as WAV format."""
-        audio_paths = ["/fake/audio1.mp3"]
+    def test_converts_mismatched_sample_format(self, audio_merger, mock_audio_segment):
+        """Test that segments are converted to the first segment's sample format."""
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+        mock_segment1 = _mock_pydub_segment(1000, b"mono")
+        mock_segment2 = _mock_pydub_segment(1000, b"stereo")
+        mock_segment2.frame_rate = 44100
+        mock_segment2.channels = 2
 
-            mock_segment = MagicMock()
-            mock_segment.__len__ = MagicMock(return_value=1000)
-            mock_segment.export = MagicMock()
+        converted = _mock_pydub_segment(1000, b"converted")
+        (
+            mock_segment2.set_sample_width.return_value
+            .set_frame_rate.return_value
+            .set_channels.return_value
+        ) = converted
 
-            mock_audio_segment.from_mp3.return_value = mock_segment
+        mock_audio_segment.from_file.side_effect = [mock_segment1, mock_segment2]
+        mock_audio_segment.return_value = _mock_pydub_segment(2000)
 
-            # Test WAV output
-            audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.wav",
-                use_ffmpeg=False,
-            )
+        audio_merger.merge_audio_files(
+            audio_paths=["/fake/audio1.wav", "/fake/audio2.wav"],
+            output_path="/fake/output.wav",
+            force_pydub=True,
+        )
 
-            export_call = mock_segment.export.call_args
-            assert export_call[0][0] == "/fake/output.wav"
-            assert export_call[1]["format"] == "wav"
-            assert export_call[1]["bitrate"] is None  # No bitrate for WAV
+        mock_segment2.set_sample_width.assert_called_once_with(2)
+        mock_segment2.set_sample_width.return_value.set_frame_rate.assert_called_once_with(
+            24000
+        )
+        assert mock_audio_segment.call_args[1]["data"] == b"monoconverted"
+        mock_segment1.set_sample_width.assert_not_called()
 
     def test_raises_error_on_empty_list(self, audio_merger):
         """Test that error is raised when no files provided."""
@@ -233,7 +286,6 @@ class TestMergeAudioFiles:
 
         with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
              patch("builtins.open", mock_open()) as mock_file, \
-             patch("os.path.getsize", return_value=1024 * 1024), \
              patch("os.unlink"):
 
             # Mock ffprobe output
@@ -244,7 +296,6 @@ class TestMergeAudioFiles:
             duration = audio_merger.merge_audio_files(
                 audio_paths=audio_paths,
                 output_path="/fake/output.mp3",
-                use_ffmpeg=True,
             )
 
             # Verify FFmpeg was called (2 calls: concat + probe)
@@ -256,6 +307,12 @@ class TestMergeAudioFiles:
             assert "-f" in first_call[0][0]
             assert "concat" in first_call[0][0]
 
+            # Verify streams are copied, not re-encoded, and output is overwritten
+            ffmpeg_args = first_call[0][0]
+            copy_index = ffmpeg_args.index("-c")
+            assert ffmpeg_args[copy_index + 1] == "copy"
+            assert "-y" in ffmpeg_args
+
             # Verify second call is ffprobe
             second_call = mock_subprocess.call_args_list[1]
             assert "ffprobe" in second_call[0][0]
@@ -264,48 +321,128 @@ class TestMergeAudioFiles:
             assert duration == 12.5
 
 
+    def test_ffmpeg_reads_presigned_urls(self, audio_merger):
+        """Test that URL inputs are stream-copied with network protocols allowed."""
+        audio_paths = [
+            "https://bucket.s3.amazonaws.com/jobs/a.mp3?X-Amz-Signature=abc",
+            "https://bucket.s3.amazonaws.com/jobs/b.mp3?X-Amz-Signature=def",
+        ]
+
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch("builtins.open", mock_open()) as mock_file, \
+             patch("os.unlink"):
+
+            mock_subprocess.return_value = MagicMock(stdout="10.0\n")
+
+            audio_merger.merge_audio_files(
+                audio_paths=audio_paths,
+                output_path="/fake/output.mp3",
+            )
+
+            ffmpeg_args = mock_subprocess.call_args_list[0][0][0]
+            whitelist = ffmpeg_args[ffmpeg_args.index("-protocol_whitelist") + 1]
+            assert "https" in whitelist.split(",")
+
+            written = "".join(c[0][0] for c in mock_file().write.call_args_list)
+            assert f"file '{audio_paths[0]}'\n" in written
+
+    def test_ffmpeg_escapes_quotes_in_paths(self, audio_merger):
+        """Test that single quotes in paths are escaped in the concat list."""
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch("builtins.open", mock_open()) as mock_file, \
+             patch("os.unlink"):
+
+            mock_subprocess.return_value = MagicMock(stdout="1.0\n")
+
+            audio_merger.merge_audio_files(
+                audio_paths=["/fake/it's.mp3", "/fake/next.mp3"],
+                output_path="/fake/output.mp3",
+            )
+
+            assert mock_file().write.call_args_list[0] == call("file '/fake/it'\\''s.mp3'\n")
+
+    def test_uses_ffmpeg_by_default_for_matching_formats(self, audio_merger):
+        """Test that MP3 inputs merged into MP3 are stream-copied with FFmpeg."""
+        with patch.object(audio_merger, "_merge_with_ffmpeg", return_value=5.0) as mock_ffmpeg, \
+             patch.object(audio_merger, "_merge_with_pydub") as mock_pydub:
+
+            audio_merger.merge_audio_files(
+                audio_paths=["/fake/audio1.mp3", "/fake/audio2.MP3"],
+                output_path="/fake/output.mp3",
+            )
+
+            mock_ffmpeg.assert_called_once()
+            mock_pydub.assert_not_called()
+
+    def test_falls_back_to_pydub_for_mixed_formats(self, audio_merger):
+        """Test that inputs in different formats are re-encoded with pydub."""
+        with patch.object(audio_merger, "_merge_with_ffmpeg") as mock_ffmpeg, \
+             patch.object(audio_merger, "_merge_with_pydub", return_value=5.0) as mock_pydub:
+
+            audio_merger.merge_audio_files(
+                audio_paths=["/fake/audio1.mp3", "/fake/audio2.wav"],
+                output_path="/fake/output.mp3",
+            )
+
+            mock_pydub.assert_called_once()
+            mock_ffmpeg.assert_not_called()
+
+    def test_force_pydub_skips_ffmpeg(self, audio_merger):
+        """Test that force_pydub merges with pydub even for matching formats."""
+        with patch.object(audio_merger, "_merge_with_ffmpeg") as mock_ffmpeg, \
+             patch.object(audio_merger, "_merge_with_pydub", return_value=5.0) as mock_pydub:
+
+            audio_merger.merge_audio_files(
+                audio_paths=["/fake/audio1.mp3"],
+                output_path="/fake/output.mp3",
+                force_pydub=True,
+            )
+
+            mock_pydub.assert_called_once()
+            mock_ffmpeg.assert_not_called()
+
+
 class TestMergeFromS3:
     """Tests for merge_from_s3 method."""
 
-    def test_downloads_all_segments(self, audio_merger, sample_audio_manifest):
-        """Test that all segments are downloaded from S3."""
-        mock_s3_client = MagicMock()
-
+    def test_presigns_all_segments(
+        self, audio_merger, sample_audio_manifest, stubbed_s3_client
+    ):
+        """Test that every segment is read from a presigned URL, not downloaded."""
         with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
              patch("os.makedirs"), \
-             patch("os.unlink"):
+             patch("os.replace"):
 
             mock_merge.return_value = 11.5
 
-            output_path, duration = audio_merger.merge_from_s3(
+            audio_merger.merge_from_s3(
                 audio_manifest=sample_audio_manifest,
-                s3_client=mock_s3_client,
+                s3_client=stubbed_s3_client,
                 job_id="job-123",
                 local_dir="/fake/dir",
             )
 
-            # Verify all 3 segments were downloaded
-            assert mock_s3_client.download_file.call_count == 3
+            # Verify the merged URLs are presigned GETs for each segment, in order
+            urls = [urlsplit(url) for url in mock_merge.call_args[1]["audio_paths"]]
+            expected_keys = [segment.s3_key for segment in sample_audio_manifest.segments]
+            assert len(urls) == len(expected_keys)
+            for url, key in zip(urls, expected_keys, strict=True):
+                assert url.path.endswith(key)
+                assert "Signature=" in url.query
 
-            # Verify downloads in correct order
-            calls = mock_s3_client.download_file.call_args_list
-            assert calls[0][0][0] == "jobs/job-123/audio/0000.mp3"
-            assert calls[1][0][0] == "jobs/job-123/audio/0001.mp3"
-            assert calls[2][0][0] == "jobs/job-123/audio/0002.mp3"
-
-    def test_merges_downloaded_files(self, audio_merger, sample_audio_manifest):
-        """Test that downloaded files are merged."""
-        mock_s3_client = MagicMock()
+    def test_merges_segments(self, audio_merger, sample_audio_manifest, stubbed_s3_client):
+        """Test that the segments are merged into one file."""
 
         with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
              patch("os.makedirs"), \
-             patch("os.unlink"):
+             patch("os.unlink"), \
+             patch("os.replace"):
 
             mock_merge.return_value = 11.5
 
             output_path, duration = audio_merger.merge_from_s3(
                 audio_manifest=sample_audio_manifest,
-                s3_client=mock_s3_client,
+                s3_client=stubbed_s3_client,
                 job_id="job-123",
                 local_dir="/fake/dir",
             )
@@ -319,115 +456,69 @@ class TestMergeFromS3:
             # Verify duration returned
             assert duration == 11.5
 
-    def test_uses_ffmpeg_for_long_audio(self, audio_merger):
-        """Test that FFmpeg is used for audio > 1 hour."""
-        # Create manifest with long duration
-        long_manifest = AudioManifest(
-            job_id="job-123",
-            segments=[
-                AudioSegment(
-                    index=i,
-                    s3_key=f"jobs/job-123/audio/{i:04d}.mp3",
-                    duration_seconds=60.0,
-                    chapter="1",
-                    panel_start=i * 2,
-                    panel_end=i * 2 + 1,
-                )
-                for i in range(100)  # 100 segments * 60s = 6000s > 1 hour
-            ],
-            total_duration_seconds=6000.0,
-        )
-
-        mock_s3_client = MagicMock()
+    def test_always_uses_ffmpeg_for_mp3(
+        self, audio_merger, sample_audio_manifest, mock_audio_segment, stubbed_s3_client
+    ):
+        """Test that MP3 segments are stream-copied by FFmpeg, never merged with pydub."""
 
-        with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch("builtins.open", mock_open()), \
              patch("os.makedirs"), \
-             patch("os.unlink"):
-
-            mock_merge.return_value = 6000.0
+             patch("os.unlink"), \
+             patch("os.replace"):
 
-            audio_merger.merge_from_s3(
-                audio_manifest=long_manifest,
-                s3_client=mock_s3_client,
+            _, duration = audio_merger.merge_from_s3(
+                audio_manifest=sample_audio_manifest,
+                s3_client=stubbed_s3_client,
                 job_id="job-123",
                 local_dir="/fake/dir",
             )
 
-            # Verify merge was called with use_ffmpeg=True
-            call_kwargs = mock_merge.call_args[1]
-            assert call_kwargs["use_ffmpeg"] is True
-
-    def test_uses_ffmpeg_for_many_segments(self, audio_merger):
-        """Test that FFmpeg is used for > 100 segments."""
-        # Create manifest with many segments
-        many_segments_manifest = AudioManifest(
-            job_id="job-123",
-            segments=[
-                AudioSegment(
-                    index=i,
-                    s3_key=f"jobs/job-123/audio/{i:04d}.mp3",
-                    duration_seconds=5.0,
-                    chapter="1",
-                    panel_start=i * 2,
-                    panel_end=i * 2 + 1,
-                )
-                for i in range(150)  # > 100 segments
-            ],
-            total_duration_seconds=750.0,
-        )
-
-        mock_s3_client = MagicMock()
-
-        with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
-             patch("os.makedirs"), \
-             patch("os.unlink"):
-
-            mock_merge.return_value = 750.0
-
-            audio_merger.merge_from_s3(
-                audio_manifest=many_segments_manifest,
-                s3_client=mock_s3_client,
-                job_id="job-123",
-                local_dir="/fake/dir",
-            )
+            # A single ffmpeg stream copy; the manifest total replaces ffprobe
+            mock_subprocess.assert_called_once()
+            ffmpeg_args = mock_subprocess.call_args[0][0]
+            assert ffmpeg_args[0] == "ffmpeg"
+            assert ffmpeg_args[ffmpeg_args.index("-c") + 1] == "copy"
+            assert duration == 11.5
 
-            # Verify merge was called with use_ffmpeg=True
-            call_kwargs = mock_merge.call_args[1]
-            assert call_kwargs["use_ffmpeg"] is True
+            mock_audio_segment.from_file.assert_not_called()
 
-    def test_cleans_up_segment_files(self, audio_merger, sample_audio_manifest):
-        """Test that individual segment files are cleaned up."""
-        mock_s3_client = MagicMock()
+    def test_leaves_no_segment_files_to_clean_up(
+        self, audio_merger, sample_audio_manifest, stubbed_s3_client
+    ):
+        """Test that no per-segment temp files are created or deleted."""
 
         with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
              patch("os.makedirs"), \
-             patch("os.unlink") as mock_unlink:
+             patch("os.unlink") as mock_unlink, \
+             patch("os.replace"):
 
             mock_merge.return_value = 11.5
 
             audio_merger.merge_from_s3(
                 audio_manifest=sample_audio_manifest,
-                s3_client=mock_s3_client,
+                s3_client=stubbed_s3_client,
                 job_id="job-123",
                 local_dir="/fake/dir",
             )
 
-            # Verify segment files were deleted (3 segments)
-            assert mock_unlink.call_count == 3
+            mock_unlink.assert_not_called()
 
-    def test_creates_local_directory(self, audio_merger, sample_audio_manifest):
+    def test_creates_local_directory(
+        self, audio_merger, sample_audio_manifest, stubbed_s3_client
+    ):
         """Test that local directory is created if it doesn't exist."""
-        mock_s3_client = MagicMock()
 
         with patch.object(audio_merger, "merge_audio_files") as mock_merge, \
              patch("os.makedirs") as mock_makedirs, \
-             patch("os.unlink"):
+             patch("os.unlink"), \
+             patch("os.replace"):
 
             mock_merge.return_value = 11.5
 
             audio_merger.merge_from_s3(
                 audio_manifest=sample_audio_manifest,
-                s3_client=mock_s3_client,
+                s3_client=stubbed_s3_client,
                 job_id="job-123",
                 local_dir="/fake/dir",
             )
@@ -435,11 +526,53 @@ class TestMergeFromS3:
             # Verify directory was created
             mock_makedirs.assert_called_once_with("/fake/dir", exist_ok=True)
 
+    def test_reuses_existing_output(
+        self, audio_merger, sample_audio_manifest, stubbed_s3_client, tmp_path
+    ):
+        """Test that a merged file from an earlier attempt is returned without merging."""
+        existing = tmp_path / "job-123_merged.mp3"
+        existing.write_bytes(b"merged audio")
+
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch.object(stubbed_s3_client, "get_presigned_url") as mock_presign:
+            output_path, duration = audio_merger.merge_from_s3(
+                audio_manifest=sample_audio_manifest,
+                s3_client=stubbed_s3_client,
+                job_id="job-123",
+                local_dir=str(tmp_path),
+            )
+
+        mock_subprocess.assert_not_called()
+        mock_presign.assert_not_called()
+        assert output_path == str(existing)
+        assert duration == 11.5
+
+    def test_moves_output_into_place_after_merge(
+        self, audio_merger, sample_audio_manifest, stubbed_s3_client, tmp_path
+    ):
+        """Test that the merge writes a partial file that is renamed when done."""
+        def fake_merge(audio_paths, output_path, **kwargs):
+            with open(output_path, "wb") as f:
+                f.write(b"merged audio")
+            return 11.5
+
+        with patch.object(audio_merger, "merge_audio_files", side_effect=fake_merge):
+            output_path, _ = audio_merger.merge_from_s3(
+                audio_manifest=sample_audio_manifest,
+                s3_client=stubbed_s3_client,
+                job_id="job-123",
+                local_dir=str(tmp_path),
+            )
+
+        assert output_path == str(tmp_path / "job-123_merged.mp3")
+        assert (tmp_path / "job-123_merged.mp3").read_bytes() == b"merged audio"
+        assert not (tmp_path / "job-123_merged.part.mp3").exists()
+
 
 class TestDurationCalculation:
     """Tests for duration calculation."""
 
-    def test_duration_matches_sum_of_segments(self, audio_merger):
+    def test_duration_matches_sum_of_segments(self, audio_merger, mock_audio_segment):
         """Test that total duration matches sum of individual segments."""
         audio_paths = [
             "/fake/audio1.mp3",
@@ -447,43 +580,28 @@ class TestDurationCalculation:
             "/fake/audio3.mp3",
         ]
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
-
-            # Segments with specific durations
-            mock_segment1 = MagicMock()
-            mock_segment1.__len__.return_value = 2500  # 2.5s
+        # Segments with specific durations
+        mock_segment1 = _mock_pydub_segment(2500)  # 2.5s
+        mock_segment2 = _mock_pydub_segment(3500)  # 3.5s
+        mock_segment3 = _mock_pydub_segment(4000)  # 4.0s
 
-            mock_segment2 = MagicMock()
-            mock_segment2.__len__.return_value = 3500  # 3.5s
+        # Combined should be sum
+        mock_audio_segment.return_value = _mock_pydub_segment(10000)  # 10.0s total
 
-            mock_segment3 = MagicMock()
-            mock_segment3.__len__.return_value = 4000  # 4.0s
-
-            # Combined should be sum
-            mock_combined = MagicMock()
-            mock_combined.__len__.return_value = 10000  # 10.0s total
-            mock_combined.export = MagicMock()
-
-            mock_segment1.__add__.return_value = mock_combined
-            mock_segment1.__iadd__ = lambda self, other: mock_combined
-            mock_combined.__add__.return_value = mock_combined
-            mock_combined.__iadd__ = lambda self, other: mock_combined
-
-            mock_audio_segment.from_mp3.side_effect = [
-                mock_segment1,
-                mock_segment2,
-                mock_segment3,
-            ]
+        mock_audio_segment.from_file.side_effect = [
+            mock_segment1,
+            mock_segment2,
+            mock_segment3,
+        ]
 
-            duration = audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.mp3",
-                use_ffmpeg=False,
-            )
+        duration = audio_merger.merge_audio_files(
+            audio_paths=audio_paths,
+            output_path="/fake/output.mp3",
+            force_pydub=True,
+        )
 
-            # Total should be 10.0 seconds
-            assert duration == 10.0
+        # Total should be 10.0 seconds
+        assert duration == 10.0
 
     def test_duration_with_ffmpeg(self, audio_merger):
         """Test duration calculation with FFmpeg."""
@@ -491,7 +609,6 @@ class TestDurationCalculation:
 
         with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
              patch("builtins.open", mock_open()), \
-             patch("os.path.getsize", return_value=1024 * 1024), \
              patch("os.unlink"):
 
             # Mock ffprobe to return specific duration
@@ -502,7 +619,6 @@ class TestDurationCalculation:
             duration = audio_merger.merge_audio_files(
                 audio_paths=audio_paths,
                 output_path="/fake/output.mp3",
-                use_ffmpeg=True,
             )
 
             # Verify ffprobe was used to get duration
@@ -512,91 +628,97 @@ class TestDurationCalculation:
             # Verify duration
             assert duration == 25.75
 
+    def test_expected_duration_skips_ffprobe(self, audio_merger):
+        """Test that a known duration is returned without running ffprobe."""
+        audio_paths = ["/fake/audio1.mp3", "/fake/audio2.mp3"]
 
-class TestOutputFormat:
-    """Tests for output format validation."""
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch("builtins.open", mock_open()), \
+             patch("os.unlink"):
 
-    def test_mp3_output_is_valid(self, audio_merger):
-        """Test that MP3 output format is correct."""
-        audio_paths = ["/fake/audio1.mp3"]
+            duration = audio_merger.merge_audio_files(
+                audio_paths=audio_paths,
+                output_path="/fake/output.mp3",
+                expected_duration=25.0,
+            )
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+            # Only the ffmpeg concat runs
+            assert mock_subprocess.call_count == 1
+            assert mock_subprocess.call_args[0][0][0] == "ffmpeg"
+            assert duration == 25.0
 
-            mock_segment = MagicMock()
-            mock_segment.__len__ = MagicMock(return_value=1000)
-            mock_segment.export = MagicMock()
+    def test_verify_probes_despite_expected_duration(self, audio_merger):
+        """Test that verify=True measures the output with ffprobe."""
+        audio_paths = ["/fake/audio1.mp3", "/fake/audio2.mp3"]
 
-            mock_audio_segment.from_mp3.return_value = mock_segment
+        with patch("src.renderer.audio_merger.subprocess.run") as mock_subprocess, \
+             patch("builtins.open", mock_open()), \
+             patch("os.unlink"):
 
-            audio_merger.merge_audio_files(
+            mock_result = MagicMock()
+            mock_result.stdout = "25.75\n"
+            mock_subprocess.return_value = mock_result
+
+            duration = audio_merger.merge_audio_files(
                 audio_paths=audio_paths,
                 output_path="/fake/output.mp3",
-                use_ffmpeg=False,
+                expected_duration=25.0,
+                verify=True,
             )
 
-            # Verify export format
-            export_call = mock_segment.export.call_args
-            assert export_call[1]["format"] == "mp3"
-
-    def test_defaults_to_mp3_for_unknown_format(self, audio_merger):
-        """Test that unknown formats default to MP3."""
-        audio_paths = ["/fake/audio1.mp3"]
-
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+            assert "ffprobe" in mock_subprocess.call_args_list[1][0][0]
+            assert duration == 25.75
 
-            mock_segment = MagicMock()
-            mock_segment.__len__ = MagicMock(return_value=1000)
-            mock_segment.export = MagicMock()
 
-            mock_audio_segment.from_mp3.return_value = mock_segment
+class TestOutputFormat:
+    """Tests for output format validation."""
 
-            audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.xyz",  # Unknown format
-                use_ffmpeg=False,
-            )
+    @pytest.mark.parametrize(
+        "output_path,expected_format,expected_bitrate",
+        [
+            ("/fake/output.mp3", "mp3", "192k"),
+            ("/fake/output.wav", "wav", None),  # No bitrate for WAV
+            ("/fake/output.xyz", "mp3", "192k"),  # Unknown formats default to MP3
+        ],
+    )
+    def test_exports_in_output_format(
+        self, audio_merger, mock_audio_segment, output_path, expected_format, expected_bitrate
+    ):
+        """Test that the output is exported in the format its extension names."""
+        _, mock_combined = _setup_pydub_mocks(mock_audio_segment, [1000])
+
+        audio_merger.merge_audio_files(
+            audio_paths=["/fake/audio1.mp3"],
+            output_path=output_path,
+            force_pydub=True,
+        )
 
-            # Should default to mp3
-            export_call = mock_segment.export.call_args
-            assert export_call[1]["format"] == "mp3"
+        export_call = mock_combined.export.call_args
+        assert export_call[0][0] == output_path
+        assert export_call[1]["format"] == expected_format
+        assert export_call[1]["bitrate"] == expected_bitrate
 
 
 class TestProgressLogging:
     """Tests for progress logging."""
 
-    def test_logs_progress_for_many_segments(self, audio_merger):
+    def test_logs_progress_for_many_segments(self, audio_merger, mock_audio_segment):
         """Test that progress is logged when processing many segments."""
         # Create 25 audio paths
         audio_paths = [f"/fake/audio{i}.mp3" for i in range(25)]
 
-        with patch("src.renderer.audio_merger.AudioSegment") as mock_audio_segment, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+        mock_audio_segment.from_file.return_value = _mock_pydub_segment(1000)
+        mock_audio_segment.return_value = _mock_pydub_segment(25000)
 
-            mock_segment = MagicMock()
-            mock_segment.__len__.return_value = 1000
-
-            mock_combined = MagicMock()
-            mock_combined.__len__.return_value = 25000
-            mock_combined.export = MagicMock()
-
-            mock_segment.__add__.return_value = mock_combined
-            mock_segment.__iadd__ = lambda self, other: mock_combined
-            mock_combined.__add__.return_value = mock_combined
-            mock_combined.__iadd__ = lambda self, other: mock_combined
-
-            mock_audio_segment.from_mp3.return_value = mock_segment
-
-            # Should process without errors and log progress
-            duration = audio_merger.merge_audio_files(
-                audio_paths=audio_paths,
-                output_path="/fake/output.mp3",
-                use_ffmpeg=False,
-            )
+        # Should process without errors and log progress
+        duration = audio_merger.merge_audio_files(
+            audio_paths=audio_paths,
+            output_path="/fake/output.mp3",
+            force_pydub=True,
+        )
 
-            # Verify all files were loaded
-            assert mock_audio_segment.from_mp3.call_count == 25
+        # Verify all files were loaded
+        assert mock_audio_segment.from_file.call_count == 25
 
-            # Verify duration
-            assert duration == 25.0
+        # Verify duration
+        assert duration == 25.0
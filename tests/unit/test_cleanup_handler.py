@@ -1,24 +1,16 @@
 """Unit tests for the cleanup Lambda handler."""
 
-import json
-from datetime import UTC, datetime
+import math
 from unittest.mock import MagicMock, patch
 
-import boto3
 import pytest
-from moto import mock_aws
+from botocore.exceptions import ClientError
 
 from src.cleanup.handler import handler
 
-
-@pytest.fixture
-def aws_credentials(monkeypatch):
-    """Mock AWS credentials for moto."""
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+# Resources seeded on the shared moto backend by tests/conftest.py
+TEST_BUCKET = "test-manga-pipeline-bucket"
+JOBS_TABLE = "manga_jobs"
 
 
 @pytest.fixture
@@ -26,49 +18,33 @@ def mock_settings():
     """Mock settings."""
     with patch("src.cleanup.handler.get_settings") as mock:
         settings = MagicMock()
-        settings.s3_bucket = "test-bucket"
-        settings.aws_region = "us-east-1"
-        settings.dynamodb_jobs_table = "test-jobs-table"
+        settings.s3_bucket = TEST_BUCKET
+        settings.aws_region = "ap-southeast-1"
+        settings.dynamodb_jobs_table = JOBS_TABLE
         mock.return_value = settings
         yield settings
 
 
 @pytest.fixture
-def s3_client(aws_credentials, mock_settings):
-    """Create a mock S3 client with bucket."""
-    with mock_aws():
-        s3 = boto3.client("s3", region_name="us-east-1")
-        s3.create_bucket(Bucket="test-bucket")
-        yield s3
-
-
-@pytest.fixture
-def dynamodb_client(aws_credentials, mock_settings):
-    """Create a mock DynamoDB client with table."""
-    with mock_aws():
-        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-        dynamodb.create_table(
-            TableName="test-jobs-table",
-            KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
-            AttributeDefinitions=[{"AttributeName": "job_id", "AttributeType": "S"}],
-            BillingMode="PAY_PER_REQUEST",
-        )
-        yield dynamodb
+def s3_client(aws_session, mock_settings):
+    """S3 client on the shared moto backend, with the test bucket."""
+    return aws_session.s3
 
 
 @pytest.fixture
-def mock_db_client(dynamodb_client):
+def mock_db_client():
     """Mock DynamoDB client for handler."""
     with patch("src.cleanup.handler.DynamoDBClient") as mock_class:
         mock_instance = MagicMock()
-        mock_instance._client = dynamodb_client
-        mock_instance._table_name = "test-jobs-table"
 
         # Mock get_job to return a job record
         mock_job = MagicMock()
         mock_job.job_id = "test-job-123"
+        mock_job.manga_id = "manga-123"
+        mock_job.manga_title = "Test Manga"
         mock_job.status = "completed"
         mock_instance.get_job.return_value = mock_job
+        mock_instance.mark_job_cleaned_up.return_value = True
 
         mock_class.return_value = mock_instance
         yield mock_instance
@@ -82,8 +58,8 @@ def mock_s3_client(s3_client):
 
         # Create real S3Client instance with mocked boto3
         settings = MagicMock()
-        settings.s3_bucket = "test-bucket"
-        settings.aws_region = "us-east-1"
+        settings.s3_bucket = TEST_BUCKET
+        settings.aws_region = "ap-southeast-1"
 
         with patch("src.common.storage.boto3.client", return_value=s3_client):
             real_client = S3Client(settings)
@@ -98,17 +74,17 @@ def test_handler_deletes_objects_correctly(
     # Create test objects in S3
     job_id = "test-job-123"
     s3_client.put_object(
-        Bucket="test-bucket",
+        Bucket=TEST_BUCKET,
         Key=f"jobs/{job_id}/panel_manifest.json",
         Body=b'{"test": "data"}',
     )
     s3_client.put_object(
-        Bucket="test-bucket",
+        Bucket=TEST_BUCKET,
         Key=f"jobs/{job_id}/audio/segment_0.mp3",
         Body=b"audio data here",
     )
     s3_client.put_object(
-        Bucket="test-bucket",
+        Bucket=TEST_BUCKET,
         Key=f"jobs/{job_id}/video.mp4",
         Body=b"video data here",
     )
@@ -123,10 +99,25 @@ def test_handler_deletes_objects_correctly(
     assert result["bytes_freed"] > 0
 
     # Verify objects are deleted
-    response = s3_client.list_objects_v2(Bucket="test-bucket", Prefix=f"jobs/{job_id}/")
+    response = s3_client.list_objects_v2(Bucket=TEST_BUCKET, Prefix=f"jobs/{job_id}/")
     assert "Contents" not in response or len(response.get("Contents", [])) == 0
 
 
+def test_handler_batches_deletes(mock_settings, mock_db_client, mock_s3_client, s3_client):
+    """Test that handler deletes objects with one DeleteObjects call per 1000 keys."""
+    job_id = "test-job-batch"
+    for i in range(5):
+        s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/seg_{i}.mp3", Body=b"x")
+
+    with patch.object(
+        mock_s3_client._client, "delete_objects", wraps=mock_s3_client._client.delete_objects
+    ) as delete_spy:
+        result = handler({"job_id": job_id}, None)
+
+    assert result["objects_deleted"] == 5
+    assert delete_spy.call_count == math.ceil(5 / 1000)
+
+
 def test_handler_already_clean_prefix_returns_success(
     mock_settings, mock_db_client, mock_s3_client
 ):
@@ -145,39 +136,19 @@ def test_handler_already_clean_prefix_returns_success(
 
 
 def test_handler_updates_job_record(mock_settings, mock_db_client, mock_s3_client, s3_client):
-    """Test that handler updates job record with cleanup_at timestamp."""
+    """Test that handler records the cleanup and marks the manga processed."""
     job_id = "test-job-789"
 
-    # Create a job record in DynamoDB
-    dynamodb = mock_db_client._client
-    dynamodb.put_item(
-        TableName="test-jobs-table",
-        Item={
-            "job_id": {"S": job_id},
-            "status": {"S": "completed"},
-            "created_at": {"S": datetime.now(UTC).isoformat()},
-        },
-    )
-
     # Call handler
     event = {"job_id": job_id}
-    result = handler(event, None)
+    handler(event, None)
 
-    # Verify job record was updated
-    response = dynamodb.get_item(
-        TableName="test-jobs-table",
-        Key={"job_id": {"S": job_id}},
+    mock_db_client.mark_job_cleaned_up.assert_called_once_with(job_id)
+    mock_db_client.mark_manga_processed.assert_called_once_with(
+        manga_id="manga-123",
+        title="Test Manga",
     )
 
-    assert "Item" in response
-    item = response["Item"]
-    assert "cleanup_at" in item
-    assert "updated_at" in item
-
-    # Verify cleanup_at is a valid ISO timestamp
-    cleanup_at = datetime.fromisoformat(item["cleanup_at"]["S"])
-    assert cleanup_at.tzinfo is not None
-
 
 def test_handler_counts_bytes_correctly(
     mock_settings, mock_db_client, mock_s3_client, s3_client
@@ -190,9 +161,9 @@ def test_handler_counts_bytes_correctly(
     data_2 = b"b" * 2000  # 2000 bytes
     data_3 = b"c" * 3000  # 3000 bytes
 
-    s3_client.put_object(Bucket="test-bucket", Key=f"jobs/{job_id}/file1.txt", Body=data_1)
-    s3_client.put_object(Bucket="test-bucket", Key=f"jobs/{job_id}/file2.txt", Body=data_2)
-    s3_client.put_object(Bucket="test-bucket", Key=f"jobs/{job_id}/file3.txt", Body=data_3)
+    s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/file1.txt", Body=data_1)
+    s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/file2.txt", Body=data_2)
+    s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/file3.txt", Body=data_3)
 
     # Call handler
     event = {"job_id": job_id}
@@ -203,6 +174,23 @@ def test_handler_counts_bytes_correctly(
     assert result["bytes_freed"] == 6000  # 1000 + 2000 + 3000
 
 
+def test_handler_sizes_objects_from_listing(
+    mock_settings, mock_db_client, mock_s3_client, s3_client
+):
+    """Test that bytes freed come from the listing, without a HEAD per object."""
+    job_id = "test-job-no-head"
+    for i in range(3):
+        s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/file{i}.txt", Body=b"x" * 10)
+
+    with patch.object(
+        mock_s3_client._client, "head_object", wraps=mock_s3_client._client.head_object
+    ) as head_spy:
+        result = handler({"job_id": job_id}, None)
+
+    assert result["bytes_freed"] == 30
+    assert head_spy.call_count == 0
+
+
 def test_handler_missing_job_id_raises_error(mock_settings, mock_db_client, mock_s3_client):
     """Test that handler raises error when job_id is missing."""
     event = {}
@@ -222,7 +210,7 @@ def test_handler_handles_job_not_found(
 
     # Create test object
     s3_client.put_object(
-        Bucket="test-bucket",
+        Bucket=TEST_BUCKET,
         Key=f"jobs/{job_id}/test.txt",
         Body=b"test data",
     )
@@ -236,30 +224,49 @@ def test_handler_handles_job_not_found(
     assert result["bytes_freed"] > 0
 
 
-def test_handler_handles_db_update_failure(
+def test_handler_tolerates_job_removed_before_update(
     mock_settings, mock_db_client, mock_s3_client, s3_client
 ):
-    """Test that handler handles DynamoDB update failure gracefully."""
+    """Test that handler succeeds when the job disappears before its conditional update."""
     job_id = "test-job-db-error"
 
     # Create test object
     s3_client.put_object(
-        Bucket="test-bucket",
+        Bucket=TEST_BUCKET,
         Key=f"jobs/{job_id}/test.txt",
         Body=b"test data",
     )
 
-    # Mock DynamoDB update to raise error using patch
-    with patch.object(
-        mock_db_client._client, "update_item", side_effect=Exception("DynamoDB error")
-    ):
-        # Call handler - should still succeed
-        event = {"job_id": job_id}
-        result = handler(event, None)
+    # The conditional write failed: the job record no longer exists
+    mock_db_client.mark_job_cleaned_up.return_value = False
+
+    # Call handler - should still succeed
+    event = {"job_id": job_id}
+    result = handler(event, None)
 
-    # Verify deletion still happened despite DB error
+    # Verify deletion still happened
     assert result["objects_deleted"] == 1
     assert result["bytes_freed"] > 0
 
     # Verify the handler completed successfully
     assert result["job_id"] == job_id
+
+
+def test_handler_propagates_non_retryable_db_errors(
+    mock_settings, mock_db_client, mock_s3_client, s3_client
+):
+    """Test that DynamoDB errors other than a failed condition fail the invocation."""
+    job_id = "test-job-db-denied"
+    s3_client.put_object(Bucket=TEST_BUCKET, Key=f"jobs/{job_id}/test.txt", Body=b"test data")
+
+    mock_db_client.mark_job_cleaned_up.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+        "UpdateItem",
+    )
+
+    with pytest.raises(ClientError):
+        handler({"job_id": job_id}, None)
+
+    # The S3 objects were already deleted, so a retry only repeats the update
+    response = s3_client.list_objects_v2(Bucket=TEST_BUCKET, Prefix=f"jobs/{job_id}/")
+    assert response.get("KeyCount", 0) == 0
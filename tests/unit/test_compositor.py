@@ -1,16 +1,31 @@
 """Tests for video compositor."""
 
+import io
 import os
+import subprocess
 import tempfile
-from unittest.mock import MagicMock, Mock, call, patch
+import time
+from unittest.mock import MagicMock, mock_open, patch
 
+import numpy as np
 import pytest
-from PIL import Image
+from PIL import Image, ImageOps
 
-from src.renderer.compositor import VideoCompositor
+from src.renderer.compositor import (
+    PANEL_CLIP_WORKERS,
+    VideoCompositor,
+    detect_h264_encoder,
+)
 from src.renderer.scene_builder import Scene
 
 
+@pytest.fixture(autouse=True)
+def software_encoder():
+    """Keep tests on libx264 whatever encoders the host has."""
+    with patch("src.renderer.compositor.detect_h264_encoder", return_value="libx264"):
+        yield
+
+
 @pytest.fixture
 def compositor():
     """Create a VideoCompositor instance."""
@@ -62,6 +77,23 @@ def temp_image():
         pass
 
 
+def _sequential_scenes(count, duration):
+    """Build count back-to-back scenes, each showing its own panel."""
+    return [
+        Scene(
+            panel_s3_key=f"jobs/job-123/panels/{i:04d}.jpg",
+            start_time=i * duration,
+            end_time=(i + 1) * duration,
+        )
+        for i in range(count)
+    ]
+
+
+def _render_panel_frame(compositor, image_path):
+    """Load a panel frame as a PIL image for pixel checks."""
+    return Image.fromarray(compositor.load_panel_frame(image_path))
+
+
 class TestVideoCompositorInitialization:
     """Tests for VideoCompositor initialization."""
 
@@ -80,6 +112,38 @@ class TestVideoCompositorInitialization:
         assert compositor.fps == 30
 
 
+class TestDetectH264Encoder:
+    """Tests for detect_h264_encoder function."""
+
+    def test_prefers_working_hardware_encoder(self):
+        """Test that the first hardware encoder that works is chosen."""
+
+        def probe(args, **kwargs):
+            if "h264_nvenc" in args:
+                raise subprocess.CalledProcessError(1, args)
+            return MagicMock(returncode=0)
+
+        with patch("src.renderer.compositor.subprocess.run", side_effect=probe) as mock_run:
+            assert detect_h264_encoder.__wrapped__() == "h264_qsv"
+
+        assert mock_run.call_count == 2
+
+    def test_falls_back_to_libx264(self):
+        """Test that libx264 is used when no hardware encoder works."""
+        with patch(
+            "src.renderer.compositor.subprocess.run", side_effect=FileNotFoundError("ffmpeg")
+        ):
+            assert detect_h264_encoder.__wrapped__() == "libx264"
+
+    def test_compositor_uses_detected_encoder(self):
+        """Test that the compositor picks up the detected encoder and its preset."""
+        with patch("src.renderer.compositor.detect_h264_encoder", return_value="h264_nvenc"):
+            compositor = VideoCompositor()
+
+        assert compositor.video_codec == "h264_nvenc"
+        assert compositor.video_preset == "p4"
+
+
 class TestCreatePanelClip:
     """Tests for create_panel_clip method."""
 
@@ -98,124 +162,134 @@ class TestCreatePanelClip:
 
     def test_resizes_image_to_fit_resolution(self, compositor, temp_image):
         """Test that image is resized to fit resolution."""
-        with patch("src.renderer.compositor.ImageClip") as mock_image_clip, \
-             patch("src.renderer.compositor.Image.open") as mock_open, \
-             patch("src.renderer.compositor.Image.new") as mock_new:
-
-            # Create mock image with specific size
-            mock_img = MagicMock()
-            mock_img.size = (800, 600)  # Smaller than target resolution
-            mock_open.return_value = mock_img
-
-            # Mock resize to return a proper PIL Image mock
-            mock_resized = MagicMock()
-            mock_resized.size = (1440, 1080)  # After resize
-            mock_img.resize.return_value = mock_resized
-
-            # Mock background
-            mock_background = MagicMock()
-            mock_new.return_value = mock_background
+        with patch("src.renderer.compositor.ImageClip"), \
+             patch(
+                 "src.renderer.compositor.ImageOps.pad", wraps=ImageOps.pad
+             ) as mock_pad:
 
             compositor.create_panel_clip(temp_image, duration=5.0)
 
-            # Verify image was opened
-            mock_open.assert_called_once_with(temp_image)
-
-            # Verify resize was called
-            assert mock_img.resize.called
+            # Verify resize and padding happen in a single call
+            mock_pad.assert_called_once()
+            call_args = mock_pad.call_args
+            assert call_args[0][0].size == (800, 600)
+            assert call_args[0][1] == (1920, 1080)
+            assert call_args[1]["method"] == Image.Resampling.LANCZOS
 
-    def test_pads_image_with_black_bars(self, compositor):
+    def test_pads_image_with_black_bars(self, compositor, tmp_path):
         """Test that image is padded with black bars to maintain aspect ratio."""
-        with patch("src.renderer.compositor.ImageClip") as mock_image_clip, \
-             patch("src.renderer.compositor.Image.open") as mock_open, \
-             patch("src.renderer.compositor.Image.new") as mock_new:
-
-            # Create mock image (portrait orientation)
-            mock_img = MagicMock()
-            mock_img.size = (800, 1200)  # Portrait
-            mock_open.return_value = mock_img
-
-            # Mock resize
-            mock_resized = MagicMock()
-            mock_img.resize.return_value = mock_resized
-
-            # Mock background
-            mock_background = MagicMock()
-            mock_new.return_value = mock_background
-
-            compositor.create_panel_clip("/fake/path.jpg", duration=5.0)
-
-            # Verify black background was created with target resolution
-            mock_new.assert_called_once_with("RGB", (1920, 1080), (0, 0, 0))
-
-            # Verify paste was called (to center image on background)
-            assert mock_background.paste.called
-
-    def test_handles_landscape_image(self, compositor):
+        # Portrait image
+        image_path = str(tmp_path / "portrait.png")
+        Image.new("RGB", (800, 1200), color=(255, 0, 0)).save(image_path)
+
+        with patch(
+            "src.renderer.compositor.ImageOps.pad", wraps=ImageOps.pad
+        ) as mock_pad:
+            frame = compositor.load_panel_frame(image_path)
+
+        # Verify image was letterboxed onto a black frame of target resolution
+        mock_pad.assert_called_once()
+        assert mock_pad.call_args[0][1] == (1920, 1080)
+        assert mock_pad.call_args[1] == {
+            "method": Image.Resampling.LANCZOS,
+            "color": (0, 0, 0),
+        }
+        assert frame.shape == (1080, 1920, 3)
+        assert frame[:, :600].max() == 0  # left bar
+        assert frame[:, -600:].max() == 0  # right bar
+
+    @pytest.mark.parametrize(("mode", "convert_calls"), [("RGB", 0), ("L", 1)])
+    def test_converts_only_non_rgb_images(self, compositor, tmp_path, mode, convert_calls):
+        """Test that RGB panels are padded without an extra conversion copy."""
+        image_path = str(tmp_path / "panel.png")
+        Image.new(mode, (800, 600)).save(image_path)
+
+        with patch.object(
+            Image.Image, "convert", autospec=True, side_effect=Image.Image.convert
+        ) as mock_convert:
+            frame = compositor.load_panel_frame(image_path)
+
+        assert mock_convert.call_count == convert_calls
+        assert frame.shape == (1080, 1920, 3)
+
+    def test_reduces_large_image_before_resampling(self, tmp_path):
+        """Test that a page much larger than the frame is shrunk before LANCZOS."""
+        compositor = VideoCompositor(resolution=(320, 180))
+        image_path = str(tmp_path / "large.png")
+        Image.new("RGB", (1280, 720), color=(255, 0, 0)).save(image_path)
+
+        with patch(
+            "src.renderer.compositor.ImageOps.pad", wraps=ImageOps.pad
+        ) as mock_pad:
+            frame = _render_panel_frame(compositor, image_path)
+
+        # 4x downscale: integer reduction to 2x the frame, LANCZOS for the rest
+        assert mock_pad.call_args[0][0].size == (640, 360)
+        assert frame.size == (320, 180)
+
+    @pytest.mark.parametrize(
+        ("size", "decoded_size"),
+        [
+            ((2560, 1440), (640, 360)),  # 1/4 scale covers the frame exactly
+            ((1200, 1800), (300, 450)),  # fitted to 240x360; 1/8 would be too small
+            ((640, 360), (640, 360)),  # already fits, decoded at full size
+        ],
+    )
+    def test_decodes_jpeg_at_reduced_scale(self, tmp_path, size, decoded_size):
+        """Test that JPEG pages are decoded at the smallest DCT scale covering the frame."""
+        compositor = VideoCompositor(resolution=(640, 360))
+        image_path = str(tmp_path / "page.jpg")
+        Image.new("RGB", size, color=(255, 0, 0)).save(image_path)
+
+        with patch(
+            "src.renderer.compositor.ImageOps.pad", wraps=ImageOps.pad
+        ) as mock_pad:
+            compositor.load_panel_frame(image_path)
+
+        assert mock_pad.call_args[0][0].size == decoded_size
+
+    def test_keeps_small_reductions_for_lanczos(self, tmp_path):
+        """Test that images under twice the reducing gap are not pre-reduced."""
+        compositor = VideoCompositor(resolution=(320, 180))
+        image_path = str(tmp_path / "medium.png")
+        Image.new("RGB", (1200, 675), color=(255, 0, 0)).save(image_path)
+
+        with patch(
+            "src.renderer.compositor.ImageOps.pad", wraps=ImageOps.pad
+        ) as mock_pad:
+            _render_panel_frame(compositor, image_path)
+
+        assert mock_pad.call_args[0][0].size == (1200, 675)
+
+    def test_handles_landscape_image(self, compositor, tmp_path):
         """Test handling of landscape-oriented image."""
-        with patch("src.renderer.compositor.ImageClip") as mock_image_clip, \
-             patch("src.renderer.compositor.Image.open") as mock_open, \
-             patch("src.renderer.compositor.Image.new") as mock_new:
-
-            # Wide landscape image
-            mock_img = MagicMock()
-            mock_img.size = (2000, 800)  # Landscape
-            mock_open.return_value = mock_img
-
-            mock_resized = MagicMock()
-            mock_resized.size = (1920, 768)  # After resize
-            mock_img.resize.return_value = mock_resized
-
-            # Mock background
-            mock_background = MagicMock()
-            mock_new.return_value = mock_background
-
-            compositor.create_panel_clip("/fake/path.jpg", duration=5.0)
-
-            # Should resize to fit within 1920x1080
-            # Width ratio: 1920/2000 = 0.96
-            # Height ratio: 1080/800 = 1.35
-            # Should use width ratio (0.96) to maintain aspect
-            expected_width = int(2000 * 0.96)
-            expected_height = int(800 * 0.96)
-
-            # Verify resize was called with correct dimensions
-            resize_call = mock_img.resize.call_args
-            new_width, new_height = resize_call[0][0]
-            assert new_width == expected_width
-            assert new_height == expected_height
-
-    def test_handles_portrait_image(self, compositor):
-        """Test handling of portrait-oriented image."""
-        with patch("src.renderer.compositor.ImageClip") as mock_image_clip, \
-             patch("src.renderer.compositor.Image.open") as mock_open, \
-             patch("src.renderer.compositor.Image.new") as mock_new:
+        # Wide landscape image
+        image_path = str(tmp_path / "landscape.png")
+        Image.new("RGB", (2000, 800), color=(255, 0, 0)).save(image_path)
 
-            # Tall portrait image
-            mock_img = MagicMock()
-            mock_img.size = (600, 1200)  # Portrait
-            mock_open.return_value = mock_img
+        frame = _render_panel_frame(compositor, image_path)
 
-            mock_resized = MagicMock()
-            mock_resized.size = (540, 1080)  # After resize
-            mock_img.resize.return_value = mock_resized
+        # Width ratio (0.96) wins: 1920x768 centered, 156px bars top and bottom
+        assert frame.size == (1920, 1080)
+        assert frame.getpixel((960, 100)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((960, 980)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((0, 540)) == (255, 0, 0)  # panel
+        assert frame.getpixel((1919, 540)) == (255, 0, 0)  # panel
 
-            # Mock background
-            mock_background = MagicMock()
-            mock_new.return_value = mock_background
-
-            compositor.create_panel_clip("/fake/path.jpg", duration=5.0)
+    def test_handles_portrait_image(self, compositor, tmp_path):
+        """Test handling of portrait-oriented image."""
+        # Tall portrait image
+        image_path = str(tmp_path / "portrait.png")
+        Image.new("RGB", (600, 1200), color=(255, 0, 0)).save(image_path)
 
-            # Height ratio: 1080/1200 = 0.9
-            # Width ratio: 1920/600 = 3.2
-            # Should use height ratio (0.9)
-            expected_width = int(600 * 0.9)
-            expected_height = int(1200 * 0.9)
+        frame = _render_panel_frame(compositor, image_path)
 
-            resize_call = mock_img.resize.call_args
-            new_width, new_height = resize_call[0][0]
-            assert new_width == expected_width
-            assert new_height == expected_height
+        # Height ratio (0.9) wins: 540x1080 centered, 690px bars left and right
+        assert frame.size == (1920, 1080)
+        assert frame.getpixel((600, 540)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((1320, 540)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((960, 0)) == (255, 0, 0)  # panel
+        assert frame.getpixel((960, 1079)) == (255, 0, 0)  # panel
 
 
 class TestAddTransition:
@@ -273,59 +347,100 @@ class TestAddTransition:
 class TestComposeVideo:
     """Tests for compose_video method."""
 
-    def test_creates_clips_for_all_scenes(self, compositor, sample_scenes):
-        """Test that clips are created for all scenes."""
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.AudioFileClip") as mock_audio, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+    def test_lists_every_scene_with_its_duration(self, compositor, sample_scenes):
+        """Test that the concat list shows each panel for its scene's duration."""
+        with patch("src.renderer.compositor.subprocess.run"), \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()) as mock_file:
 
-            mock_clip = MagicMock()
-            mock_clip.close = MagicMock()
-            mock_create_clip.return_value = mock_clip
+            compositor.compose_video(
+                scenes=sample_scenes,
+                panel_dir="/fake/panels",
+                audio_path="/fake/audio.mp3",
+                output_path="/fake/output.mp4",
+            )
 
-            mock_final_video = MagicMock()
-            mock_final_video.set_audio.return_value = mock_final_video
-            mock_final_video.write_videofile = MagicMock()
-            mock_final_video.close = MagicMock()
-            mock_concat.return_value = mock_final_video
+            mock_file.assert_called_once_with("/fake/output.mp4.concat.txt", "w")
+            written = "".join(c[0][0] for c in mock_file().write.call_args_list)
+            assert written == (
+                "file '/fake/panels/0000_0000.jpg'\n"
+                "duration 5.0\n"
+                "file '/fake/panels/0000_0001.jpg'\n"
+                "duration 5.0\n"
+                "file '/fake/panels/0000_0002.jpg'\n"
+                "duration 5.0\n"
+                # Last panel repeated so its duration is honoured
+                "file '/fake/panels/0000_0002.jpg'\n"
+            )
 
-            mock_audio_clip = MagicMock()
-            mock_audio_clip.close = MagicMock()
-            mock_audio.return_value = mock_audio_clip
+    def test_merges_consecutive_repeated_panels(self, compositor):
+        """Test that a panel repeated in adjacent scenes is listed once."""
+        scenes = [
+            Scene(
+                panel_s3_key=f"jobs/job-123/panels/{key}.jpg",
+                start_time=start,
+                end_time=start + 2.0,
+                transition_duration=0.5,
+            )
+            for start, key in [(0.0, "a"), (2.0, "a"), (4.0, "b"), (6.0, "a")]
+        ]
+
+        with patch("src.renderer.compositor.subprocess.run"), \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()) as mock_file:
 
             compositor.compose_video(
-                scenes=sample_scenes,
+                scenes=scenes,
                 panel_dir="/fake/panels",
                 audio_path="/fake/audio.mp3",
                 output_path="/fake/output.mp4",
             )
 
-            # Should create 3 clips (one per scene)
-            assert mock_create_clip.call_count == 3
+            written = "".join(c[0][0] for c in mock_file().write.call_args_list)
+            assert written == (
+                "file '/fake/panels/a.jpg'\n"
+                "duration 4.0\n"
+                "file '/fake/panels/b.jpg'\n"
+                "duration 2.0\n"
+                "file '/fake/panels/a.jpg'\n"
+                "duration 2.0\n"
+                "file '/fake/panels/a.jpg'\n"
+            )
 
-            # Verify durations (second argument is duration)
-            calls = mock_create_clip.call_args_list
-            assert calls[0][0][1] == 5.0  # 5.0 - 0.0
-            assert calls[1][0][1] == 5.0  # 10.0 - 5.0
-            assert calls[2][0][1] == 5.0  # 15.0 - 10.0
+    def test_escapes_quotes_in_panel_paths(self, compositor):
+        """Test that single quotes in panel paths are escaped for FFmpeg."""
+        scenes = [
+            Scene(
+                panel_s3_key="jobs/job-123/panels/it's.jpg",
+                start_time=0.0,
+                end_time=2.0,
+                transition_duration=0.5,
+            )
+        ]
 
-    def test_concatenates_clips(self, compositor, sample_scenes):
-        """Test that clips are concatenated."""
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.AudioFileClip") as mock_audio, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+        with patch("src.renderer.compositor.subprocess.run"), \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()) as mock_file:
 
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+            compositor.compose_video(
+                scenes=scenes,
+                panel_dir="/fake/panels",
+                audio_path="/fake/audio.mp3",
+                output_path="/fake/output.mp4",
+            )
 
-            mock_final_video = MagicMock()
-            mock_final_video.set_audio.return_value = mock_final_video
-            mock_concat.return_value = mock_final_video
+            written = "".join(c[0][0] for c in mock_file().write.call_args_list)
+            assert "file '/fake/panels/it'\\''s.jpg'\n" in written
 
-            mock_audio_clip = MagicMock()
-            mock_audio.return_value = mock_audio_clip
+    def test_encodes_in_single_ffmpeg_call(self, compositor, sample_scenes):
+        """Test that video and audio are encoded by one FFmpeg invocation."""
+        with patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()):
 
             compositor.compose_video(
                 scenes=sample_scenes,
@@ -334,28 +449,56 @@ class TestComposeVideo:
                 output_path="/fake/output.mp4",
             )
 
-            # Verify concatenate was called
-            mock_concat.assert_called_once()
-            concat_args = mock_concat.call_args
-            assert len(concat_args[0][0]) == 3  # 3 clips
-            assert concat_args[1]["method"] == "compose"
-
-    def test_adds_audio_to_video(self, compositor, sample_scenes):
-        """Test that audio is added to video."""
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.AudioFileClip") as mock_audio, \
-             patch("os.path.getsize", return_value=1024 * 1024):
+            mock_subprocess.assert_called_once()
+            args = mock_subprocess.call_args[0][0]
+            assert args[0] == "ffmpeg"
+            assert args[args.index("-f") + 1] == "concat"
+            assert args[args.index("-safe") + 1] == "0"
+            inputs = [args[i + 1] for i, arg in enumerate(args) if arg == "-i"]
+            assert inputs == ["/fake/output.mp4.concat.txt", "/fake/audio.mp3"]
+            assert args[args.index("-c:v") + 1] == "libx264"
+            assert args[args.index("-preset") + 1] == "medium"
+            assert args[args.index("-b:v") + 1] == "2000k"
+            assert args[args.index("-c:a") + 1] == "copy"
+            assert "-shortest" in args
+            assert args[-1] == "/fake/output.mp4"
+            assert mock_subprocess.call_args[1]["check"] is True
+
+    @pytest.mark.parametrize(
+        ("audio_path", "audio_args"),
+        [
+            ("/fake/audio.mp3", ["-c:a", "copy"]),
+            ("/fake/audio.M4A", ["-c:a", "copy"]),
+            ("/fake/audio.wav", ["-c:a", "aac", "-b:a", "192k"]),
+        ],
+    )
+    def test_copies_mp4_compatible_audio(self, compositor, sample_scenes, audio_path, audio_args):
+        """Test that MP3/AAC audio is muxed as-is and other formats are encoded."""
+        with patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()):
 
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+            compositor.compose_video(
+                scenes=sample_scenes,
+                panel_dir="/fake/panels",
+                audio_path=audio_path,
+                output_path="/fake/output.mp4",
+            )
 
-            mock_final_video = MagicMock()
-            mock_final_video.set_audio.return_value = mock_final_video
-            mock_concat.return_value = mock_final_video
+            args = mock_subprocess.call_args[0][0]
+            start = args.index("-c:a")
+            assert args[start : start + len(audio_args)] == audio_args
+            assert args[start + len(audio_args)] == "-shortest"
 
-            mock_audio_clip = MagicMock()
-            mock_audio.return_value = mock_audio_clip
+    def test_encodes_with_configured_codec(self, sample_scenes):
+        """Test that the compositor's encoder and preset are passed to FFmpeg."""
+        compositor = VideoCompositor(video_codec="h264_nvenc")
+
+        with patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()):
 
             compositor.compose_video(
                 scenes=sample_scenes,
@@ -364,28 +507,18 @@ class TestComposeVideo:
                 output_path="/fake/output.mp4",
             )
 
-            # Verify audio was loaded
-            mock_audio.assert_called_once_with("/fake/audio.mp3")
-
-            # Verify audio was set on video
-            mock_final_video.set_audio.assert_called_once_with(mock_audio_clip)
-
-    def test_writes_video_with_correct_settings(self, compositor, sample_scenes):
-        """Test that video is written with correct codec settings."""
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.AudioFileClip") as mock_audio, \
-             patch("os.path.getsize", return_value=1024 * 1024):
-
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+            args = mock_subprocess.call_args[0][0]
+            assert args[args.index("-c:v") + 1] == "h264_nvenc"
+            assert args[args.index("-preset") + 1] == "p4"
 
-            mock_final_video = MagicMock()
-            mock_final_video.set_audio.return_value = mock_final_video
-            mock_concat.return_value = mock_final_video
+    def test_scales_and_pads_to_resolution(self, sample_scenes):
+        """Test that frames are fitted to the compositor's resolution and fps."""
+        compositor = VideoCompositor(resolution=(1280, 720), fps=30)
 
-            mock_audio_clip = MagicMock()
-            mock_audio.return_value = mock_audio_clip
+        with patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()):
 
             compositor.compose_video(
                 scenes=sample_scenes,
@@ -394,16 +527,31 @@ class TestComposeVideo:
                 output_path="/fake/output.mp4",
             )
 
-            # Verify write_videofile was called with correct settings
-            mock_final_video.write_videofile.assert_called_once()
-            call_args = mock_final_video.write_videofile.call_args
+            args = mock_subprocess.call_args[0][0]
+            video_filter = args[args.index("-vf") + 1]
+            assert video_filter == (
+                "scale=1280:720:force_original_aspect_ratio=decrease,"
+                "pad=1280:720:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+                "fps=30,format=yuv420p"
+            )
+
+    def test_removes_concat_list_on_failure(self, compositor, sample_scenes):
+        """Test that the concat list is removed even when FFmpeg fails."""
+        with patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
+             patch("os.unlink") as mock_unlink, \
+             patch("builtins.open", mock_open()):
+
+            mock_subprocess.side_effect = subprocess.CalledProcessError(1, "ffmpeg")
 
-            assert call_args[0][0] == "/fake/output.mp4"
-            assert call_args[1]["codec"] == "libx264"
-            assert call_args[1]["audio_codec"] == "aac"
-            assert call_args[1]["preset"] == "medium"
-            assert call_args[1]["fps"] == 24
-            assert call_args[1]["bitrate"] == "2000k"
+            with pytest.raises(subprocess.CalledProcessError):
+                compositor.compose_video(
+                    scenes=sample_scenes,
+                    panel_dir="/fake/panels",
+                    audio_path="/fake/audio.mp3",
+                    output_path="/fake/output.mp4",
+                )
+
+            mock_unlink.assert_called_once_with("/fake/output.mp4.concat.txt")
 
     def test_raises_error_on_empty_scenes(self, compositor):
         """Test that error is raised when no scenes provided."""
@@ -417,20 +565,10 @@ class TestComposeVideo:
 
     def test_returns_output_path(self, compositor, sample_scenes):
         """Test that output path is returned."""
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.AudioFileClip") as mock_audio, \
-             patch("os.path.getsize", return_value=1024 * 1024):
-
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
-
-            mock_final_video = MagicMock()
-            mock_final_video.set_audio.return_value = mock_final_video
-            mock_concat.return_value = mock_final_video
-
-            mock_audio_clip = MagicMock()
-            mock_audio.return_value = mock_audio_clip
+        with patch("src.renderer.compositor.subprocess.run"), \
+             patch("os.unlink"), \
+             patch("os.path.getsize", return_value=1024 * 1024), \
+             patch("builtins.open", mock_open()):
 
             result = compositor.compose_video(
                 scenes=sample_scenes,
@@ -445,140 +583,254 @@ class TestComposeVideo:
 class TestComposeVideoChunked:
     """Tests for compose_video_chunked method."""
 
-    def test_creates_chunks_for_large_scene_list(self, compositor):
-        """Test that scenes are split into chunks."""
-        # Create 250 scenes (should be split into 3 chunks of 100)
+    def test_streams_each_panel_for_its_duration(self):
+        """Test that each panel is written for as many frames as its scene lasts."""
+        compositor = VideoCompositor(resolution=(4, 2), fps=2)
         scenes = [
             Scene(
-                panel_s3_key=f"jobs/job-123/panels/{i:04d}.jpg",
-                start_time=float(i * 5),
-                end_time=float((i + 1) * 5),
+                panel_s3_key=f"jobs/job-123/panels/{i}.jpg",
+                start_time=start,
+                end_time=end,
                 transition_duration=0.5,
             )
-            for i in range(250)
+            for i, (start, end) in enumerate([(0.0, 1.0), (1.0, 2.5), (2.5, 3.0)])
         ]
 
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
-             patch("tempfile.mkdtemp") as mock_mkdtemp, \
-             patch("os.unlink"), \
-             patch("os.rmdir"), \
-             patch("os.path.getsize", return_value=1024 * 1024), \
-             patch("builtins.open", create=True):
+        def load_frame(panel_path):
+            index = int(os.path.basename(panel_path).split(".")[0])
+            return np.full((2, 4, 3), index, dtype=np.uint8)
 
-            mock_mkdtemp.return_value = "/tmp/chunks"
+        stream = io.BytesIO()
+        with patch.object(compositor, "load_panel_frame", side_effect=load_frame):
+            frames_written = compositor._stream_panel_frames(
+                stream, scenes, "/fake/panels", chunk_size=100, max_workers=2
+            )
 
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+        # 1.0s, 1.5s and 0.5s at 2 fps
+        frame_size = 2 * 4 * 3
+        assert frames_written == 6
+        assert stream.getvalue() == b"".join(
+            bytes([index]) * frame_size for index in [0, 0, 1, 1, 1, 2]
+        )
+
+    def test_rounds_frame_counts_against_running_timestamp(self):
+        """Test that fractional frame durations do not accumulate drift."""
+        compositor = VideoCompositor(resolution=(4, 2), fps=24)
+        scenes = _sequential_scenes(100, 2.51)
+
+        stream = io.BytesIO()
+        with patch.object(
+            compositor, "load_panel_frame", return_value=np.zeros((2, 4, 3), dtype=np.uint8)
+        ):
+            frames_written = compositor._stream_panel_frames(
+                stream, scenes, "/fake/panels", chunk_size=30, max_workers=4
+            )
 
-            mock_video = MagicMock()
-            mock_concat.return_value = mock_video
+        # 251s at 24 fps; rounding per scene would give 100 * 60 frames
+        assert frames_written == 6024
+        assert len(stream.getvalue()) == 6024 * 2 * 4 * 3
+
+    def test_preserves_scene_order_with_parallel_loading(self):
+        """Test that panels loaded concurrently are written in scene order."""
+        compositor = VideoCompositor(resolution=(4, 2), fps=1)
+        scenes = _sequential_scenes(8, 1.0)
+
+        def load_frame(panel_path):
+            # Later panels finish first
+            index = int(os.path.basename(panel_path).split(".")[0])
+            time.sleep((8 - index) * 0.005)
+            return np.full((2, 4, 3), index, dtype=np.uint8)
+
+        stream = io.BytesIO()
+        with patch.object(compositor, "load_panel_frame", side_effect=load_frame):
+            compositor._stream_panel_frames(
+                stream, scenes, "/fake/panels", chunk_size=3, max_workers=4
+            )
 
-            compositor.compose_video_chunked(
-                scenes=scenes,
-                panel_dir="/fake/panels",
-                audio_path="/fake/audio.mp3",
-                output_path="/fake/output.mp4",
-                chunk_size=100,
+        written = stream.getvalue()
+        assert list(written[:: 2 * 4 * 3]) == list(range(8))
+
+    def test_loads_at_most_chunk_size_panels_ahead(self):
+        """Test that panel loading runs ahead of the writer by at most chunk_size."""
+        compositor = VideoCompositor(resolution=(4, 2), fps=1)
+        scenes = _sequential_scenes(12, 1.0)
+        stream = io.BytesIO()
+        lead = []
+
+        def load_frame(panel_path):
+            index = int(os.path.basename(panel_path).split(".")[0])
+            panels_written = len(stream.getvalue()) // (2 * 4 * 3)
+            lead.append(index - panels_written)
+            return np.full((2, 4, 3), index, dtype=np.uint8)
+
+        with patch.object(compositor, "load_panel_frame", side_effect=load_frame):
+            compositor._stream_panel_frames(
+                stream, scenes, "/fake/panels", chunk_size=3, max_workers=2
             )
 
-            # Should create 3 chunks (100, 100, 50)
-            # Each chunk renders to a file, so write_videofile called 3 times
-            assert mock_video.write_videofile.call_count == 3
+        assert len(lead) == 12
+        assert max(lead) <= 3
 
-    def test_concatenates_chunks_with_ffmpeg(self, compositor):
-        """Test that chunks are concatenated with FFmpeg."""
+    def test_decodes_repeated_panel_once(self, temp_image):
+        """Test that adjacent scenes sharing a panel open the image only once."""
+        compositor = VideoCompositor(resolution=(32, 18), fps=2)
+        panel_key = f"jobs/job-123/panels/{os.path.basename(temp_image)}"
         scenes = [
             Scene(
-                panel_s3_key=f"jobs/job-123/panels/{i:04d}.jpg",
-                start_time=float(i * 5),
-                end_time=float((i + 1) * 5),
+                panel_s3_key=panel_key,
+                start_time=0.0,
+                end_time=3.0,
                 transition_duration=0.5,
-            )
-            for i in range(150)
+            ),
+            Scene(
+                panel_s3_key=panel_key,
+                start_time=3.0,
+                end_time=5.0,
+                transition_duration=0.5,
+            ),
         ]
 
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
-             patch("tempfile.mkdtemp") as mock_mkdtemp, \
-             patch("os.unlink"), \
-             patch("os.rmdir"), \
-             patch("os.path.getsize", return_value=1024 * 1024), \
-             patch("builtins.open", create=True):
+        stream = io.BytesIO()
+        with patch(
+            "src.renderer.compositor.Image.open", wraps=Image.open
+        ) as mock_image_open:
+            frames_written = compositor._stream_panel_frames(
+                stream, scenes, os.path.dirname(temp_image), chunk_size=100, max_workers=2
+            )
 
-            mock_mkdtemp.return_value = "/tmp/chunks"
+        mock_image_open.assert_called_once_with(temp_image)
+        assert frames_written == 10
 
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+    def test_pipes_frames_into_single_ffmpeg_process(self, compositor, sample_scenes):
+        """Test that video and audio are encoded by one FFmpeg process reading stdin."""
+        with patch("src.renderer.compositor.subprocess.Popen") as mock_popen, \
+             patch.object(
+                 compositor, "_stream_panel_frames", return_value=360
+             ) as mock_stream, \
+             patch("os.path.getsize", return_value=1024 * 1024):
 
-            mock_video = MagicMock()
-            mock_concat.return_value = mock_video
+            mock_process = mock_popen.return_value
+            mock_process.wait.return_value = 0
 
-            compositor.compose_video_chunked(
-                scenes=scenes,
+            result = compositor.compose_video_chunked(
+                scenes=sample_scenes,
                 panel_dir="/fake/panels",
                 audio_path="/fake/audio.mp3",
                 output_path="/fake/output.mp4",
-                chunk_size=100,
+                chunk_size=2,
             )
 
-            # Verify FFmpeg was called twice (concat + add audio)
-            assert mock_subprocess.call_count == 2
-
-            # First call should be concat
-            first_call = mock_subprocess.call_args_list[0]
-            assert "ffmpeg" in first_call[0][0]
-            assert "-f" in first_call[0][0]
-            assert "concat" in first_call[0][0]
-
-            # Second call should add audio
-            second_call = mock_subprocess.call_args_list[1]
-            assert "ffmpeg" in second_call[0][0]
-            assert "/fake/audio.mp3" in second_call[0][0]
-
-    def test_cleans_up_temporary_files(self, compositor):
-        """Test that temporary chunk files are cleaned up."""
-        scenes = [
-            Scene(
-                panel_s3_key=f"jobs/job-123/panels/{i:04d}.jpg",
-                start_time=float(i * 5),
-                end_time=float((i + 1) * 5),
-                transition_duration=0.5,
+            assert result == "/fake/output.mp4"
+            mock_popen.assert_called_once()
+            args = mock_popen.call_args[0][0]
+            assert args[args.index("-f") + 1] == "rawvideo"
+            assert args[args.index("-pix_fmt") + 1] == "rgb24"
+            assert args[args.index("-s") + 1] == "1920x1080"
+            assert args[args.index("-r") + 1] == "24"
+            inputs = [args[i + 1] for i, arg in enumerate(args) if arg == "-i"]
+            assert inputs == ["-", "/fake/audio.mp3"]
+            assert args[args.index("-c:v") + 1] == "libx264"
+            assert args[args.index("-b:v") + 1] == "2000k"
+            assert args[args.index("-c:a") + 1] == "copy"
+            assert "-shortest" in args
+            assert args[-1] == "/fake/output.mp4"
+
+            mock_stream.assert_called_once_with(
+                mock_process.stdin,
+                sample_scenes,
+                "/fake/panels",
+                2,
+                PANEL_CLIP_WORKERS,
             )
-            for i in range(50)
-        ]
+            mock_process.stdin.close.assert_called_once()
+
+    def test_raises_when_ffmpeg_fails(self, compositor, sample_scenes):
+        """Test that a failed encode raises with FFmpeg's stderr."""
+
+        def run_ffmpeg(args, stdin, stdout, stderr):
+            stderr.write(b"Unknown encoder")
+            process = MagicMock()
+            process.wait.return_value = 1
+            return process
+
+        with patch("src.renderer.compositor.subprocess.Popen", side_effect=run_ffmpeg), \
+             patch.object(compositor, "_stream_panel_frames", return_value=360):
+
+            with pytest.raises(subprocess.CalledProcessError) as exc_info:
+                compositor.compose_video_chunked(
+                    scenes=sample_scenes,
+                    panel_dir="/fake/panels",
+                    audio_path="/fake/audio.mp3",
+                    output_path="/fake/output.mp4",
+                    chunk_size=2,
+                )
+
+            assert exc_info.value.returncode == 1
+            assert exc_info.value.stderr == b"Unknown encoder"
+
+    def test_kills_ffmpeg_when_panel_loading_fails(self, compositor, sample_scenes):
+        """Test that FFmpeg is stopped when a panel cannot be loaded."""
+        with patch("src.renderer.compositor.subprocess.Popen") as mock_popen, \
+             patch.object(
+                 compositor,
+                 "_stream_panel_frames",
+                 side_effect=FileNotFoundError("/fake/panels/0000_0001.jpg"),
+             ):
+
+            with pytest.raises(FileNotFoundError):
+                compositor.compose_video_chunked(
+                    scenes=sample_scenes,
+                    panel_dir="/fake/panels",
+                    audio_path="/fake/audio.mp3",
+                    output_path="/fake/output.mp4",
+                    chunk_size=2,
+                )
+
+            mock_popen.return_value.kill.assert_called_once()
+            mock_popen.return_value.wait.assert_called_once()
+
+    def test_tolerates_ffmpeg_closing_stdin_at_audio_end(self, compositor, sample_scenes):
+        """Test that -shortest ending the encode early is not treated as a failure."""
+        with patch("src.renderer.compositor.subprocess.Popen") as mock_popen, \
+             patch.object(compositor, "_stream_panel_frames", side_effect=BrokenPipeError), \
+             patch("os.path.getsize", return_value=1024 * 1024):
 
-        with patch.object(compositor, "create_panel_clip") as mock_create_clip, \
-             patch("src.renderer.compositor.concatenate_videoclips") as mock_concat, \
-             patch("src.renderer.compositor.subprocess.run") as mock_subprocess, \
-             patch("tempfile.mkdtemp") as mock_mkdtemp, \
-             patch("os.unlink") as mock_unlink, \
-             patch("os.rmdir") as mock_rmdir, \
-             patch("os.path.getsize", return_value=1024 * 1024), \
-             patch("builtins.open", create=True), \
-             patch("os.path.exists", return_value=True):
+            mock_popen.return_value.wait.return_value = 0
+            # Flushing the remaining frame bytes on close hits the same broken pipe
+            mock_popen.return_value.stdin.close.side_effect = BrokenPipeError
 
-            mock_mkdtemp.return_value = "/tmp/chunks"
+            result = compositor.compose_video_chunked(
+                scenes=sample_scenes,
+                panel_dir="/fake/panels",
+                audio_path="/fake/audio.mp3",
+                output_path="/fake/output.mp4",
+                chunk_size=2,
+            )
 
-            mock_clip = MagicMock()
-            mock_create_clip.return_value = mock_clip
+            assert result == "/fake/output.mp4"
+            mock_popen.return_value.stdin.close.assert_called_once()
+            mock_popen.return_value.kill.assert_not_called()
 
-            mock_video = MagicMock()
-            mock_concat.return_value = mock_video
+    def test_composes_single_chunk_directly(self, compositor, sample_scenes):
+        """Test that scenes fitting in one chunk skip the frame pipe."""
+        with patch("src.renderer.compositor.subprocess.Popen") as mock_popen, \
+             patch.object(
+                 compositor, "compose_video", return_value="/fake/output.mp4"
+             ) as mock_compose_video:
 
-            compositor.compose_video_chunked(
-                scenes=scenes,
+            result = compositor.compose_video_chunked(
+                scenes=sample_scenes,
                 panel_dir="/fake/panels",
                 audio_path="/fake/audio.mp3",
                 output_path="/fake/output.mp4",
-                chunk_size=100,
+                chunk_size=3,
             )
 
-            # Verify cleanup was attempted
-            assert mock_unlink.called
-            assert mock_rmdir.called
+            assert result == "/fake/output.mp4"
+            mock_popen.assert_not_called()
+            mock_compose_video.assert_called_once_with(
+                sample_scenes, "/fake/panels", "/fake/audio.mp3", "/fake/output.mp4"
+            )
 
     def test_raises_error_on_empty_scenes(self, compositor):
         """Test that error is raised when no scenes provided."""
@@ -605,35 +857,22 @@ class TestResolutionLogic:
         assert compositor_4k.resolution == (3840, 2160)
         assert compositor_4k.fps == 60
 
-    def test_square_image_padding(self):
+    def test_square_image_padding(self, tmp_path):
         """Test that square image is padded correctly."""
         compositor = VideoCompositor(resolution=(1920, 1080))
 
-        with patch("src.renderer.compositor.ImageClip") as mock_image_clip, \
-             patch("src.renderer.compositor.Image.open") as mock_open, \
-             patch("src.renderer.compositor.Image.new") as mock_new:
-
-            # Square image
-            mock_img = MagicMock()
-            mock_img.size = (1000, 1000)
-            mock_open.return_value = mock_img
-
-            mock_resized = MagicMock()
-            mock_resized.size = (1080, 1080)  # After resize
-            mock_img.resize.return_value = mock_resized
-
-            # Mock background
-            mock_background = MagicMock()
-            mock_new.return_value = mock_background
-
-            compositor.create_panel_clip("/fake/path.jpg", duration=5.0)
-
-            # For 1920x1080 target and 1000x1000 source
-            # Width ratio: 1920/1000 = 1.92
-            # Height ratio: 1080/1000 = 1.08
-            # Should use height ratio (1.08) as minimum
-            expected_size = (1080, 1080)
-
-            resize_call = mock_img.resize.call_args
-            actual_size = resize_call[0][0]
-            assert actual_size == expected_size
+        # Square image
+        image_path = str(tmp_path / "square.png")
+        Image.new("RGB", (1000, 1000), color=(255, 0, 0)).save(image_path)
+
+        frame = _render_panel_frame(compositor, image_path)
+
+        # For 1920x1080 target and 1000x1000 source
+        # Width ratio: 1920/1000 = 1.92
+        # Height ratio: 1080/1000 = 1.08
+        # Should use height ratio (1.08): 1080x1080 centered, 420px side bars
+        assert frame.size == (1920, 1080)
+        assert frame.getpixel((400, 540)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((1520, 540)) == (0, 0, 0)  # black bar
+        assert frame.getpixel((430, 540)) == (255, 0, 0)  # panel
+        assert frame.getpixel((1490, 540)) == (255, 0, 0)  # panel
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import pytest
 from pydantic import ValidationError
 
+from src.common import config
 from src.common.config import Settings, get_settings
 
 
@@ -78,7 +79,7 @@ class TestGetSettings:
 
     def test_get_settings_returns_settings_instance(self):
         """Test that get_settings returns a Settings instance."""
-        get_settings.cache_clear()
+        config._settings = None
         with patch.dict(os.environ, {"S3_BUCKET": "test-bucket"}, clear=False):
             settings = get_settings()
 
@@ -86,7 +87,7 @@ class TestGetSettings:
 
     def test_get_settings_is_cached(self):
         """Test that get_settings returns cached instance."""
-        get_settings.cache_clear()
+        config._settings = None
         with patch.dict(os.environ, {"S3_BUCKET": "test-bucket"}, clear=False):
             settings1 = get_settings()
             settings2 = get_settings()
@@ -4,6 +4,7 @@ import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import bcrypt
 import pytest
 from fastapi import HTTPException, Request
 from starlette.applications import Starlette
@@ -22,6 +23,26 @@ from src.dashboard.auth import (
     verify_token,
 )
 
+# Decode each distinct JWT once instead of on every authenticated request
+pytestmark = pytest.mark.usefixtures("_cached_verify_token")
+
+# bcrypt cost used for hashes created inside the tests; 4 is the library
+# minimum and makes each hash 256x cheaper than the production default of 12
+BCRYPT_TEST_ROUNDS = 4
+
+# Unpatched salt generator, for the test that checks the production cost
+_real_gensalt = bcrypt.gensalt
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    """Generate bcrypt salts at the minimum cost for every test."""
+    monkeypatch.setattr(
+        bcrypt,
+        "gensalt",
+        lambda rounds=BCRYPT_TEST_ROUNDS, prefix=b"2b": _real_gensalt(BCRYPT_TEST_ROUNDS, prefix),
+    )
+
 
 @pytest.fixture
 def secret_key():
@@ -44,8 +65,9 @@ def test_password():
 @pytest.fixture
 def hashed_password():
     """Pre-hashed test password."""
-    # Hash of "secure-password-123"
-    return hash_password("secure-password-123")
+    # Hash of "secure-password-123", precomputed at bcrypt cost 4 so neither
+    # the fixture nor each verification pays the production work factor
+    return "$2b$04$IQMAYtVuWLALw/FxMbb6w.UaiYapgWX2k3hGssBkRocG4PFurN9za"
 
 
 # =====================================================================
@@ -99,6 +121,16 @@ def test_hash_password_different_each_time(test_password):
     assert verify_password(test_password, hash2)
 
 
+def test_hash_password_real_cost(test_password, monkeypatch):
+    """Test that hash_password uses bcrypt's production cost factor."""
+    monkeypatch.setattr(bcrypt, "gensalt", _real_gensalt)
+
+    hashed = hash_password(test_password)
+
+    assert hashed.startswith("$2b$12$")
+    assert verify_password(test_password, hashed)
+
+
 # =====================================================================
 # JWT Token Tests
 # =====================================================================
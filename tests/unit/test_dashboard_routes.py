@@ -8,27 +8,31 @@ from fastapi.testclient import TestClient
 
 from src.common.models import JobRecord, JobStatus, PipelineSettings
 from src.dashboard.app import create_app
-from src.dashboard.auth import hash_password
 
+# Decode each distinct JWT once instead of on every authenticated request
+pytestmark = pytest.mark.usefixtures("_cached_verify_token")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def admin_password():
     """Admin password for testing."""
     return "test-admin-password-123"
 
 
-@pytest.fixture
-def admin_credentials(admin_password):
+@pytest.fixture(scope="session")
+def admin_credentials():
     """Mock admin credentials."""
+    # Hash of "test-admin-password-123" (admin_password), precomputed at
+    # bcrypt cost 4 so each test skips hashing and logins verify quickly
     return {
         "username": "admin",
-        "password_hash": hash_password(admin_password),
+        "password_hash": "$2b$04$MSkUBZISwgaBKCxL/ofotupyFJ/9lqEfY0n71glYV8.x6hqdYbytO",
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_secrets_client(admin_credentials):
-    """Mock SecretsClient."""
+    """Mock SecretsClient, shared by every test since it only serves credentials."""
     mock = MagicMock()
     mock.get_secret.return_value = admin_credentials
     return mock
@@ -13,6 +13,13 @@ from src.common.config import Settings
 from src.common.db import DynamoDBClient
 from src.common.models import JobRecord, JobStatus, PipelineSettings
 
+# (settings attribute holding the table name, hash key) for each test table
+_TABLE_DEFS: list[tuple[str, str]] = [
+    ("dynamodb_jobs_table", "job_id"),
+    ("dynamodb_manga_table", "manga_id"),
+    ("dynamodb_settings_table", "setting_id"),
+]
+
 
 @pytest.fixture
 def aws_credentials() -> Generator[None, None, None]:
@@ -33,17 +40,14 @@ def aws_credentials() -> Generator[None, None, None]:
 @pytest.fixture
 def settings(aws_credentials: None) -> Settings:
     """Create test settings."""
-    with patch.dict(
-        os.environ,
-        {
-            "S3_BUCKET": "test-bucket",
-            "AWS_REGION": "ap-southeast-1",
-            "DYNAMODB_JOBS_TABLE": "test_manga_jobs",
-            "DYNAMODB_MANGA_TABLE": "test_processed_manga",
-            "DYNAMODB_SETTINGS_TABLE": "test_settings",
-        },
-    ):
-        return Settings()
+    # Built from values directly; environment loading is covered in test_config
+    return Settings.model_construct(
+        s3_bucket="test-bucket",
+        aws_region="ap-southeast-1",
+        dynamodb_jobs_table="test_manga_jobs",
+        dynamodb_manga_table="test_processed_manga",
+        dynamodb_settings_table="test_settings",
+    )
 
 
 @pytest.fixture
@@ -58,29 +62,13 @@ def dynamodb_tables(mock_dynamodb: None, settings: Settings) -> None:
     """Create DynamoDB tables for testing."""
     dynamodb = boto3.resource("dynamodb", region_name=settings.aws_region)
 
-    # Create jobs table
-    dynamodb.create_table(
-        TableName=settings.dynamodb_jobs_table,
-        KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "job_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create manga table
-    dynamodb.create_table(
-        TableName=settings.dynamodb_manga_table,
-        KeySchema=[{"AttributeName": "manga_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "manga_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create settings table
-    dynamodb.create_table(
-        TableName=settings.dynamodb_settings_table,
-        KeySchema=[{"AttributeName": "setting_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "setting_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
+    for table_attr, key_name in _TABLE_DEFS:
+        dynamodb.create_table(
+            TableName=getattr(settings, table_attr),
+            KeySchema=[{"AttributeName": key_name, "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": key_name, "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
 
 
 @pytest.fixture
@@ -89,6 +77,21 @@ def db_client(dynamodb_tables: None, settings: Settings) -> DynamoDBClient:
     return DynamoDBClient(settings)
 
 
+class TestClientConfig:
+    """Tests for the underlying boto3 client configuration."""
+
+    def test_client_uses_tcp_keepalive(self, db_client: DynamoDBClient) -> None:
+        """Test that the DynamoDB client keeps connections alive between calls."""
+        client_config = db_client._dynamodb.meta.client.meta.config
+        assert client_config.tcp_keepalive is True
+
+    def test_client_uses_adaptive_retries(self, db_client: DynamoDBClient) -> None:
+        """Test that throttling is retried with client-side rate limiting."""
+        client_config = db_client._dynamodb.meta.client.meta.config
+        assert client_config.retries["mode"] == "adaptive"
+        assert client_config.retries["total_max_attempts"] == 5
+
+
 class TestJobOperations:
     """Tests for job CRUD operations."""
 
@@ -176,6 +179,23 @@ class TestJobOperations:
         assert updated.youtube_url == "https://youtube.com/watch?v=abc123"
         assert updated.progress_pct == 100
 
+    def test_mark_job_cleaned_up(self, db_client: DynamoDBClient) -> None:
+        """Test that the cleanup timestamp is written to an existing job."""
+        db_client.create_job(
+            JobRecord(job_id="job-clean", manga_id="manga-clean", manga_title="Bleach")
+        )
+
+        assert db_client.mark_job_cleaned_up("job-clean") is True
+
+        item = db_client._jobs_table.get_item(Key={"job_id": "job-clean"})["Item"]
+        assert datetime.fromisoformat(item["cleanup_at"]).tzinfo is not None
+        assert item["updated_at"] == item["cleanup_at"]
+
+    def test_mark_job_cleaned_up_skips_missing_job(self, db_client: DynamoDBClient) -> None:
+        """Test that a missing job is reported and not recreated."""
+        assert db_client.mark_job_cleaned_up("job-gone") is False
+        assert "Item" not in db_client._jobs_table.get_item(Key={"job_id": "job-gone"})
+
     def test_list_jobs_no_filter(self, db_client: DynamoDBClient) -> None:
         """Test listing jobs without filter."""
         jobs = [
@@ -322,3 +322,11 @@ class TestSetupLogger:
 
         assert logger1 is logger2
         assert handler_count1 == handler_count2
+
+    def test_loggers_share_formatter_but_not_handler(self) -> None:
+        """Test that each logger gets its own handler around a shared formatter."""
+        handler1 = setup_logger("test_shared_a").handlers[0]
+        handler2 = setup_logger("test_shared_b").handlers[0]
+
+        assert handler1 is not handler2
+        assert handler1.formatter is handler2.formatter
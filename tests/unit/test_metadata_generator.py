@@ -460,6 +460,22 @@ class TestEdgeCases:
         # Should show 0 chapters
         assert "Số chương: 0" in description
 
+    def test_uses_chapter_count_when_chapters_not_materialized(self, metadata_generator):
+        """Test that an explicit chapter_count is used without a chapters list."""
+        manga = MangaInfo(
+            manga_id="test",
+            title="Test",
+            description="test",
+            genres=["Test"],
+            cover_url=None,
+            chapters=[],
+            chapter_count=42,
+        )
+
+        description = metadata_generator._generate_description(manga)
+
+        assert "Số chương: 42" in description
+
     def test_handles_manga_with_many_genres(self, metadata_generator):
         """Test handling of manga with many genres."""
         manga = MangaInfo(
@@ -482,6 +498,33 @@ class TestEdgeCases:
                 assert len(",".join(tags)) <= 500
 
 
+    def test_caps_oversized_inputs(self, metadata_generator, sample_job):
+        """Test that huge titles/descriptions are capped before processing."""
+        manga = MangaInfo(
+            manga_id="test",
+            title="T" * 5000,
+            description="D" * 100_000,
+            genres=["Test"],
+            cover_url=None,
+            chapters=[],
+        )
+
+        capped = metadata_generator._cap_input_lengths(manga)
+
+        assert len(capped.title) == metadata_generator.MAX_INPUT_TITLE_LENGTH
+        assert len(capped.description) == metadata_generator.MAX_INPUT_DESCRIPTION_LENGTH
+        # Original model is left untouched
+        assert len(manga.description) == 100_000
+
+        metadata = metadata_generator.generate_metadata(manga, sample_job)
+        assert len(metadata["title"]) <= 100
+        assert len(metadata["description"]) <= 5000
+
+    def test_normal_inputs_not_copied(self, metadata_generator, sample_manga):
+        """Test that inputs within limits are returned as-is."""
+        assert metadata_generator._cap_input_lengths(sample_manga) is sample_manga
+
+
 class TestVietnameseContent:
     """Tests for Vietnamese content handling."""
 
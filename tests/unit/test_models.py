@@ -123,6 +123,35 @@ class TestMangaInfo:
         assert data["manga_id"] == "manga-456"
         assert data["chapters"] == []
 
+    def test_chapter_count_defaults_to_chapters_length(self) -> None:
+        """Test that chapter_count is derived from chapters when omitted."""
+        manga = MangaInfo(
+            manga_id="manga-456",
+            title="Test",
+            description="Desc",
+            genres=[],
+            cover_url=None,
+            chapters=[
+                ChapterInfo(chapter_id="ch-1", title="Ch 1", chapter_number="1", page_urls=[]),
+                ChapterInfo(chapter_id="ch-2", title="Ch 2", chapter_number="2", page_urls=[]),
+            ],
+        )
+        assert manga.chapter_count == 2
+
+    def test_explicit_chapter_count_without_chapters(self) -> None:
+        """Test that chapter_count can be set without materializing chapters."""
+        manga = MangaInfo(
+            manga_id="manga-456",
+            title="Test",
+            description="Desc",
+            genres=[],
+            cover_url=None,
+            chapters=[],
+            chapter_count=250,
+        )
+        assert manga.chapters == []
+        assert manga.chapter_count == 250
+
 
 class TestJobStatus:
     """Tests for JobStatus enum."""
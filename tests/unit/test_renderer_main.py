@@ -1,17 +1,12 @@
 """Unit tests for main renderer entry point."""
 
 import os
-import sys
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-# Mock pydub before importing audio_merger (Python 3.13 compatibility)
-sys.modules["pydub"] = MagicMock()
-sys.modules["pydub.AudioSegment"] = MagicMock()
-
 from src.common.models import AudioManifest, AudioSegment, JobRecord, JobStatus
-from src.renderer.main import main
+from src.renderer.main import download_panels, main
 
 
 @pytest.fixture
@@ -643,3 +638,39 @@ class TestProgressTracking:
         assert any(
             call[1].get("progress_pct") == 100 for call in status_calls
         )
+
+
+class TestDownloadPanels:
+    """Tests for concurrent panel downloads."""
+
+    def test_downloads_all_panels(self, mock_panel_manifest, tmp_path):
+        """Test that every panel is downloaded into the panels directory."""
+        s3_client = MagicMock()
+
+        count = download_panels(s3_client, mock_panel_manifest, str(tmp_path), max_workers=2)
+
+        assert count == 3
+        assert s3_client.download_file.call_count == 3
+        downloaded = {c.args for c in s3_client.download_file.call_args_list}
+        assert downloaded == {
+            (f"jobs/test-job-123/panels/ch1_p{i}.jpg", str(tmp_path / f"ch1_p{i}.jpg"))
+            for i in range(3)
+        }
+
+    def test_supports_panel_keys_format(self, tmp_path):
+        """Test that chapters listing plain panel_keys are downloaded."""
+        s3_client = MagicMock()
+        manifest = {"chapters": [{"panel_keys": ["a/p0.jpg", "", "a/p1.jpg"]}]}
+
+        count = download_panels(s3_client, manifest, str(tmp_path))
+
+        assert count == 2
+        assert s3_client.download_file.call_count == 2
+
+    def test_propagates_download_errors(self, mock_panel_manifest, tmp_path):
+        """Test that a failed download is re-raised."""
+        s3_client = MagicMock()
+        s3_client.download_file.side_effect = RuntimeError("S3 unavailable")
+
+        with pytest.raises(RuntimeError, match="S3 unavailable"):
+            download_panels(s3_client, mock_panel_manifest, str(tmp_path))
@@ -102,6 +102,18 @@ class TestSceneDataClass:
         assert scene.transition_duration == 0.5
 
 
+    def test_scene_is_slotted(self):
+        """Test that Scene instances carry no per-instance __dict__."""
+        scene = Scene(
+            panel_s3_key="jobs/job-123/panels/0000_0000.jpg",
+            start_time=0.0,
+            end_time=5.0,
+        )
+
+        assert not hasattr(scene, "__dict__")
+        with pytest.raises(AttributeError):
+            scene.duration = 5.0
+
 class TestSceneBuilderInitialization:
     """Tests for SceneBuilder initialization."""
 
@@ -210,6 +210,42 @@ class TestCaching:
         assert len(secrets_client._cache) == 0
 
 
+class TestBatchGetSecretJson:
+    """Tests for batch_get_secret_json method."""
+
+    def test_batch_returns_all_secrets(
+        self, secrets_client: SecretsClient, sm_client: boto3.client
+    ) -> None:
+        """Test fetching several JSON secrets in one call."""
+        sm_client.create_secret(Name="test/a", SecretString=json.dumps({"key": "a"}))
+        sm_client.create_secret(Name="test/b", SecretString=json.dumps({"key": "b"}))
+
+        result = secrets_client.batch_get_secret_json(["test/a", "test/b"])
+
+        assert result == {"test/a": {"key": "a"}, "test/b": {"key": "b"}}
+
+    def test_batch_populates_cache(
+        self, secrets_client: SecretsClient, sm_client: boto3.client
+    ) -> None:
+        """Test that batched secrets are served from cache afterwards."""
+        sm_client.create_secret(Name="test/a", SecretString=json.dumps({"key": "a"}))
+        secrets_client.batch_get_secret_json(["test/a"])
+
+        sm_client.delete_secret(SecretId="test/a", ForceDeleteWithoutRecovery=True)
+
+        assert secrets_client.get_secret_json("test/a") == {"key": "a"}
+        assert secrets_client.get_secret_string("test/a") == json.dumps({"key": "a"})
+
+    def test_batch_missing_secret_raises_error(
+        self, secrets_client: SecretsClient, sm_client: boto3.client
+    ) -> None:
+        """Test that a missing secret raises SecretNotFoundError."""
+        sm_client.create_secret(Name="test/a", SecretString=json.dumps({"key": "a"}))
+
+        with pytest.raises(SecretNotFoundError, match="test/missing"):
+            secrets_client.batch_get_secret_json(["test/a", "test/missing"])
+
+
 class TestGetDeepinfraApiKey:
     """Tests for get_deepinfra_api_key method."""
 
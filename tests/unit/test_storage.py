@@ -33,14 +33,11 @@ def aws_credentials() -> Generator[None, None, None]:
 @pytest.fixture
 def settings(aws_credentials: None) -> Settings:
     """Create test settings."""
-    with patch.dict(
-        os.environ,
-        {
-            "S3_BUCKET": "test-manga-bucket",
-            "AWS_REGION": "ap-southeast-1",
-        },
-    ):
-        return Settings()
+    # Built from values directly; environment loading is covered in test_config
+    return Settings.model_construct(
+        s3_bucket="test-manga-bucket",
+        aws_region="ap-southeast-1",
+    )
 
 
 @pytest.fixture
@@ -248,6 +245,37 @@ class TestDeletePrefix:
         assert deleted_count == 4
         assert len(s3_client.list_objects(prefix)) == 0
 
+    def test_delete_prefix_excludes_failed_keys(self, s3_client: S3Client) -> None:
+        """Test that keys S3 reports as failed are not counted as deleted."""
+        prefix = "partial/"
+        s3_client.upload_bytes(b"a" * 10, f"{prefix}ok.txt")
+        s3_client.upload_bytes(b"b" * 20, f"{prefix}locked.txt")
+
+        with patch.object(
+            s3_client._client,
+            "delete_objects",
+            return_value={"Errors": [{"Key": f"{prefix}locked.txt", "Code": "AccessDenied"}]},
+        ):
+            deleted_count, bytes_freed = s3_client.delete_prefix_with_metrics(prefix)
+
+        assert deleted_count == 1
+        assert bytes_freed == 10
+
+    def test_delete_prefix_deletes_every_page(self, s3_client: S3Client) -> None:
+        """Test that pages deleted concurrently add up to the full prefix."""
+        prefix = "paged/"
+        for i in range(7):
+            s3_client.upload_bytes(b"x" * (i + 1), f"{prefix}file_{i}.txt")
+
+        with patch("src.common.storage.DELETE_OBJECTS_MAX_KEYS", 2):
+            deleted_count, bytes_freed = s3_client.delete_prefix_with_metrics(
+                prefix, max_workers=3
+            )
+
+        assert deleted_count == 7
+        assert bytes_freed == sum(range(1, 8))
+        assert s3_client.list_objects(prefix) == []
+
     def test_empty_prefix_delete_returns_zero(self, s3_client: S3Client) -> None:
         """Test that deleting non-existent prefix returns 0."""
         deleted_count = s3_client.delete_prefix("nonexistent/prefix/")
@@ -7,6 +7,7 @@ import pytest
 from googleapiclient.errors import HttpError
 
 from src.uploader.upload_client import (
+    MmapMediaFileUpload,
     YouTubeQuotaError,
     YouTubeUploadClient,
     YouTubeUploadError,
@@ -50,10 +51,64 @@ class TestYouTubeUploadClientInitialization:
         assert client.MAX_RETRIES == 5
 
 
+class TestMmapMediaFileUpload:
+    """Tests for the memory-mapped upload body."""
+
+    def test_serves_chunks_from_mmap(self, tmp_path):
+        """Test that chunks are returned as views over the file contents."""
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"0123456789")
+
+        media = MmapMediaFileUpload(
+            str(video_path), mimetype="video/*", chunksize=4, resumable=True
+        )
+
+        assert media.has_stream() is False
+        assert media.size() == 10
+        chunk = media.getbytes(0, 4)
+        assert isinstance(chunk, memoryview)
+        assert bytes(chunk) == b"0123"
+        # Short read at EOF
+        assert bytes(media.getbytes(8, 4)) == b"89"
+
+    def test_handles_empty_file(self, tmp_path):
+        """Test that empty files don't fail to map."""
+        video_path = tmp_path / "empty.mp4"
+        video_path.write_bytes(b"")
+
+        media = MmapMediaFileUpload(str(video_path), mimetype="video/*", resumable=True)
+
+        assert media.getbytes(0, 1024) == b""
+
+    def test_close_releases_mapping_and_file(self, tmp_path):
+        """Test that close() unmaps the file and closes its handle."""
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"0123456789")
+        media = MmapMediaFileUpload(str(video_path), mimetype="video/*", resumable=True)
+        mapping = media._mmap
+
+        media.close()
+
+        assert mapping.closed
+        assert media._fd.closed
+
+    def test_close_tolerates_referenced_chunk(self, tmp_path):
+        """Test that close() still closes the file while a chunk view is alive."""
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"0123456789")
+        media = MmapMediaFileUpload(str(video_path), mimetype="video/*", resumable=True)
+        chunk = media.getbytes(0, 4)
+
+        media.close()
+
+        assert media._fd.closed
+        assert bytes(chunk) == b"0123"
+
+
 class TestUploadVideo:
     """Tests for video upload."""
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_uploads_video_successfully(
         self,
         mock_media_class,
@@ -80,7 +135,7 @@ class TestUploadVideo:
         mock_youtube_service.videos().insert.assert_called_once()
         mock_insert_request.next_chunk.assert_called_once()
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_creates_correct_request_structure(
         self,
         mock_media_class,
@@ -112,7 +167,7 @@ class TestUploadVideo:
         assert body["snippet"]["defaultLanguage"] == "vi"
         assert body["status"]["privacyStatus"] == "public"
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_uses_resumable_upload(
         self,
         mock_media_class,
@@ -132,13 +187,31 @@ class TestUploadVideo:
         # Execute
         upload_client.upload_video("/fake/video.mp4", sample_metadata)
 
-        # Verify MediaFileUpload was called with resumable=True
+        # Verify MmapMediaFileUpload was called with resumable=True
         mock_media_class.assert_called_once()
         call_kwargs = mock_media_class.call_args[1]
         assert call_kwargs["resumable"] is True
         assert call_kwargs["chunksize"] == 10 * 1024 * 1024
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
+    def test_closes_media_when_upload_fails(
+        self,
+        mock_media_class,
+        upload_client,
+        mock_youtube_service,
+        sample_metadata,
+    ):
+        """Test that the mapped video is released even when the upload fails."""
+        mock_insert_request = MagicMock()
+        mock_insert_request.next_chunk.side_effect = RuntimeError("connection reset")
+        mock_youtube_service.videos().insert.return_value = mock_insert_request
+
+        with pytest.raises(YouTubeUploadError):
+            upload_client.upload_video("/fake/video.mp4", sample_metadata)
+
+        mock_media_class.return_value.close.assert_called_once()
+
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_logs_upload_progress(
         self,
         mock_media_class,
@@ -176,7 +249,7 @@ class TestUploadVideo:
 class TestUploadRetry:
     """Tests for upload retry logic."""
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     @patch("src.uploader.upload_client.time.sleep")
     def test_retries_on_500_error(
         self,
@@ -213,7 +286,7 @@ class TestUploadRetry:
         assert mock_insert_request.next_chunk.call_count == 2
         mock_sleep.assert_called_once()
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     @patch("src.uploader.upload_client.time.sleep")
     def test_retries_on_503_error(
         self,
@@ -246,7 +319,7 @@ class TestUploadRetry:
         # Verify retry happened
         assert mock_insert_request.next_chunk.call_count == 2
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     @patch("src.uploader.upload_client.time.sleep")
     def test_retries_on_rate_limit(
         self,
@@ -279,7 +352,7 @@ class TestUploadRetry:
         # Verify retry happened
         assert mock_insert_request.next_chunk.call_count == 2
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     @patch("src.uploader.upload_client.time.sleep")
     def test_exponential_backoff(
         self,
@@ -316,7 +389,7 @@ class TestUploadRetry:
         sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
         assert sleep_calls == [1, 2, 4]
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     @patch("src.uploader.upload_client.time.sleep")
     def test_fails_after_max_retries(
         self,
@@ -352,7 +425,7 @@ class TestUploadRetry:
 class TestQuotaHandling:
     """Tests for quota error handling."""
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_raises_quota_error_on_quota_exceeded(
         self,
         mock_media_class,
@@ -378,7 +451,7 @@ class TestQuotaHandling:
         with pytest.raises(YouTubeQuotaError, match="quota exceeded"):
             upload_client.upload_video("/fake/video.mp4", sample_metadata)
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_does_not_retry_quota_error(
         self,
         mock_media_class,
@@ -411,7 +484,7 @@ class TestQuotaHandling:
 class TestNonRetryableErrors:
     """Tests for non-retryable errors."""
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_does_not_retry_400_error(
         self,
         mock_media_class,
@@ -440,7 +513,7 @@ class TestNonRetryableErrors:
         # Should only try once (no retries)
         assert mock_insert_request.next_chunk.call_count == 1
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_raises_error_on_missing_video_id(
         self,
         mock_media_class,
@@ -538,7 +611,7 @@ class TestCheckQuotaAvailable:
 class TestRequestCreation:
     """Tests for request creation."""
 
-    @patch("src.uploader.upload_client.MediaFileUpload")
+    @patch("src.uploader.upload_client.MmapMediaFileUpload")
     def test_handles_missing_metadata_fields(
         self,
         mock_media_class,
@@ -83,10 +83,10 @@ class TestUploaderMainFlow:
     @patch("src.uploader.main.boto3.client")
     @patch("os.path.exists")
     @patch("os.path.getsize")
-    @patch("os.unlink")
+    @patch("src.uploader.main.shutil.rmtree")
     def test_full_upload_flow_with_local_video(
         self,
-        mock_unlink,
+        mock_rmtree,
         mock_getsize,
         mock_exists,
         mock_boto3_client,
@@ -162,6 +162,14 @@ class TestUploaderMainFlow:
             "jobs/test-job-123/panel_manifest.json"
         )
 
+        # 4b. Secrets batch-loaded alongside, and the YouTube OAuth tokens
+        # handed to the auth manager
+        mock_secrets_client.batch_get_secret_json.assert_called_once_with(["youtube-secret"])
+        mock_secrets_client.get_youtube_oauth_tokens.assert_called_once_with("youtube-secret")
+        assert mock_youtube_auth_class.call_args.kwargs["preloaded_tokens"] is (
+            mock_secrets_client.get_youtube_oauth_tokens.return_value
+        )
+
         # 5. YouTube authenticated
         mock_youtube_auth.get_authenticated_service.assert_called_once()
 
@@ -174,9 +182,9 @@ class TestUploaderMainFlow:
         assert "/tmp/render/test-job-123/video.mp4" in upload_call_args[0][0]
         assert upload_call_args[0][1] == mock_youtube_metadata
 
-        # 8. Job status updated to uploading
+        # 8. No intermediate "uploading" status write
         status_calls = mock_db_client.update_job_status.call_args_list
-        assert any(
+        assert not any(
             call[1]["status"] == JobStatus.uploading
             for call in status_calls
         )
@@ -186,6 +194,7 @@ class TestUploaderMainFlow:
             call[1]["status"] == JobStatus.completed
             for call in status_calls
         )
+        assert len(status_calls) == 1
         completed_call = [c for c in status_calls if c[1]["status"] == JobStatus.completed][0]
         assert completed_call[1]["youtube_url"] == "https://youtube.com/watch?v=test123"
         assert completed_call[1]["progress_pct"] == 100
@@ -196,8 +205,8 @@ class TestUploaderMainFlow:
         assert "manga-pipeline-cleanup" in invoke_args[1]["FunctionName"]
         assert invoke_args[1]["InvocationType"] == "Event"
 
-        # 11. Local file cleaned up
-        mock_unlink.assert_called()
+        # 11. Local scratch directory cleaned up
+        mock_rmtree.assert_called_once_with("/tmp/render/test-job-123", ignore_errors=True)
 
     @patch("src.uploader.main.get_settings")
     @patch("src.uploader.main.DynamoDBClient")
@@ -210,10 +219,10 @@ class TestUploaderMainFlow:
     @patch("os.path.exists")
     @patch("os.makedirs")
     @patch("os.path.getsize")
-    @patch("os.unlink")
+    @patch("src.uploader.main.shutil.rmtree")
     def test_downloads_video_from_s3_when_not_local(
         self,
-        mock_unlink,
+        mock_rmtree,
         mock_getsize,
         mock_makedirs,
         mock_exists,
@@ -294,6 +303,15 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="JOB_ID environment variable not set"):
             main()
 
+    @patch("src.uploader.main.wait_for_pending_persists")
+    @patch("src.uploader.main.get_settings")
+    def test_flushes_token_writes_on_failure(self, mock_get_settings, mock_wait_for_persists):
+        """Test that pending OAuth token writes are awaited even when the upload fails."""
+        with pytest.raises(ValueError):
+            main()
+
+        mock_wait_for_persists.assert_called_once()
+
     @patch("src.uploader.main.get_settings")
     @patch("src.uploader.main.DynamoDBClient")
     @patch("src.uploader.main.S3Client")
@@ -393,10 +411,10 @@ class TestErrorHandling:
     @patch("src.uploader.main.YouTubeUploadClient")
     @patch("os.path.exists")
     @patch("os.path.getsize")
-    @patch("os.unlink")
+    @patch("src.uploader.main.shutil.rmtree")
     def test_handles_quota_exceeded_error(
         self,
-        mock_unlink,
+        mock_rmtree,
         mock_getsize,
         mock_exists,
         mock_upload_client_class,
@@ -469,10 +487,10 @@ class TestErrorHandling:
     @patch("src.uploader.main.YouTubeUploadClient")
     @patch("os.path.exists")
     @patch("os.path.getsize")
-    @patch("os.unlink")
+    @patch("src.uploader.main.shutil.rmtree")
     def test_handles_upload_error(
         self,
-        mock_unlink,
+        mock_rmtree,
         mock_getsize,
         mock_exists,
         mock_upload_client_class,
@@ -547,10 +565,10 @@ class TestCleanupHandling:
     @patch("src.uploader.main.boto3.client")
     @patch("os.path.exists")
     @patch("os.path.getsize")
-    @patch("os.unlink")
+    @patch("src.uploader.main.shutil.rmtree")
     def test_handles_cleanup_lambda_failure_gracefully(
         self,
-        mock_unlink,
+        mock_rmtree,
         mock_getsize,
         mock_exists,
         mock_boto3_client,
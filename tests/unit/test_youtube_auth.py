@@ -1,12 +1,30 @@
 """Unit tests for YouTube OAuth2 token manager."""
 
-from datetime import datetime, timedelta, timezone
+import threading
+from datetime import UTC, datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
 
-from src.uploader.youtube_auth import YouTubeAuthError, YouTubeAuthManager
+from src.uploader.youtube_auth import (
+    CREDENTIALS_CACHE_SIZE,
+    YouTubeAuthError,
+    YouTubeAuthManager,
+    _build_service,
+    wait_for_pending_persists,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Reset the process-wide credentials and service caches between tests."""
+    YouTubeAuthManager._credentials_cache.clear()
+    _build_service.cache_clear()
+    yield
+    YouTubeAuthManager._credentials_cache.clear()
+    _build_service.cache_clear()
 
 
 @pytest.fixture
@@ -77,7 +95,13 @@ class TestGetAuthenticatedService:
             "youtube-oauth-secret"
         )
         mock_credentials_class.assert_called_once()
-        mock_build.assert_called_once_with("youtube", "v3", credentials=mock_credentials)
+        mock_build.assert_called_once_with(
+            "youtube",
+            "v3",
+            credentials=mock_credentials,
+            static_discovery=True,
+            cache_discovery=False,
+        )
 
     @patch("src.uploader.youtube_auth.build")
     @patch("src.uploader.youtube_auth.Credentials")
@@ -150,6 +174,7 @@ class TestGetAuthenticatedService:
         with patch("src.uploader.youtube_auth.build"):
             # Execute
             youtube_auth.get_authenticated_service()
+        wait_for_pending_persists()
 
         # Verify Secrets Manager update
         mock_secrets_client.update_secret_json.assert_called_once()
@@ -287,6 +312,261 @@ class TestGetAuthenticatedService:
             youtube_auth.get_authenticated_service()
 
 
+class TestPreloadedTokens:
+    """Tests for tokens preloaded by the caller."""
+
+    @patch("src.uploader.youtube_auth.build")
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_first_call_uses_preloaded_tokens(
+        self,
+        mock_credentials_class,
+        mock_build,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that preloaded tokens skip the Secrets Manager read."""
+        mock_credentials = MagicMock()
+        mock_credentials.valid = True
+        mock_credentials_class.return_value = mock_credentials
+
+        manager = YouTubeAuthManager(
+            mock_secrets_client, "youtube-oauth-secret", preloaded_tokens=valid_tokens
+        )
+        manager.get_authenticated_service()
+
+        mock_secrets_client.get_youtube_oauth_tokens.assert_not_called()
+        assert mock_credentials_class.call_args.kwargs["token"] == "test-access-token"
+
+
+class TestServiceCache:
+    """Tests for caching the authenticated service on the manager."""
+
+    @patch("src.uploader.youtube_auth.build")
+    def test_reuses_cached_service_while_token_fresh(
+        self,
+        mock_build,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that a second call returns the cached service without AWS/discovery work."""
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = {
+            **valid_tokens,
+            "token_expiry": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        }
+
+        first = youtube_auth.get_authenticated_service()
+        second = youtube_auth.get_authenticated_service()
+
+        assert first is second
+        mock_secrets_client.get_youtube_oauth_tokens.assert_called_once()
+        mock_build.assert_called_once()
+        assert youtube_auth._proactive_refresh is None
+
+    @patch.object(Credentials, "refresh")
+    @patch("src.uploader.youtube_auth.build")
+    def test_rebuilds_service_when_token_near_expiry(
+        self,
+        mock_build,
+        mock_refresh,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that the instance cache is bypassed when the token is about to expire."""
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = {
+            **valid_tokens,
+            "token_expiry": (datetime.now(UTC) + timedelta(seconds=30)).isoformat(),
+        }
+
+        youtube_auth.get_authenticated_service()
+        youtube_auth.get_authenticated_service()
+        wait_for_pending_persists()
+
+        # Tokens were re-read instead of trusting the instance cache
+        assert mock_secrets_client.get_youtube_oauth_tokens.call_count == 2
+
+    @patch("src.uploader.youtube_auth.build")
+    def test_reuses_cached_service_inside_google_auth_refresh_threshold(
+        self,
+        mock_build,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that the cache TTL, not google-auth's validity check, decides reuse."""
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = {
+            **valid_tokens,
+            "token_expiry": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        }
+        first = youtube_auth.get_authenticated_service()
+
+        # 100s left: google-auth already reports the token as invalid
+        youtube_auth._cached_credentials.expiry = (
+            datetime.now(UTC) + timedelta(seconds=100)
+        ).replace(tzinfo=None)
+        assert not youtube_auth._cached_credentials.valid
+
+        # The background refresh is covered separately; keep it off the network
+        with patch.object(youtube_auth, "_schedule_proactive_refresh"):
+            second = youtube_auth.get_authenticated_service()
+
+        assert first is second
+        mock_secrets_client.get_youtube_oauth_tokens.assert_called_once()
+
+    @patch("src.uploader.youtube_auth.build")
+    def test_refreshes_in_background_when_token_nearing_expiry(
+        self,
+        mock_build,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that a token inside the refresh window is refreshed off the call path."""
+        # Still valid to google-auth (more than 225s left), but inside the window
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = {
+            **valid_tokens,
+            "token_expiry": (datetime.now(UTC) + timedelta(seconds=270)).isoformat(),
+        }
+
+        def fake_refresh(credentials, request):
+            credentials.token = "new-access-token"
+            credentials.expiry = (datetime.now(UTC) + timedelta(hours=1)).replace(tzinfo=None)
+
+        with patch.object(
+            Credentials, "refresh", autospec=True, side_effect=fake_refresh
+        ) as mock_refresh:
+            first = youtube_auth.get_authenticated_service()
+            second = youtube_auth.get_authenticated_service()
+
+            assert youtube_auth._proactive_refresh is not None
+            wait_for_pending_persists()
+
+        # Cached service returned, credentials refreshed in place in the background
+        assert first is second
+        mock_build.assert_called_once()
+        mock_refresh.assert_called_once()
+        assert youtube_auth._cached_credentials.token == "new-access-token"
+        stored_tokens = mock_secrets_client.update_secret_json.call_args[0][1]
+        assert stored_tokens["access_token"] == "new-access-token"
+
+
+class TestSharedServiceCache:
+    """Tests for sharing built services across managers."""
+
+    @patch("src.uploader.youtube_auth.build")
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_new_manager_reuses_built_service(
+        self,
+        mock_credentials_class,
+        mock_build,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that a second manager for the same tokens skips build()."""
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
+
+        mock_credentials = MagicMock()
+        mock_credentials.valid = True
+        mock_credentials.token = "test-access-token"
+        mock_credentials_class.return_value = mock_credentials
+
+        first = YouTubeAuthManager(mock_secrets_client, "youtube-oauth-secret")
+        second = YouTubeAuthManager(mock_secrets_client, "youtube-oauth-secret")
+
+        assert first.get_authenticated_service() is second.get_authenticated_service()
+        mock_credentials_class.assert_called_once()
+        mock_build.assert_called_once()
+
+
+class TestRefreshLock:
+    """Tests for serializing concurrent token refreshes per secret."""
+
+    @pytest.fixture
+    def busy_lock(self, monkeypatch):
+        """Refresh lock that reports another caller is already refreshing."""
+        lock = MagicMock()
+        lock.acquire.return_value = False
+        monkeypatch.setitem(
+            YouTubeAuthManager._refresh_locks, "youtube-oauth-secret", lock
+        )
+        return lock
+
+    def test_lock_is_shared_per_secret(self):
+        """Test that managers for the same secret share one lock."""
+        lock_a = YouTubeAuthManager._get_refresh_lock("secret-a")
+        lock_b = YouTubeAuthManager._get_refresh_lock("secret-b")
+
+        assert YouTubeAuthManager._get_refresh_lock("secret-a") is lock_a
+        assert lock_a is not lock_b
+
+    @patch("src.uploader.youtube_auth.build")
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_waiter_reuses_token_refreshed_by_lock_holder(
+        self,
+        mock_credentials_class,
+        mock_build,
+        busy_lock,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that a caller waiting on the lock skips its own refresh."""
+        refreshed_tokens = {
+            **valid_tokens,
+            "access_token": "new-access-token",
+            "token_expiry": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        }
+        mock_secrets_client.get_youtube_oauth_tokens.side_effect = [
+            valid_tokens,
+            refreshed_tokens,
+        ]
+
+        expired_credentials = MagicMock()
+        expired_credentials.valid = False
+        expired_credentials.expired = True
+        expired_credentials.refresh_token = "test-refresh-token"
+        fresh_credentials = MagicMock()
+        fresh_credentials.valid = True
+        mock_credentials_class.side_effect = [expired_credentials, fresh_credentials]
+
+        youtube_auth.get_authenticated_service()
+
+        busy_lock.__enter__.assert_called_once()
+        mock_secrets_client.clear_cache.assert_called_once_with("youtube-oauth-secret")
+        expired_credentials.refresh.assert_not_called()
+        mock_secrets_client.update_secret_json.assert_not_called()
+        assert fresh_credentials.expiry.tzinfo is None
+        assert mock_build.call_args.kwargs["credentials"] is fresh_credentials
+
+    @patch("src.uploader.youtube_auth.Request")
+    @patch("src.uploader.youtube_auth.build")
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_waiter_refreshes_when_secret_unchanged(
+        self,
+        mock_credentials_class,
+        mock_build,
+        mock_request,
+        busy_lock,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that a waiter still refreshes if the lock holder stored nothing new."""
+        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
+
+        expired_credentials = MagicMock()
+        expired_credentials.valid = False
+        expired_credentials.expired = True
+        expired_credentials.refresh_token = "test-refresh-token"
+        expired_credentials.expiry = None
+        mock_credentials_class.return_value = expired_credentials
+
+        youtube_auth.get_authenticated_service()
+
+        expired_credentials.refresh.assert_called_once()
+
+
 class TestRefreshToken:
     """Tests for token refresh method."""
 
@@ -300,14 +580,13 @@ class TestRefreshToken:
     ):
         """Test successful token refresh."""
         # Setup
-        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
-
         mock_credentials = MagicMock()
         mock_credentials.token = "new-access-token"
         mock_credentials.expiry = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
         # Execute
-        result = youtube_auth.refresh_token(mock_credentials)
+        result = youtube_auth.refresh_token(mock_credentials, valid_tokens)
+        wait_for_pending_persists()
 
         # Verify
         assert result == mock_credentials
@@ -324,16 +603,16 @@ class TestRefreshToken:
     ):
         """Test that Secrets Manager is updated with new access token."""
         # Setup
-        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
-
         mock_credentials = MagicMock()
         mock_credentials.token = "brand-new-access-token"
         mock_credentials.expiry = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
 
         # Execute
-        youtube_auth.refresh_token(mock_credentials)
+        youtube_auth.refresh_token(mock_credentials, valid_tokens)
+        wait_for_pending_persists()
 
         # Verify
+        mock_secrets_client.get_youtube_oauth_tokens.assert_not_called()
         call_args = mock_secrets_client.update_secret_json.call_args
         assert call_args[0][0] == "youtube-oauth-secret"
 
@@ -341,6 +620,20 @@ class TestRefreshToken:
         assert updated_tokens["access_token"] == "brand-new-access-token"
         assert updated_tokens["token_expiry"] == "2025-01-15T12:00:00+00:00"
 
+    def test_reuses_auth_request_across_refreshes(self, youtube_auth, valid_tokens):
+        """Test that every refresh goes through the manager's shared transport."""
+        first = MagicMock()
+        first.expiry = None
+        second = MagicMock()
+        second.expiry = None
+
+        youtube_auth.refresh_token(first, dict(valid_tokens))
+        youtube_auth.refresh_token(second, dict(valid_tokens))
+        wait_for_pending_persists()
+
+        first.refresh.assert_called_once_with(youtube_auth._auth_request)
+        second.refresh.assert_called_once_with(youtube_auth._auth_request)
+
     @patch("src.uploader.youtube_auth.Request")
     def test_raises_error_on_refresh_error(
         self,
@@ -359,7 +652,7 @@ class TestRefreshToken:
         with pytest.raises(
             YouTubeAuthError, match="Failed to refresh access token"
         ):
-            youtube_auth.refresh_token(mock_credentials)
+            youtube_auth.refresh_token(mock_credentials, {})
 
     @patch("src.uploader.youtube_auth.Request")
     def test_handles_secrets_manager_update_failure(
@@ -368,10 +661,10 @@ class TestRefreshToken:
         youtube_auth,
         mock_secrets_client,
         valid_tokens,
+        caplog,
     ):
         """Test that token refresh succeeds even if Secrets Manager update fails."""
         # Setup
-        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
         mock_secrets_client.update_secret_json.side_effect = Exception(
             "Secrets Manager error"
         )
@@ -381,11 +674,46 @@ class TestRefreshToken:
         mock_credentials.expiry = None
 
         # Execute - should not raise exception
-        result = youtube_auth.refresh_token(mock_credentials)
+        result = youtube_auth.refresh_token(mock_credentials, valid_tokens)
+        wait_for_pending_persists()
 
         # Verify
         assert result == mock_credentials
         mock_credentials.refresh.assert_called_once()
+        assert "failed to persist to Secrets Manager" in caplog.text
+
+    @patch("src.uploader.youtube_auth.Request")
+    def test_returns_before_secrets_manager_write_finishes(
+        self,
+        mock_request_class,
+        youtube_auth,
+        mock_secrets_client,
+        valid_tokens,
+    ):
+        """Test that the Secrets Manager write does not block the caller."""
+        # Setup
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def slow_update(secret_name, tokens):
+            write_started.set()
+            release_write.wait(timeout=5)
+
+        mock_secrets_client.update_secret_json.side_effect = slow_update
+
+        mock_credentials = MagicMock()
+        mock_credentials.token = "new-access-token"
+        mock_credentials.expiry = None
+
+        # Execute
+        result = youtube_auth.refresh_token(mock_credentials, valid_tokens)
+
+        # Verify - returned while the write is still in flight
+        assert result == mock_credentials
+        assert write_started.wait(timeout=5)
+        release_write.set()
+        wait_for_pending_persists()
+        mock_secrets_client.update_secret_json.assert_called_once()
 
 
 class TestTokenSecurity:
@@ -436,14 +764,13 @@ class TestTokenSecurity:
     ):
         """Test that tokens are never logged during refresh."""
         # Setup
-        mock_secrets_client.get_youtube_oauth_tokens.return_value = valid_tokens
-
         mock_credentials = MagicMock()
         mock_credentials.token = "super-secret-new-token"
         mock_credentials.expiry = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
         # Execute
-        youtube_auth.refresh_token(mock_credentials)
+        youtube_auth.refresh_token(mock_credentials, valid_tokens)
+        wait_for_pending_persists()
 
         # Verify - check that no tokens appear in logs
         log_output = caplog.text
@@ -487,6 +814,60 @@ class TestCredentialsBuilding:
             scopes=["https://www.googleapis.com/auth/youtube.upload"],
         )
 
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_reuses_credentials_when_tokens_unchanged(
+        self,
+        mock_credentials_class,
+        youtube_auth,
+        valid_tokens,
+    ):
+        """Test that unchanged tokens reuse the cached credentials object."""
+        mock_credentials = MagicMock()
+        mock_credentials.token = "test-access-token"
+        mock_credentials_class.return_value = mock_credentials
+
+        first = youtube_auth._get_credentials(valid_tokens)
+        second = youtube_auth._get_credentials(dict(valid_tokens))
+
+        assert first is second
+        mock_credentials_class.assert_called_once()
+
+    @patch("src.uploader.youtube_auth.Credentials")
+    def test_rebuilds_credentials_when_access_token_changes(
+        self,
+        mock_credentials_class,
+        youtube_auth,
+        valid_tokens,
+    ):
+        """Test that a new stored access token produces new credentials."""
+        mock_credentials = MagicMock()
+        mock_credentials.token = "test-access-token"
+        mock_credentials_class.return_value = mock_credentials
+
+        youtube_auth._get_credentials(valid_tokens)
+        youtube_auth._get_credentials({**valid_tokens, "access_token": "rotated-token"})
+
+        assert mock_credentials_class.call_count == 2
+
+    def test_credentials_cache_evicts_least_recently_used(self, youtube_auth, valid_tokens):
+        """Test that the process-wide credentials cache stays bounded."""
+        first = youtube_auth._get_credentials(valid_tokens)
+        for i in range(CREDENTIALS_CACHE_SIZE):
+            youtube_auth._get_credentials({**valid_tokens, "refresh_token": f"other-{i}"})
+
+        cache = YouTubeAuthManager._credentials_cache
+        assert len(cache) == CREDENTIALS_CACHE_SIZE
+        assert first not in cache.values()
+
+    def test_sets_expiry_from_stored_token_expiry(self, valid_tokens):
+        """Test that the stored token_expiry becomes a naive UTC credentials expiry."""
+        tokens = {**valid_tokens, "token_expiry": "2025-01-15T19:00:00+07:00"}
+
+        credentials = YouTubeAuthManager._build_credentials(tokens)
+
+        assert credentials.expiry == datetime(2025, 1, 15, 12, 0, 0)
+        assert credentials.expired
+
     @patch("src.uploader.youtube_auth.build")
     @patch("src.uploader.youtube_auth.Credentials")
     def test_builds_youtube_service_with_v3_api(
@@ -513,4 +894,10 @@ class TestCredentialsBuilding:
 
         # Verify
         assert service == mock_service
-        mock_build.assert_called_once_with("youtube", "v3", credentials=mock_credentials)
+        mock_build.assert_called_once_with(
+            "youtube",
+            "v3",
+            credentials=mock_credentials,
+            static_discovery=True,
+            cache_discovery=False,
+        )